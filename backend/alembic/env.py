@@ -11,7 +11,8 @@ from app.infrastructure.database.models import Base
 config = context.config
 
 
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+if "connection" not in config.attributes:
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -61,6 +62,14 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # INFO: Callers like the query plan tests pass their own connection in config.attributes
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
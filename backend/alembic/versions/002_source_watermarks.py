@@ -0,0 +1,36 @@
+"""source_watermarks
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create source_watermarks table
+    op.create_table(
+        "source_watermarks",
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("query", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=False),
+        sa.Column("last_posted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("source", "query", "location"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("source_watermarks")
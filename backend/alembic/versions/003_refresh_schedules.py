@@ -0,0 +1,37 @@
+"""refresh_schedules
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 09:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create refresh_schedules table
+    op.create_table(
+        "refresh_schedules",
+        sa.Column("query", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=False),
+        sa.Column("interval_seconds", sa.Integer(), nullable=False),
+        sa.Column("next_run_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_new_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("query", "location"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("refresh_schedules")
@@ -0,0 +1,41 @@
+"""question_bank
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 12:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create question_bank table
+    op.create_table(
+        "question_bank",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.Column("difficulty", sa.String(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("job_family_embedding", JSONB, nullable=True),
+        sa.Column("times_served", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_question_bank_topic_difficulty", "question_bank", ["topic", "difficulty"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_question_bank_topic_difficulty", table_name="question_bank")
+    op.drop_table("question_bank")
@@ -0,0 +1,46 @@
+"""gap_analyses
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 14:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create gap_analyses table
+    op.create_table(
+        "gap_analyses",
+        sa.Column("resume_id", sa.String(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("version", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("result", JSONB, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("resume_id", "job_id", "version"),
+    )
+    op.create_index("ix_gap_analyses_user_id", "gap_analyses", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gap_analyses_user_id", table_name="gap_analyses")
+    op.drop_table("gap_analyses")
@@ -0,0 +1,60 @@
+"""match_lists
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 16:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create resume_vectors table
+    op.create_table(
+        "resume_vectors",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("resume_id", sa.String(), nullable=False),
+        sa.Column("embedding", JSONB, nullable=False),
+        sa.Column("skills", JSONB, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # Create resume_job_matches table
+    op.create_table(
+        "resume_job_matches",
+        sa.Column("resume_id", sa.String(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("similarity_score", sa.Float(), nullable=False),
+        sa.Column("skill_match_score", sa.Float(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("resume_id", "job_id"),
+    )
+    op.create_index(
+        "ix_resume_job_matches_resume_score", "resume_job_matches", ["resume_id", "score"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_job_matches_resume_score", table_name="resume_job_matches")
+    op.drop_table("resume_job_matches")
+    op.drop_table("resume_vectors")
@@ -0,0 +1,44 @@
+"""access_path_indexes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Latest resume per user: WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1
+    op.create_index("ix_resumes_user_id_uploaded_at", "resumes", ["user_id", "uploaded_at"])
+
+    # Job listing pages: ORDER BY fetched_at DESC LIMIT ? OFFSET ?
+    op.create_index("ix_jobs_fetched_at", "jobs", ["fetched_at"])
+
+    # Skill containment lookups: extracted_skills @> '{"required": [...]}'
+    op.create_index(
+        "ix_jobs_extracted_skills",
+        "jobs",
+        ["extracted_skills"],
+        postgresql_using="gin",
+        postgresql_ops={"extracted_skills": "jsonb_path_ops"},
+    )
+
+    # Resume matrix deltas: WHERE updated_at > ?
+    op.create_index("ix_resume_vectors_updated_at", "resume_vectors", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_vectors_updated_at", table_name="resume_vectors")
+    op.drop_index("ix_jobs_extracted_skills", table_name="jobs")
+    op.drop_index("ix_jobs_fetched_at", table_name="jobs")
+    op.drop_index("ix_resumes_user_id_uploaded_at", table_name="resumes")
@@ -0,0 +1,31 @@
+"""interview_session_version
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 19:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Optimistic concurrency for interview sessions cached by several API workers
+    op.add_column(
+        "interview_sessions",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("interview_sessions", "version")
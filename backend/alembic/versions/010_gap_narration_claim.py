@@ -0,0 +1,31 @@
+"""gap_narration_claim
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Set when a worker queues the LLM narrative, so repeat requests do not queue it again
+    op.add_column(
+        "gap_analyses",
+        sa.Column("narration_claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("gap_analyses", "narration_claimed_at")
@@ -0,0 +1,38 @@
+"""job_updated_at
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bumped on every job write, lexical indexes catch up with: WHERE updated_at > ?
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_jobs_updated_at", "jobs", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_updated_at", table_name="jobs")
+    op.drop_column("jobs", "updated_at")
@@ -1,4 +1,5 @@
-from datetime import datetime
+import math
+from datetime import datetime, timezone
 from typing import Any
 
 import httpx
@@ -12,10 +13,11 @@ logger = get_logger(__name__)
 class AdzunaAdapter(JobSourcePort):
     BASE_URL = "https://api.adzuna.com/v1/api/jobs"
 
-    def __init__(self, app_id: str, api_key: str, country: str = "ca"):
+    def __init__(self, app_id: str, api_key: str, country: str = "ca", timeout: float = 30.0):
         self.app_id = app_id
         self.api_key = api_key
         self.country = country
+        self.timeout = timeout
         logger.info("adzuna_adapter_initialized", country=country)
 
     def fetch_jobs(
@@ -23,15 +25,23 @@ class AdzunaAdapter(JobSourcePort):
         query: str = "software engineer",
         location: str | None = None,
         limit: int = 50,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        logger.info("fetching_adzuna_jobs", query=query, location=location, limit=limit)
+        logger.info(
+            "fetching_adzuna_jobs",
+            query=query,
+            location=location,
+            limit=limit,
+            since=since.isoformat() if since else None,
+        )
 
         url = f"{self.BASE_URL}/{self.country}/search/1"
-        params = self._build_params(query, location, limit)
+        params = self._build_params(query, location, limit, since)
 
         try:
             response = self._make_request(url, params)
             jobs = self._parse_response(response)
+            jobs = self._filter_since(jobs, since)
             logger.info("adzuna_jobs_fetched", count=len(jobs))
             return jobs
         except Exception as e:
@@ -41,7 +51,9 @@ class AdzunaAdapter(JobSourcePort):
     def get_source_name(self) -> str:
         return "adzuna"
 
-    def _build_params(self, query: str, location: str | None, limit: int) -> dict[str, Any]:
+    def _build_params(
+        self, query: str, location: str | None, limit: int, since: datetime | None = None
+    ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "app_id": self.app_id,
             "app_key": self.api_key,
@@ -53,10 +65,33 @@ class AdzunaAdapter(JobSourcePort):
         if location:
             params["where"] = location
 
+        if since:
+            # INFO: Adzuna filters in whole days, exact cutoff is applied after parsing
+            params["max_days_old"] = self._days_since(since)
+            params["sort_by"] = "date"
+
         return params
 
+    def _days_since(self, since: datetime) -> int:
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        elapsed = datetime.now(timezone.utc) - since
+        return max(1, math.ceil(elapsed.total_seconds() / 86400))
+
+    def _filter_since(
+        self, jobs: list[dict[str, Any]], since: datetime | None
+    ) -> list[dict[str, Any]]:
+        if since is None:
+            return jobs
+
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        return [job for job in jobs if job["posted_at"] is None or job["posted_at"] >= since]
+
     def _make_request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
-        with httpx.Client(timeout=30.0) as client:
+        with httpx.Client(timeout=self.timeout) as client:
             response = client.get(url, params=params)
             response.raise_for_status()
             return response.json()
@@ -116,5 +151,7 @@ class AdzunaAdapter(JobSourcePort):
             return None
 
 
-def create_adzuna_adapter(app_id: str, api_key: str, country: str = "ca") -> AdzunaAdapter:
-    return AdzunaAdapter(app_id=app_id, api_key=api_key, country=country)
+def create_adzuna_adapter(
+    app_id: str, api_key: str, country: str = "ca", timeout: float = 30.0
+) -> AdzunaAdapter:
+    return AdzunaAdapter(app_id=app_id, api_key=api_key, country=country, timeout=timeout)
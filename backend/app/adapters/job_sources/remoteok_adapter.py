@@ -1,5 +1,7 @@
 import re
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 from html import unescape
 from typing import Any
 
@@ -13,8 +15,14 @@ logger = get_logger(__name__)
 
 class RemoteOKAdapter(JobSourcePort):
     BASE_URL: str = "https://remoteok.com/api"
-
-    def __init__(self):
+    FEED_TTL_SECONDS: float = 300.0
+
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        # INFO: RemoteOK serves one feed for every query, share it across a refresh run
+        self._feed: list[dict[str, Any]] | None = None
+        self._feed_fetched_at = 0.0
+        self._feed_lock = threading.Lock()
         logger.info("remoteok_adapter_initialized")
 
     def fetch_jobs(
@@ -22,12 +30,18 @@ class RemoteOKAdapter(JobSourcePort):
         query: str = "software engineer",
         location: str | None = None,
         limit: int = 50,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        logger.info("fetching_remoteok_jobs", query=query, limit=limit)
+        logger.info(
+            "fetching_remoteok_jobs",
+            query=query,
+            limit=limit,
+            since=since.isoformat() if since else None,
+        )
 
         try:
-            response = self._make_request()
-            jobs = self._parse_and_filter_response(response, query, limit)
+            response = self._get_feed()
+            jobs = self._parse_and_filter_response(response, query, limit, since)
             logger.info("remoteok_jobs_fetched", count=len(jobs))
             return jobs
         except Exception as e:
@@ -37,10 +51,21 @@ class RemoteOKAdapter(JobSourcePort):
     def get_source_name(self) -> str:
         return "remoteok"
 
+    def _get_feed(self) -> list[dict[str, Any]]:
+        with self._feed_lock:
+            age = time.monotonic() - self._feed_fetched_at
+            if self._feed is not None and age < self.FEED_TTL_SECONDS:
+                logger.debug("remoteok_feed_cache_hit", age_seconds=round(age, 1))
+                return self._feed
+
+            self._feed = self._make_request()
+            self._feed_fetched_at = time.monotonic()
+            return self._feed
+
     def _make_request(self) -> list[dict[str, Any]]:
         headers = {"User-Agent": "SkillGap/1.0 (job aggregator)"}
 
-        with httpx.Client(timeout=30.0) as client:
+        with httpx.Client(timeout=self.timeout) as client:
             response = client.get(self.BASE_URL, headers=headers)
             response.raise_for_status()
             data = response.json()
@@ -51,12 +76,21 @@ class RemoteOKAdapter(JobSourcePort):
         return []
 
     def _parse_and_filter_response(
-        self, jobs_data: list[dict[str, Any]], query: str, limit: int
+        self,
+        jobs_data: list[dict[str, Any]],
+        query: str,
+        limit: int,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
         jobs = []
         query_lower = query.lower()
+        min_epoch = since.timestamp() if since else None
 
         for item in jobs_data:
+            # INFO: Cheap epoch check first so already-seen postings skip the text scan
+            if min_epoch is not None and self._is_older_than(item, min_epoch):
+                continue
+
             if self._matches_query(item, query_lower):
                 job = self._normalize_job(item)
                 jobs.append(job)
@@ -65,6 +99,16 @@ class RemoteOKAdapter(JobSourcePort):
                     break
         return jobs
 
+    def _is_older_than(self, item: dict[str, Any], min_epoch: float) -> bool:
+        epoch = item.get("epoch")
+        if not epoch:
+            return False
+
+        try:
+            return float(epoch) < min_epoch
+        except (TypeError, ValueError):
+            return False
+
     def _matches_query(self, item: dict[str, Any], query: str) -> bool:
         title = item.get("position", "").lower()
         tags = " ".join(item.get("tags", [])).lower()
@@ -136,11 +180,11 @@ class RemoteOKAdapter(JobSourcePort):
             return None
 
         try:
-            return datetime.fromtimestamp(epoch)
+            return datetime.fromtimestamp(epoch, tz=timezone.utc)
         except (ValueError, TypeError, OSError):
             logger.warning("epoch_parse_failed", epoch=epoch)
             return None
 
 
-def create_remoteok_adapter() -> RemoteOKAdapter:
-    return RemoteOKAdapter()
+def create_remoteok_adapter(timeout: float = 30.0) -> RemoteOKAdapter:
+    return RemoteOKAdapter(timeout=timeout)
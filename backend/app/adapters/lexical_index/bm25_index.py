@@ -0,0 +1,313 @@
+import re
+import threading
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.domain.model.job import Job, JobSearchFilters, location_terms
+from app.domain.ports.lexical_index_port import LexicalIndexPort
+from app.domain.ports.repositories import JobRepository
+from app.domain.services.ranking import top_k_indices
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# INFO: Keeps tokens like c++, c#, node.js and asp.net in one piece
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class BM25Index(LexicalIndexPort):
+    """
+    In-process BM25 inverted index over job title, description and extracted
+    skills. Title and skill terms count title_weight / skill_weight times.
+
+    Postings are appended as jobs are indexed; re-indexing a job tombstones
+    its previous document, and tombstones are compacted away once they
+    outnumber live documents. Queries keep only their max_query_terms
+    rarest terms and drop terms present in more than max_df_ratio of jobs:
+    common terms cost the most postings and barely change the ranking.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: float = 2.0,
+        skill_weight: float = 2.0,
+        max_df_ratio: float = 0.5,
+        max_query_terms: int = 16,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.skill_weight = skill_weight
+        self.max_df_ratio = max_df_ratio
+        self.max_query_terms = max_query_terms
+
+        self._doc_ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._lengths = np.zeros(1024, dtype=np.float32)
+        self._alive = np.zeros(1024, dtype=bool)
+        self._total_length = 0.0
+        # INFO: Filter attributes per document, NaN where the job does not state one
+        self._salaries = np.full(1024, np.nan, dtype=np.float32)
+        self._posted = np.full(1024, np.nan, dtype=np.float64)
+        self._facets: dict[tuple[str, str], array] = {}
+
+        self._postings: dict[str, tuple[array, array]] = {}
+        # INFO: Weights depend on corpus statistics, so any indexing clears them all
+        self._weights: dict[str, tuple[np.ndarray, np.ndarray] | None] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def index_jobs(self, jobs: list[Job]) -> None:
+        with self._lock:
+            for job in jobs:
+                self._index(job)
+            self._weights = {}
+
+            if len(self._doc_ids) - len(self._positions) > max(len(self._positions), 1024):
+                self._compact()
+
+    def search(
+        self, text: str, top_k: int = 50, filters: JobSearchFilters | None = None
+    ) -> list[tuple[str, float]]:
+        with self._lock:
+            if not self._positions:
+                return []
+
+            docs, weights = self._score_postings(self._query_terms(text))
+            if docs.size == 0:
+                return []
+
+            scores = np.bincount(docs, weights=weights, minlength=len(self._doc_ids))
+            # INFO: Only jobs holding a query term score, rank those instead of the whole index
+            candidates = np.flatnonzero(scores > 0)
+
+            mask = self._filter_mask(filters)
+            if mask is not None:
+                candidates = candidates[mask[candidates]]
+
+            return [
+                (self._doc_ids[doc], float(scores[doc]))
+                for doc in candidates[top_k_indices(scores[candidates], top_k)]
+            ]
+
+    def _index(self, job: Job) -> None:
+        previous = self._positions.get(job.id)
+        if previous is not None:
+            self._alive[previous] = False
+            self._total_length -= float(self._lengths[previous])
+
+        frequencies: Counter[str] = Counter()
+        for token in tokenize(job.title):
+            frequencies[token] += self.title_weight
+        for token in tokenize(job.description):
+            frequencies[token] += 1.0
+        skills = [*(job.required_skills or []), *(job.nice_to_have_skills or [])]
+        for token in tokenize(" ".join([*skills, *(job.tech_stack or [])])):
+            frequencies[token] += self.skill_weight
+
+        doc = len(self._doc_ids)
+        self._ensure_capacity(doc + 1)
+        self._doc_ids.append(job.id)
+        self._positions[job.id] = doc
+        self._lengths[doc] = sum(frequencies.values())
+        self._alive[doc] = True
+        self._total_length += float(self._lengths[doc])
+
+        salary = job.salary_ceiling()
+        self._salaries[doc] = np.nan if salary is None else salary
+        posted_at = job.posted_at or job.fetched_at
+        self._posted[doc] = np.nan if posted_at is None else posted_at.timestamp()
+
+        for facet in self._job_facets(job):
+            self._facets.setdefault(facet, array("i")).append(doc)
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("i"), array("f"))
+            postings[0].append(doc)
+            postings[1].append(frequency)
+
+    def _job_facets(self, job: Job) -> list[tuple[str, str]]:
+        facets = [("source", job.source)]
+        if job.seniority_level:
+            facets.append(("seniority", job.seniority_level.lower()))
+        facets.extend(("location", term) for term in location_terms(job.location))
+        return facets
+
+    def _filter_mask(self, filters: JobSearchFilters | None) -> np.ndarray | None:
+        """Bitmap of live documents passing every filter, None when nothing is filtered."""
+        if filters is None or filters.is_empty():
+            return None
+
+        count = len(self._doc_ids)
+        mask = self._alive[:count].copy()
+
+        for field, values in (
+            ("source", filters.sources),
+            ("seniority", [level.lower() for level in filters.seniority_levels]),
+            ("location", filters.location_terms()),
+        ):
+            if values:
+                matching = np.zeros(count, dtype=bool)
+                for value in values:
+                    matching[self._facet_docs((field, value))] = True
+                mask &= matching
+
+        if filters.min_salary is not None:
+            mask &= self._salaries[:count] >= filters.min_salary
+
+        posted_after = filters.posted_after(datetime.now(timezone.utc))
+        if posted_after is not None:
+            mask &= self._posted[:count] >= posted_after.timestamp()
+
+        return mask
+
+    def _facet_docs(self, facet: tuple[str, str]) -> np.ndarray:
+        return np.array(self._facets.get(facet, ()), dtype=np.int32)
+
+    def _query_terms(self, text: str) -> list[str]:
+        postings = self._postings
+        terms = postings.keys() & set(tokenize(text))
+        if len(terms) <= self.max_query_terms:
+            return list(terms)
+
+        # INFO: Posting counts include tombstones, close enough to pick the rarest terms
+        counted = sorted([(len(postings[term][0]), term) for term in terms])
+        return [term for _, term in counted[: self.max_query_terms]]
+
+    def _score_postings(self, terms: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        uncached = [term for term in terms if term not in self._weights]
+        if uncached:
+            self._compute_weights(uncached)
+
+        weighted = [self._weights[term] for term in terms]
+        weighted = [entry for entry in weighted if entry is not None]
+
+        if not weighted:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+        return (
+            np.concatenate([docs for docs, _ in weighted]),
+            np.concatenate([weights for _, weights in weighted]),
+        )
+
+    def _compute_weights(self, terms: list[str]) -> None:
+        """
+        Cache the BM25 weight of each term in every live job containing it, or
+        None if the term is skipped. All terms are weighted in one pass, so a
+        query's new terms cost a handful of array operations in total, not each.
+        """
+        postings = [self._postings[term] for term in terms]
+        # INFO: One copy of every term's postings, joined through the buffer protocol
+        docs = np.frombuffer(b"".join(term_docs for term_docs, _ in postings), dtype=np.int32)
+        frequencies = np.frombuffer(
+            b"".join(term_frequencies for _, term_frequencies in postings), dtype=np.float32
+        )
+        segments = np.repeat(np.arange(len(terms)), [len(term_docs) for term_docs, _ in postings])
+
+        keep = self._alive[docs]
+        docs, frequencies, segments = docs[keep], frequencies[keep], segments[keep]
+
+        live = len(self._positions)
+        df = np.bincount(segments, minlength=len(terms))
+        idf = np.log(1.0 + (live - df + 0.5) / (df + 0.5)).astype(np.float32)
+        average_length = self._total_length / live
+        norm = frequencies + self.k1 * (
+            1.0 - self.b + self.b * self._lengths[docs] / average_length
+        )
+
+        # INFO: Cached as intp / float64, the types bincount works in, so queries skip the casts
+        docs = docs.astype(np.intp)
+        weights = (idf[segments] * frequencies * (self.k1 + 1.0) / norm).astype(np.float64)
+        max_df = max(1, int(self.max_df_ratio * live))
+
+        start = 0
+        for term, term_df in zip(terms, df.tolist(), strict=True):
+            end = start + term_df
+            skipped = term_df == 0 or (term_df > max_df and live > 1)
+            self._weights[term] = None if skipped else (docs[start:end], weights[start:end])
+            start = end
+
+    def _term_arrays(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        docs, frequencies = self._postings[term]
+        return np.array(docs, dtype=np.int32), np.array(frequencies, dtype=np.float32)
+
+    def _ensure_capacity(self, size: int) -> None:
+        if size <= self._lengths.shape[0]:
+            return
+
+        capacity = max(size, 2 * self._lengths.shape[0])
+        self._lengths = _grown(self._lengths, capacity, 0.0)
+        self._alive = _grown(self._alive, capacity, False)
+        self._salaries = _grown(self._salaries, capacity, np.nan)
+        self._posted = _grown(self._posted, capacity, np.nan)
+
+    def _compact(self) -> None:
+        """Drop tombstoned documents and renumber the live ones."""
+        count = len(self._doc_ids)
+        alive = self._alive[:count]
+        renumbered = np.cumsum(alive, dtype=np.int64) - 1
+
+        postings: dict[str, tuple[array, array]] = {}
+        for term in self._postings:
+            docs, frequencies = self._term_arrays(term)
+            keep = alive[docs]
+            if keep.any():
+                postings[term] = (
+                    array("i", renumbered[docs[keep]].astype(np.int32).tobytes()),
+                    array("f", frequencies[keep].tobytes()),
+                )
+
+        facets: dict[tuple[str, str], array] = {}
+        for facet in self._facets:
+            docs = self._facet_docs(facet)
+            docs = docs[alive[docs]]
+            if docs.size:
+                facets[facet] = array("i", renumbered[docs].astype(np.int32).tobytes())
+
+        self._doc_ids = [doc_id for doc_id, live in zip(self._doc_ids, alive, strict=True) if live]
+        self._positions = {doc_id: doc for doc, doc_id in enumerate(self._doc_ids)}
+
+        capacity = max(len(self._doc_ids), 1024)
+        self._lengths = _grown(self._lengths[:count][alive], capacity, 0.0)
+        self._alive = _grown(np.ones(len(self._doc_ids), dtype=bool), capacity, False)
+        self._salaries = _grown(self._salaries[:count][alive], capacity, np.nan)
+        self._posted = _grown(self._posted[:count][alive], capacity, np.nan)
+        self._postings = postings
+        self._facets = facets
+        self._weights = {}
+
+        logger.info("lexical_index_compacted", jobs=len(self._doc_ids), dropped=count - len(self))
+
+
+def _grown(values: np.ndarray, capacity: int, fill: float | bool) -> np.ndarray:
+    grown = np.full(capacity, fill, dtype=values.dtype)
+    grown[: values.shape[0]] = values
+    return grown
+
+
+def create_bm25_index(job_repository: JobRepository, batch_size: int = 1000) -> BM25Index:
+    """Build an index over every stored job, reading them batch_size at a time."""
+    index = BM25Index()
+    offset = 0
+
+    while True:
+        jobs = job_repository.find_all(limit=batch_size, offset=offset)
+        index.index_jobs(jobs)
+        offset += len(jobs)
+        if len(jobs) < batch_size:
+            break
+
+    logger.info("lexical_index_built", jobs=len(index))
+    return index
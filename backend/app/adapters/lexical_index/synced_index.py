@@ -0,0 +1,130 @@
+import threading
+import time
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.adapters.lexical_index.bm25_index import create_bm25_index
+from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from app.domain.model.job import Job, JobSearchFilters
+from app.domain.ports.lexical_index_port import LexicalIndexPort
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SyncedLexicalIndex(LexicalIndexPort):
+    """
+    Lexical index decorator that catches up on jobs written by other processes.
+
+    Writes made in this process are indexed as they happen. Before a search,
+    once ttl_seconds have passed or the catalog version moved, jobs whose
+    updated_at is past the last catch-up are read from the database and
+    re-indexed, so every API worker and the ingest worker converge on the
+    same catalog without a rebuild. Each catch-up re-reads overlap_seconds
+    before its watermark, covering clock skew between hosts and writes that
+    committed after the previous catch-up read past them.
+    """
+
+    def __init__(
+        self,
+        index: LexicalIndexPort,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        synced_through: datetime,
+        ttl_seconds: float = 60.0,
+        catalog_version: Callable[[], int] | None = None,
+        batch_size: int = 1000,
+        overlap_seconds: float = 30.0,
+    ) -> None:
+        self.index = index
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.catalog_version = catalog_version
+        self.batch_size = batch_size
+        self.overlap = timedelta(seconds=overlap_seconds)
+
+        self._synced_through = synced_through
+        self._synced_at = time.monotonic()
+        self._synced_version = catalog_version() if catalog_version else None
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def index_jobs(self, jobs: list[Job]) -> None:
+        self.index.index_jobs(jobs)
+
+    def search(
+        self, text: str, top_k: int = 50, filters: JobSearchFilters | None = None
+    ) -> list[tuple[str, float]]:
+        self.catch_up()
+        return self.index.search(text, top_k=top_k, filters=filters)
+
+    def catch_up(self, force: bool = False) -> int:
+        """Index jobs changed since the last catch-up if one is due; returns how many."""
+        # INFO: A search never waits on another thread's catch-up, it serves the current index
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            version = self.catalog_version() if self.catalog_version else None
+            expired = time.monotonic() - self._synced_at >= self.ttl_seconds
+            if not (force or expired or version != self._synced_version):
+                return 0
+
+            started = datetime.now(timezone.utc)
+            count = self._index_updated_after(self._synced_through - self.overlap)
+
+            self._synced_through = started
+            self._synced_at = time.monotonic()
+            self._synced_version = version
+        except Exception as e:
+            # INFO: Searches keep serving the index as it is, the next search retries
+            logger.warning("lexical_index_catch_up_failed", error=str(e), exc_info=True)
+            return 0
+        finally:
+            self._sync_lock.release()
+
+        if count:
+            logger.info("lexical_index_caught_up", jobs=count, total=len(self.index))
+        return count
+
+    def _index_updated_after(self, updated_after: datetime) -> int:
+        count = 0
+
+        with self.session_factory() as db:
+            repository = SQLAlchemyJobRepository(session=db)
+
+            while True:
+                jobs = repository.find_updated_after(
+                    updated_after, limit=self.batch_size, offset=count
+                )
+                self.index.index_jobs(jobs)
+                count += len(jobs)
+                if len(jobs) < self.batch_size:
+                    return count
+
+
+def create_synced_lexical_index(
+    session_factory: Callable[[], AbstractContextManager[Session]],
+    ttl_seconds: float = 60.0,
+    catalog_version: Callable[[], int] | None = None,
+    batch_size: int = 1000,
+) -> SyncedLexicalIndex:
+    """Build a BM25 index over every stored job and keep it caught up from the database."""
+    # INFO: Taken before the build reads a row, the first catch-up covers writes made during it
+    started = datetime.now(timezone.utc)
+
+    with session_factory() as db:
+        index = create_bm25_index(SQLAlchemyJobRepository(session=db), batch_size=batch_size)
+
+    return SyncedLexicalIndex(
+        index=index,
+        session_factory=session_factory,
+        synced_through=started,
+        ttl_seconds=ttl_seconds,
+        catalog_version=catalog_version,
+        batch_size=batch_size,
+    )
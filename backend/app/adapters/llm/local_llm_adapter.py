@@ -23,8 +23,12 @@ class LocalLLMAdapter(LLMPort):
     def __init__(self, endpoint: str, timeout: int = 60):
         self.endpoint = endpoint.rstrip("/")
         self.timeout = timeout
+        self._client = httpx.Client(timeout=timeout)
         logger.info("local_llm_adapter_initialized", endpoint=self.endpoint)
 
+    def close(self) -> None:
+        self._client.close()
+
     def extract_skills_from_resume(self, resume_text: str) -> SkillExtractionResult:
         logger.info("extracting_skills_from_resume", text_length=len(resume_text))
 
@@ -87,6 +91,27 @@ class LocalLLMAdapter(LLMPort):
             logger.error("gap_analysis_failed", error=str(e), exc_info=True)
             raise
 
+    def write_gap_narrative(
+        self,
+        job_description: str,
+        matching_skills: list[str],
+        missing_skills: list[str],
+    ) -> tuple[str, list[str]]:
+        logger.info("writing_gap_narrative", missing_count=len(missing_skills))
+
+        prompt = self._build_gap_narrative_prompt(job_description, matching_skills, missing_skills)
+
+        try:
+            response_text = self._generate(prompt, max_tokens=500)
+            data = json.loads(self._extract_json(response_text))
+            return str(data.get("summary", "")), list(data.get("recommendations", []))
+        except json.JSONDecodeError as e:
+            logger.error("json_parse_failed", response=response_text[:200])
+            raise LLMParseError(f"Failed to parse gap narrative JSON: {e}") from e
+        except Exception as e:
+            logger.error("gap_narrative_failed", error=str(e), exc_info=True)
+            raise
+
     def generate_interview_question(
         self,
         job_description: str,
@@ -109,6 +134,26 @@ class LocalLLMAdapter(LLMPort):
             logger.error("interview_question_generation_faiuled", error=str(e), exc_info=True)
             raise
 
+    def generate_interview_question_set(
+        self,
+        job_description: str,
+        topics: list[tuple[str, str]],
+    ) -> list[str]:
+        logger.info("generating_interview_question_set", count=len(topics))
+
+        prompt = self._build_interview_question_set_prompt(job_description, topics)
+
+        try:
+            response_text = self._generate(
+                prompt, temperature=0.7, max_tokens=150 * max(len(topics), 1)
+            )
+            questions = self._parse_question_set_response(response_text)[: len(topics)]
+            logger.info("interview_question_set_generated", count=len(questions))
+            return questions
+        except Exception as e:
+            logger.error("interview_question_set_generation_failed", error=str(e), exc_info=True)
+            raise
+
     def evaluate_interview_answer(
         self,
         question: str,
@@ -139,11 +184,10 @@ class LocalLLMAdapter(LLMPort):
         }
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data["text"]
+            response = self._client.post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            return data["text"]
         except httpx.TimeoutException as e:
             logger.error("llm_timeout", url=url, timeout=self.timeout)
             raise LLMTimeoutError(f"LLM service timed out after {self.timeout}s") from e
@@ -222,6 +266,29 @@ class LocalLLMAdapter(LLMPort):
 
         JSON:"""
 
+    def _build_gap_narrative_prompt(
+        self,
+        job_description: str,
+        matching_skills: list[str],
+        missing_skills: list[str],
+    ) -> str:
+        return f"""A candidate was compared against this job. Write a short summary of
+        the fit and concrete recommendations. Return ONLY valid JSON.
+
+        Matching Skills: {', '.join(matching_skills[:30]) or 'None'}
+        Missing Skills: {', '.join(missing_skills[:30]) or 'None'}
+
+        Job Description:
+        {job_description[:1000]}
+
+        Return JSON in this exact format:
+        {{
+            "summary": "2-3 sentence summary of the fit",
+            "recommendations": ["recommendation1", "recommendation2"]
+        }}
+
+        JSON:"""
+
     def _build_interview_question_prompt(
         self,
         job_description: str,
@@ -249,6 +316,33 @@ class LocalLLMAdapter(LLMPort):
 
         Question:"""
 
+    def _build_interview_question_set_prompt(
+        self,
+        job_description: str,
+        topics: list[tuple[str, str]],
+    ) -> str:
+        topic_lines = "\n".join(
+            f"{i}. Topic: {topic} (Difficulty: {difficulty})"
+            for i, (topic, difficulty) in enumerate(topics, 1)
+        )
+
+        return f"""Generate technical interview questions for this job. Return ONLY valid
+        JSON with no additional text.
+
+        Job Description:
+        {job_description[:1000]}
+
+        Write exactly one question per line below, in the same order. Make each
+        question specific and technical, and do not repeat questions.
+        {topic_lines}
+
+        Return JSON in this exact format:
+        {{
+            "questions": ["First question text", "Second question text"]
+        }}
+
+        JSON:"""
+
     def _build_answer_evaluation_prompt(self, question: str, answer: str, topic: str) -> str:
         return f"""Evaluate this interview answer. Return ONLY valid JSON with no
         additional text.
@@ -332,10 +426,21 @@ class LocalLLMAdapter(LLMPort):
             logger.error("json_parse_failed", response=response[:200])
             raise LLMParseError(f"Failed to parse gap analysis JSON: {e}") from e
 
+    def _parse_question_set_response(self, response: str) -> list[str]:
+        try:
+            json_str = self._extract_json(response)
+            data = json.loads(json_str)
+
+            return [str(q).strip() for q in data.get("questions", []) if str(q).strip()]
+        except json.JSONDecodeError as e:
+            logger.error("json_parse_failed", response=response[:200])
+            raise LLMParseError(f"Failed to parse question set JSON: {e}") from e
+
     def _extract_json(self, text: str) -> str:
         """Extract JSON object from text that might contain extra content."""
         start = text.find("{")
-        end = text.find("}") + 1
+        # INFO: Last brace, so nested objects and braces inside strings survive
+        end = text.rfind("}") + 1
 
         if start == -1 or end == 0:
             raise LLMParseError("No JSON object found in response")
@@ -0,0 +1,111 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from app.adapters.repositories.job_repository import JobModelMapper
+from app.domain.model.job import Job, JobSummary
+from app.domain.ports.repositories import AsyncJobRepository
+from app.infrastructure.database.models import JobModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncSQLAlchemyJobRepository(JobModelMapper, AsyncJobRepository):
+    """
+    AsyncSession implementation of AsyncJobRepository.
+
+    Writes made here bypass IndexedJobRepository, so lexical indexes only
+    learn about them when they next catch up from the database.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def save(self, job: Job) -> Job:
+        logger.info("saving_job", job_id=job.id, source=job.source)
+
+        existing = await self._find_model_by_id(job.id)
+
+        try:
+            if existing:
+                self._update_model(existing, job)
+            else:
+                self.session.add(self._create_model(job))
+
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        logger.info("job_saved", job_id=job.id)
+        return job
+
+    async def bulk_save(self, jobs: list[Job]) -> list[Job]:
+        logger.info("bulk_saving_jobs", count=len(jobs))
+
+        hashes = [self._compute_dedup_hash(job) for job in jobs]
+        # INFO: One round trip for every hash instead of one existence check per job
+        seen = await self.find_existing_dedup_hashes(hashes)
+        saved_jobs: list[Job] = []
+
+        for job, dedup_hash in zip(jobs, hashes, strict=True):
+            if dedup_hash in seen:
+                logger.debug("duplicate_job_skipped", dedup_hash=dedup_hash, title=job.title)
+                continue
+
+            seen.add(dedup_hash)
+            self.session.add(self._create_model_with_hash(job, dedup_hash))
+            saved_jobs.append(job)
+
+        await self.session.commit()
+        logger.info(
+            "bulk_save_complete", saved=len(saved_jobs), duplicates=len(jobs) - len(saved_jobs)
+        )
+        return saved_jobs
+
+    async def find_by_id(self, job_id: str) -> Job | None:
+        model = await self._find_model_by_id(job_id)
+        return self._to_domain(model) if model else None
+
+    async def find_by_ids(self, job_ids: list[str]) -> list[Job]:
+        if not job_ids:
+            return []
+
+        models = await self.session.scalars(select(JobModel).where(JobModel.id.in_(job_ids)))
+        jobs_by_id = {str(model.id): self._to_domain(model) for model in models}
+        return [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+
+    async def find_summaries_by_ids(self, job_ids: list[str]) -> list[JobSummary]:
+        if not job_ids:
+            return []
+
+        models = await self.session.scalars(
+            select(JobModel).options(defer(JobModel.description)).where(JobModel.id.in_(job_ids))
+        )
+        summaries = {str(model.id): JobSummary(**self._summary_fields(model)) for model in models}
+        return [summaries[job_id] for job_id in job_ids if job_id in summaries]
+
+    async def find_all(self, limit: int = 100, offset: int = 0) -> list[Job]:
+        models = await self.session.scalars(
+            select(JobModel).order_by(JobModel.fetched_at.desc()).limit(limit).offset(offset)
+        )
+        return [self._to_domain(model) for model in models]
+
+    async def exists_by_dedup_hash(self, dedup_hash: str) -> bool:
+        job_id = await self.session.scalar(
+            select(JobModel.id).where(JobModel.dedup_hash == dedup_hash).limit(1)
+        )
+        return job_id is not None
+
+    async def find_existing_dedup_hashes(self, dedup_hashes: list[str]) -> set[str]:
+        if not dedup_hashes:
+            return set()
+
+        rows = await self.session.scalars(
+            select(JobModel.dedup_hash).where(JobModel.dedup_hash.in_(dedup_hashes))
+        )
+        return {str(dedup_hash) for dedup_hash in rows}
+
+    async def _find_model_by_id(self, job_id: str) -> JobModel | None:
+        return await self.session.get(JobModel, job_id)
@@ -0,0 +1,55 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repositories.resume_repository import ResumeModelMapper
+from app.domain.model.resume import Resume, ResumeSummary
+from app.domain.ports.repositories import AsyncResumeRepository
+from app.infrastructure.database.models import ResumeModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncSQLAlchemyResumeRepository(ResumeModelMapper, AsyncResumeRepository):
+    """AsyncSession implementation of AsyncResumeRepository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def save(self, resume: Resume) -> Resume:
+        logger.info("saving_resume", resume_id=resume.id, user_id=resume.user_id)
+
+        existing = await self.session.get(ResumeModel, resume.id)
+
+        if existing:
+            self._update_model(existing, resume)
+        else:
+            self.session.add(self._new_model(resume))
+
+        await self.session.commit()
+        logger.info("resume_saved", resume_id=resume.id)
+        return resume
+
+    async def find_by_id(self, resume_id: str) -> Resume | None:
+        model = await self.session.get(ResumeModel, resume_id)
+        return self._to_domain(model) if model else None
+
+    async def find_by_user_id(self, user_id: str) -> Resume | None:
+        model = await self.session.scalar(self._latest_for_user(user_id))
+        return self._to_domain(model) if model else None
+
+    async def find_summary_by_user_id(
+        self, user_id: str, preview_length: int = 500
+    ) -> ResumeSummary | None:
+        result = await self.session.execute(self._summary_for_user(user_id, preview_length))
+        row = result.first()
+        return self._to_summary(row) if row else None
+
+    async def delete(self, resume_id: str) -> bool:
+        model = await self.session.get(ResumeModel, resume_id)
+        if not model:
+            return False
+
+        await self.session.delete(model)
+        await self.session.commit()
+        logger.info("resume_deleted", resume_id=resume_id)
+        return True
@@ -0,0 +1,90 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.domain.ports.llm_port import GapAnalysisResult, SkillGap
+from app.domain.ports.repositories import GapAnalysisRepository
+from app.infrastructure.database.models import GapAnalysisModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SQLAlchemyGapAnalysisRepository(GapAnalysisRepository):
+    """SQLAlchemy implementation of GapAnalysisRepository."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def find(self, resume_id: str, job_id: str, version: str) -> GapAnalysisResult | None:
+        model = self.session.get(GapAnalysisModel, (resume_id, job_id, version))
+        return self._to_domain(model) if model else None
+
+    def save(
+        self,
+        user_id: str,
+        resume_id: str,
+        job_id: str,
+        version: str,
+        result: GapAnalysisResult,
+    ) -> None:
+        self.session.merge(
+            GapAnalysisModel(
+                resume_id=resume_id,
+                job_id=job_id,
+                version=version,
+                user_id=user_id,
+                result=asdict(result),
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        self.session.commit()
+        logger.debug("gap_analysis_saved", resume_id=resume_id, job_id=job_id, version=version)
+
+    def claim_narration(
+        self, resume_id: str, job_id: str, version: str, lease_seconds: int
+    ) -> bool:
+        now = datetime.now(timezone.utc)
+        # INFO: Conditional UPDATE, only one of several concurrent requests gets the row
+        claimed = (
+            self.session.query(GapAnalysisModel)
+            .filter(
+                GapAnalysisModel.resume_id == resume_id,
+                GapAnalysisModel.job_id == job_id,
+                GapAnalysisModel.version == version,
+                or_(
+                    GapAnalysisModel.narration_claimed_at.is_(None),
+                    GapAnalysisModel.narration_claimed_at < now - timedelta(seconds=lease_seconds),
+                ),
+            )
+            .update({GapAnalysisModel.narration_claimed_at: now}, synchronize_session=False)
+        )
+        self.session.commit()
+        return bool(claimed)
+
+    def delete_by_user_id(self, user_id: str) -> int:
+        deleted = (
+            self.session.query(GapAnalysisModel)
+            .filter(GapAnalysisModel.user_id == user_id)
+            .delete(synchronize_session=False)
+        )
+        self.session.commit()
+
+        if deleted:
+            logger.info("gap_analyses_invalidated", user_id=user_id, count=deleted)
+
+        return deleted
+
+    def _to_domain(self, model: GapAnalysisModel) -> GapAnalysisResult:
+        data = dict(model.result or {})  # type: ignore[call-overload]
+
+        return GapAnalysisResult(
+            matching_skills=data.get("matching_skills", []),
+            missing_skills=[SkillGap(**gap) for gap in data.get("missing_skills", [])],
+            overall_match_score=float(data.get("overall_match_score", 0.0)),
+            summary=data.get("summary", ""),
+            recommendations=data.get("recommendations", []),
+            narrated=bool(data.get("narrated", True)),
+        )
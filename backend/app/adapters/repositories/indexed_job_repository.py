@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from app.domain.model.job import Job, JobSummary
+from app.domain.ports.lexical_index_port import LexicalIndexPort
+from app.domain.ports.repositories import JobRepository
+
+
+class IndexedJobRepository(JobRepository):
+    """JobRepository decorator that keeps a lexical index in step with every write."""
+
+    def __init__(self, repository: JobRepository, lexical_index: LexicalIndexPort) -> None:
+        self.repository = repository
+        self.lexical_index = lexical_index
+
+    def save(self, job: Job) -> Job:
+        saved = self.repository.save(job)
+        self.lexical_index.index_jobs([saved])
+        return saved
+
+    def bulk_save(self, jobs: list[Job]) -> list[Job]:
+        # INFO: Only newly stored jobs are indexed, skipped duplicates are already in
+        saved = self.repository.bulk_save(jobs)
+        self.lexical_index.index_jobs(saved)
+        return saved
+
+    def find_by_id(self, job_id: str) -> Job | None:
+        return self.repository.find_by_id(job_id)
+
+    def find_by_ids(self, job_ids: list[str]) -> list[Job]:
+        return self.repository.find_by_ids(job_ids)
+
+    def find_summaries_by_ids(self, job_ids: list[str]) -> list[JobSummary]:
+        return self.repository.find_summaries_by_ids(job_ids)
+
+    def find_all(self, limit: int = 100, offset: int = 0) -> list[Job]:
+        return self.repository.find_all(limit=limit, offset=offset)
+
+    def find_updated_after(
+        self, updated_after: datetime, limit: int = 1000, offset: int = 0
+    ) -> list[Job]:
+        return self.repository.find_updated_after(updated_after, limit=limit, offset=offset)
+
+    def exists_by_dedup_hash(self, dedup_hash: str) -> bool:
+        return self.repository.exists_by_dedup_hash(dedup_hash)
+
+    def find_existing_dedup_hashes(self, dedup_hashes: list[str]) -> set[str]:
+        return self.repository.find_existing_dedup_hashes(dedup_hashes)
@@ -0,0 +1,183 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.domain.model.ingest import IngestStage, IngestTask, IngestTaskStatus
+from app.domain.ports.repositories import IngestTaskRepository
+from app.infrastructure.database.models import IngestTaskModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SQLAlchemyIngestTaskRepository(IngestTaskRepository):
+    """Postgres-backed ingest queue using SELECT ... FOR UPDATE SKIP LOCKED."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def enqueue(
+        self,
+        job_ids: list[str],
+        stage: IngestStage,
+        payloads: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        if not job_ids:
+            return
+
+        self._add_tasks(job_ids, stage, payloads or {})
+        self.session.commit()
+        logger.info("ingest_tasks_enqueued", stage=stage.value, count=len(job_ids))
+
+    def claim_batch(
+        self, stage: IngestStage, limit: int, lease_seconds: int, max_attempts: int
+    ) -> list[IngestTask]:
+        now = datetime.now(timezone.utc)
+        lease_expired = and_(
+            IngestTaskModel.stage == stage.value,
+            IngestTaskModel.status == IngestTaskStatus.RUNNING.value,
+            IngestTaskModel.locked_at < now - timedelta(seconds=lease_seconds),
+        )
+
+        # INFO: A task whose worker died on every attempt would otherwise be handed out forever
+        exhausted = (
+            self.session.query(IngestTaskModel)
+            .filter(lease_expired, IngestTaskModel.attempts >= max_attempts)
+            .update(
+                {
+                    IngestTaskModel.status: IngestTaskStatus.FAILED.value,
+                    IngestTaskModel.locked_at: None,
+                    IngestTaskModel.last_error: f"Lease expired on attempt {max_attempts}",
+                    IngestTaskModel.updated_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+
+        models = (
+            self.session.query(IngestTaskModel)
+            .filter(
+                IngestTaskModel.stage == stage.value,
+                or_(
+                    and_(
+                        IngestTaskModel.status == IngestTaskStatus.PENDING.value,
+                        IngestTaskModel.available_at <= now,
+                    ),
+                    and_(lease_expired, IngestTaskModel.attempts < max_attempts),
+                ),
+            )
+            .order_by(IngestTaskModel.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        for model in models:
+            setattr(model, "status", IngestTaskStatus.RUNNING.value)
+            setattr(model, "locked_at", now)
+            setattr(model, "attempts", (model.attempts or 0) + 1)
+            setattr(model, "updated_at", now)
+
+        self.session.commit()
+
+        if exhausted:
+            logger.error("ingest_tasks_lease_exhausted", stage=stage.value, count=exhausted)
+        if models:
+            logger.info("ingest_tasks_claimed", stage=stage.value, count=len(models))
+
+        return [self._to_domain(model) for model in models]
+
+    def complete(self, task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+
+        self._mark_done(task_ids)
+        self.session.commit()
+
+    def advance(
+        self,
+        task_ids: list[str],
+        job_ids: list[str],
+        stage: IngestStage,
+        payloads: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self._add_tasks(job_ids, stage, payloads or {})
+        self._mark_done(task_ids)
+        self.session.commit()
+
+        if job_ids:
+            logger.info("ingest_tasks_enqueued", stage=stage.value, count=len(job_ids))
+
+    def retry(self, task_id: str, error: str, available_at: datetime) -> None:
+        self._release(task_id, IngestTaskStatus.PENDING, error, available_at)
+
+    def fail(self, task_id: str, error: str) -> None:
+        self._release(task_id, IngestTaskStatus.FAILED, error)
+        logger.error("ingest_task_failed_permanently", task_id=task_id, error=error)
+
+    def _add_tasks(
+        self, job_ids: list[str], stage: IngestStage, payloads: dict[str, dict[str, Any]]
+    ) -> None:
+        now = datetime.now(timezone.utc)
+
+        for job_id in job_ids:
+            self.session.add(
+                IngestTaskModel(
+                    id=str(uuid.uuid4()),
+                    job_id=job_id,
+                    stage=stage.value,
+                    status=IngestTaskStatus.PENDING.value,
+                    attempts=0,
+                    payload=payloads.get(job_id),
+                    available_at=now,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+
+    def _mark_done(self, task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+
+        self.session.query(IngestTaskModel).filter(IngestTaskModel.id.in_(task_ids)).update(
+            {
+                IngestTaskModel.status: IngestTaskStatus.DONE.value,
+                IngestTaskModel.locked_at: None,
+                IngestTaskModel.payload: None,
+                IngestTaskModel.updated_at: datetime.now(timezone.utc),
+            },
+            synchronize_session=False,
+        )
+
+    def _release(
+        self,
+        task_id: str,
+        status: IngestTaskStatus,
+        error: str,
+        available_at: datetime | None = None,
+    ) -> None:
+        values: dict[Any, Any] = {
+            IngestTaskModel.status: status.value,
+            IngestTaskModel.locked_at: None,
+            IngestTaskModel.last_error: error[:2000],
+            IngestTaskModel.updated_at: datetime.now(timezone.utc),
+        }
+        if available_at is not None:
+            values[IngestTaskModel.available_at] = available_at
+
+        self.session.query(IngestTaskModel).filter(IngestTaskModel.id == task_id).update(
+            values, synchronize_session=False
+        )
+        self.session.commit()
+
+    def _to_domain(self, model: IngestTaskModel) -> IngestTask:
+        return IngestTask(
+            id=str(model.id),
+            job_id=str(model.job_id),
+            stage=IngestStage(model.stage),
+            attempts=int(model.attempts or 0),  # type: ignore[arg-type]
+            payload=model.payload,  # type: ignore[arg-type]
+        )
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.domain.model.interview import InterviewSession
+from app.domain.ports.repositories import InterviewSessionRepository
+from app.infrastructure.database.models import InterviewSessionModel, InterviewState
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_STATUS_TO_STATE = {
+    "in_progress": InterviewState.IN_PROGRESS,
+    "completed": InterviewState.COMPLETED,
+    "error": InterviewState.ABANDONED,
+}
+
+
+class SQLAlchemyInterviewSessionRepository(InterviewSessionRepository):
+    """SQLAlchemy implementation of InterviewSessionRepository."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def find_by_id(self, session_id: str) -> InterviewSession | None:
+        model = (
+            self.session.query(InterviewSessionModel)
+            .filter(InterviewSessionModel.id == session_id)
+            .first()
+        )
+        return self._to_domain(model) if model else None
+
+    def find_version(self, session_id: str) -> int | None:
+        return (
+            self.session.query(InterviewSessionModel.version)
+            .filter(InterviewSessionModel.id == session_id)
+            .scalar()
+        )
+
+    def insert(self, interview: InterviewSession) -> None:
+        self.session.add(
+            InterviewSessionModel(
+                id=interview.id,
+                user_id=interview.user_id,
+                job_id=interview.job_id,
+                created_at=interview.created_at,
+                version=1,
+                **self._to_values(interview),
+            )
+        )
+        self.session.commit()
+        interview.version = 1
+
+    def save_all(self, sessions: list[InterviewSession]) -> list[str]:
+        if not sessions:
+            return []
+
+        applied: list[InterviewSession] = []
+        conflicts: list[str] = []
+
+        for interview in sessions:
+            updated = (
+                self.session.query(InterviewSessionModel)
+                .filter(
+                    InterviewSessionModel.id == interview.id,
+                    InterviewSessionModel.version == interview.version,
+                )
+                .update(
+                    {**self._to_values(interview), "version": InterviewSessionModel.version + 1},
+                    synchronize_session=False,
+                )
+            )
+            if updated:
+                applied.append(interview)
+            else:
+                conflicts.append(interview.id)
+
+        self.session.commit()
+
+        for interview in applied:
+            interview.version += 1
+
+        logger.debug("interview_sessions_saved", count=len(applied), conflicts=len(conflicts))
+        return conflicts
+
+    def _to_values(self, interview: InterviewSession) -> dict[str, Any]:
+        return {
+            "state": _STATUS_TO_STATE.get(interview.state.get("status", ""), InterviewState.DRAFT),
+            "conversation_history": interview.state,
+            "overall_score": interview.overall_score,
+            "feedback": interview.final_feedback,
+            "completed_at": interview.completed_at,
+        }
+
+    def _to_domain(self, model: InterviewSessionModel) -> InterviewSession:
+        return InterviewSession(
+            id=str(model.id),
+            user_id=str(model.user_id),
+            job_id=str(model.job_id),
+            state=dict(model.conversation_history or {}),
+            created_at=model.created_at,  # type: ignore[arg-type]
+            completed_at=(model.completed_at if isinstance(model.completed_at, datetime) else None),
+            version=int(model.version),  # type: ignore[arg-type]
+        )
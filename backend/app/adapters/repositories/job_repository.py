@@ -1,9 +1,9 @@
-import hashlib
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
-from app.domain.model.job import Job
+from app.domain.model.job import Job, JobSummary
 from app.domain.ports.repositories import JobRepository
 from app.infrastructure.database.models import JobModel, JobSource
 from app.infrastructure.logging import get_logger
@@ -11,7 +11,85 @@ from app.infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 
-class SQLAlchemyJobRepository(JobRepository):
+class JobModelMapper:
+    """Conversions between Job and JobModel, shared by the sync and async repositories."""
+
+    def _create_model(self, job: Job) -> JobModel:
+        dedup_hash = self._compute_dedup_hash(job)
+        return self._create_model_with_hash(job, dedup_hash)
+
+    def _create_model_with_hash(self, job: Job, dedup_hash: str) -> JobModel:
+        model = JobModel(
+            id=job.id,
+            external_id=job.external_id,
+            source=JobSource(job.source),
+            dedup_hash=dedup_hash,
+            title=job.title,
+            company=job.company,
+            description=job.description,
+            url=job.url,
+            location=job.location,
+            salary=job.salary,
+            posted_at=job.posted_at,
+            fetched_at=job.fetched_at or datetime.now(timezone.utc),
+            pinecone_id=job.pinecone_id,
+            extracted_skills=self._build_skills_json(job),
+        )
+        return model
+
+    def _update_model(self, model: JobModel, job: Job) -> None:
+        """Update existing JobModel from domain object."""
+        setattr(model, "title", job.title)
+        setattr(model, "company", job.company)
+        setattr(model, "description", job.description)
+        setattr(model, "url", job.url)
+        setattr(model, "location", job.location)
+        setattr(model, "salary", job.salary)
+        setattr(model, "posted_at", job.posted_at)
+        setattr(model, "fetched_at", job.fetched_at or datetime.now(timezone.utc))
+        setattr(model, "extracted_skills", self._build_skills_json(job))
+
+    def _compute_dedup_hash(self, job: Job) -> str:
+        return job.dedup_hash()
+
+    def _build_skills_json(self, job: Job) -> dict | None:
+        if not job.has_extracted_skills():
+            return None
+
+        return {
+            "required": job.required_skills or [],
+            "nice_to_have": job.nice_to_have_skills or [],
+            "tech_stack": job.tech_stack or [],
+            "seniority_level": job.seniority_level,
+        }
+
+    def _to_domain(self, model: JobModel) -> Job:
+        return Job(**self._summary_fields(model), description=str(model.description))
+
+    def _summary_fields(self, model: JobModel) -> dict[str, Any]:
+        skills = model.extracted_skills or {}
+
+        return {
+            "id": str(model.id),
+            "external_id": str(model.external_id),
+            "source": str(model.source.value),
+            "title": str(model.title),
+            "company": str(model.company),
+            "url": str(model.url),
+            "pinecone_id": str(model.pinecone_id),
+            # INFO: str() of a NULL column is "None", keep missing values as None
+            "location": model.location or None,
+            "salary": model.salary or None,
+            "posted_at": model.posted_at if isinstance(model.posted_at, datetime) else None,
+            "fetched_at": model.fetched_at if isinstance(model.fetched_at, datetime) else None,
+            "required_skills": skills.get("required"),
+            "nice_to_have_skills": skills.get("nice_to_have"),
+            "tech_stack": skills.get("tech_stack"),
+            "seniority_level": skills.get("seniority_level"),
+        }
+
+
+class SQLAlchemyJobRepository(JobModelMapper, JobRepository):
     """SQLAlchemy implementaion of JobRepository."""
 
     def __init__(self, session: Session):
@@ -22,12 +100,17 @@ class SQLAlchemyJobRepository(JobRepository):
 
         existing = self._find_model_by_id(job.id)
 
-        if existing:
-            self._update_model(existing, job)
-        else:
-            self._create_model(job)
+        try:
+            if existing:
+                self._update_model(existing, job)
+            else:
+                self.session.add(self._create_model(job))
+
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
 
-        self.session.commit()
         logger.info("job_saved", job_id=job.id)
         return job
 
@@ -57,6 +140,27 @@ class SQLAlchemyJobRepository(JobRepository):
         model = self._find_model_by_id(job_id)
         return self._to_domain(model) if model else None
 
+    def find_by_ids(self, job_ids: list[str]) -> list[Job]:
+        if not job_ids:
+            return []
+
+        models = self.session.query(JobModel).filter(JobModel.id.in_(job_ids)).all()
+        jobs_by_id = {str(model.id): self._to_domain(model) for model in models}
+        return [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+
+    def find_summaries_by_ids(self, job_ids: list[str]) -> list[JobSummary]:
+        if not job_ids:
+            return []
+
+        models = (
+            self.session.query(JobModel)
+            .options(defer(JobModel.description))
+            .filter(JobModel.id.in_(job_ids))
+            .all()
+        )
+        summaries = {str(model.id): JobSummary(**self._summary_fields(model)) for model in models}
+        return [summaries[job_id] for job_id in job_ids if job_id in summaries]
+
     def find_all(self, limit: int = 100, offset: int = 0) -> list[Job]:
         models = (
             self.session.query(JobModel)
@@ -67,82 +171,34 @@ class SQLAlchemyJobRepository(JobRepository):
         )
         return [self._to_domain(model) for model in models]
 
+    def find_updated_after(
+        self, updated_after: datetime, limit: int = 1000, offset: int = 0
+    ) -> list[Job]:
+        models = (
+            self.session.query(JobModel)
+            .filter(JobModel.updated_at > updated_after)
+            .order_by(JobModel.updated_at, JobModel.id)
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+        return [self._to_domain(model) for model in models]
+
     def exists_by_dedup_hash(self, dedup_hash: str) -> bool:
         return (
-            self.session.query(JobModel).filter(JobModel.dedup_hash == dedup_hash).first()
+            self.session.query(JobModel.id).filter(JobModel.dedup_hash == dedup_hash).first()
         ) is not None
 
-    def _find_model_by_id(self, job_id: str) -> JobModel:
-        return self.session.query(JobModel).filter(JobModel.id == job_id).first()
-
-    def _create_model(self, job: Job) -> JobModel:
-        dedup_hash = self._compute_dedup_hash(job)
-        return self._create_model_with_hash(job, dedup_hash)
+    def find_existing_dedup_hashes(self, dedup_hashes: list[str]) -> set[str]:
+        if not dedup_hashes:
+            return set()
 
-    def _create_model_with_hash(self, job: Job, dedup_hash: str) -> JobModel:
-        model = JobModel(
-            id=job.id,
-            external_id=job.external_id,
-            source=JobSource(job.source),
-            dedup_hash=dedup_hash,
-            title=job.title,
-            company=job.company,
-            description=job.description,
-            url=job.url,
-            location=job.location,
-            salary=job.salary,
-            posted_at=job.posted_at,
-            fetched_at=job.fetched_at or datetime.now(timezone.utc),
-            pinecone_id=job.pinecone_id,
-            extracted_skills=self._build_skills_json(job),
+        rows = (
+            self.session.query(JobModel.dedup_hash)
+            .filter(JobModel.dedup_hash.in_(dedup_hashes))
+            .all()
         )
-        return model
-
-    def _update_model(self, model: JobModel, job: Job) -> None:
-        """Update existing JobModel from domain object."""
-        setattr(model, "title", job.title)
-        setattr(model, "company", job.company)
-        setattr(model, "description", job.description)
-        setattr(model, "url", job.url)
-        setattr(model, "location", job.location)
-        setattr(model, "salary", job.salary)
-        setattr(model, "posted_at", job.posted_at)
-        setattr(model, "fetched_at", job.fetched_at or datetime.now(timezone.utc))
-        setattr(model, "extracted_skills", self._build_skills_json(job))
-
-    def _compute_dedup_hash(self, job: Job) -> str:
-        normalized = f"{job.title.lower()}|{job.company.lower()}|{(job.location or '').lower()}"
-        return hashlib.sha256(normalized.encode()).hexdigest()
-
-    def _build_skills_json(self, job: Job) -> dict | None:
-        if not job.has_extracted_skills():
-            return None
-
-        return {
-            "required": job.required_skills or [],
-            "nice_to_have": job.nice_to_have_skills or [],
-            "tech_stack": job.tech_stack or [],
-            "seniority_level": job.seniority_level,
-        }
-
-    def _to_domain(self, model: JobModel) -> Job:
-        skills = model.extracted_skills or {}
+        return {str(row[0]) for row in rows}
 
-        return Job(
-            id=str(model.id),
-            external_id=str(model.external_id),
-            source=str(model.source.value),
-            title=str(model.title),
-            company=str(model.company),
-            description=str(model.description),
-            url=str(model.url),
-            pinecone_id=str(model.pinecone_id),
-            location=str(model.location) if str(model.location) else None,
-            salary=str(model.salary) if str(model.salary) else None,
-            posted_at=(model.posted_at if isinstance(model.posted_at, datetime) else None),
-            fetched_at=(model.fetched_at if isinstance(model.fetched_at, datetime) else None),
-            required_skills=skills.get("required"),
-            nice_to_have_skills=skills.get("nice_to_have"),
-            tech_stack=skills.get("tech_stack"),
-            seniority_level=skills.get("seniority_level"),
-        )
+    def _find_model_by_id(self, job_id: str) -> JobModel:
+        return self.session.query(JobModel).filter(JobModel.id == job_id).first()
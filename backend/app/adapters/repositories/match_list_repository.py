@@ -0,0 +1,151 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.domain.model.search import MaterializedMatch, ResumeVector
+from app.domain.ports.repositories import MatchListRepository
+from app.infrastructure.database.models import ResumeJobMatchModel, ResumeModel, ResumeVectorModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SQLAlchemyMatchListRepository(MatchListRepository):
+    """SQLAlchemy implementation of MatchListRepository."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def save_resume_vector(self, vector: ResumeVector) -> None:
+        self.session.merge(
+            ResumeVectorModel(
+                user_id=vector.user_id,
+                resume_id=vector.resume_id,
+                embedding=vector.embedding,
+                skills=vector.skills,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        self.session.commit()
+
+    def find_resume_vectors(self, updated_after: datetime | None = None) -> list[ResumeVector]:
+        query = self.session.query(ResumeVectorModel)
+        if updated_after is not None:
+            query = query.filter(ResumeVectorModel.updated_at > updated_after)
+        return [self._to_vector(model) for model in query.all()]
+
+    def iter_resume_vectors(self, batch_size: int = 1000) -> Iterator[ResumeVector]:
+        for model in self.session.query(ResumeVectorModel).yield_per(batch_size):
+            yield self._to_vector(model)
+
+    def replace_matches(
+        self, user_id: str, resume_id: str, matches: list[MaterializedMatch]
+    ) -> None:
+        # INFO: Lists of the user's older resumes are never read again, drop them too
+        user_resume_ids = (
+            self.session.query(ResumeModel.id)
+            .filter(ResumeModel.user_id == user_id)
+            .scalar_subquery()
+        )
+        self.session.query(ResumeJobMatchModel).filter(
+            ResumeJobMatchModel.resume_id.in_(user_resume_ids)
+        ).delete(synchronize_session=False)
+
+        self.session.add_all(self._to_models(resume_id, matches))
+        self.session.commit()
+        logger.info("match_list_replaced", resume_id=resume_id, count=len(matches))
+
+    def find_score_floors(self, resume_ids: list[str], top_n: int) -> dict[str, float]:
+        if not resume_ids:
+            return {}
+
+        rows = (
+            self.session.query(
+                ResumeJobMatchModel.resume_id,
+                func.count(),
+                func.min(ResumeJobMatchModel.score),
+            )
+            .filter(ResumeJobMatchModel.resume_id.in_(resume_ids))
+            .group_by(ResumeJobMatchModel.resume_id)
+            .all()
+        )
+        return {str(resume_id): float(floor) for resume_id, count, floor in rows if count >= top_n}
+
+    def merge_matches(self, matches: dict[str, list[MaterializedMatch]], top_n: int) -> None:
+        if not matches:
+            return
+
+        for resume_id, resume_matches in matches.items():
+            for model in self._to_models(resume_id, resume_matches):
+                self.session.merge(model)
+        self.session.flush()
+
+        for resume_id in matches:
+            overflow = [
+                job_id
+                for (job_id,) in self.session.query(ResumeJobMatchModel.job_id)
+                .filter(ResumeJobMatchModel.resume_id == resume_id)
+                .order_by(ResumeJobMatchModel.score.desc())
+                .offset(top_n)
+                .all()
+            ]
+            if overflow:
+                self.session.query(ResumeJobMatchModel).filter(
+                    ResumeJobMatchModel.resume_id == resume_id,
+                    ResumeJobMatchModel.job_id.in_(overflow),
+                ).delete(synchronize_session=False)
+
+        self.session.commit()
+        logger.info(
+            "match_lists_merged",
+            resumes=len(matches),
+            matches=sum(len(resume_matches) for resume_matches in matches.values()),
+        )
+
+    def find_matches_for_user(
+        self, user_id: str, limit: int
+    ) -> tuple[str, list[MaterializedMatch]] | None:
+        rows = (
+            self.session.query(ResumeJobMatchModel)
+            .join(ResumeVectorModel, ResumeVectorModel.resume_id == ResumeJobMatchModel.resume_id)
+            .filter(ResumeVectorModel.user_id == user_id)
+            .order_by(ResumeJobMatchModel.score.desc())
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            return None
+
+        return str(rows[0].resume_id), [
+            MaterializedMatch(
+                job_id=str(row.job_id),
+                similarity_score=float(row.similarity_score),  # type: ignore[arg-type]
+                skill_match_score=float(row.skill_match_score),  # type: ignore[arg-type]
+                score=float(row.score),  # type: ignore[arg-type]
+            )
+            for row in rows
+        ]
+
+    def _to_vector(self, model: ResumeVectorModel) -> ResumeVector:
+        return ResumeVector(
+            user_id=str(model.user_id),
+            resume_id=str(model.resume_id),
+            embedding=list(model.embedding),  # type: ignore[call-overload]
+            skills=list(model.skills or []),  # type: ignore[call-overload]
+        )
+
+    def _to_models(
+        self, resume_id: str, matches: list[MaterializedMatch]
+    ) -> list[ResumeJobMatchModel]:
+        return [
+            ResumeJobMatchModel(
+                resume_id=resume_id,
+                job_id=match.job_id,
+                similarity_score=match.similarity_score,
+                skill_match_score=match.skill_match_score,
+                score=match.score,
+            )
+            for match in matches
+        ]
@@ -0,0 +1,74 @@
+from contextlib import AbstractContextManager
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.domain.model.question_bank import BankedQuestion
+from app.domain.ports.repositories import QuestionBankRepository
+from app.infrastructure.database.models import QuestionBankModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SQLAlchemyQuestionBankRepository(QuestionBankRepository):
+    """
+    SQLAlchemy implementation of QuestionBankRepository.
+
+    The bank is shared process-wide and used from background threads, so
+    each call opens its own short-lived session instead of borrowing the
+    request's.
+    """
+
+    def __init__(self, session_factory: Callable[[], AbstractContextManager[Session]]) -> None:
+        self.session_factory = session_factory
+
+    def find_by_topic(self, topic: str, difficulty: str, limit: int) -> list[BankedQuestion]:
+        with self.session_factory() as session:
+            models = (
+                session.query(QuestionBankModel)
+                .filter(
+                    QuestionBankModel.topic == topic,
+                    QuestionBankModel.difficulty == difficulty,
+                )
+                .order_by(QuestionBankModel.times_served, QuestionBankModel.created_at)
+                .limit(limit)
+                .all()
+            )
+            return [self._to_domain(model) for model in models]
+
+    def add(self, question: BankedQuestion) -> None:
+        with self.session_factory() as session:
+            session.add(
+                QuestionBankModel(
+                    id=question.id,
+                    topic=question.topic,
+                    difficulty=question.difficulty,
+                    text=question.text,
+                    job_family_embedding=question.job_family_embedding,
+                    times_served=question.times_served,
+                    created_at=question.created_at,
+                )
+            )
+            session.commit()
+
+        logger.debug("question_banked", topic=question.topic, difficulty=question.difficulty)
+
+    def mark_served(self, question_id: str) -> None:
+        with self.session_factory() as session:
+            session.query(QuestionBankModel).filter(QuestionBankModel.id == question_id).update(
+                {QuestionBankModel.times_served: QuestionBankModel.times_served + 1},
+                synchronize_session=False,
+            )
+            session.commit()
+
+    def _to_domain(self, model: QuestionBankModel) -> BankedQuestion:
+        return BankedQuestion(
+            id=str(model.id),
+            topic=str(model.topic),
+            difficulty=str(model.difficulty),
+            text=str(model.text),
+            job_family_embedding=model.job_family_embedding,  # type: ignore[arg-type]
+            times_served=int(model.times_served or 0),  # type: ignore[arg-type]
+            created_at=model.created_at,  # type: ignore[arg-type]
+        )
@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.domain.model.refresh import RefreshSchedule
+from app.domain.ports.repositories import RefreshStateRepository
+from app.infrastructure.database.models import RefreshScheduleModel, SourceWatermarkModel
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SQLAlchemyRefreshStateRepository(RefreshStateRepository):
+    """SQLAlchemy implementation of RefreshStateRepository."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_watermark(self, source: str, query: str, location: str | None) -> datetime | None:
+        model = self._find_watermark_model(source, query, location)
+
+        if not model or not isinstance(model.last_posted_at, datetime):
+            return None
+
+        return self._as_utc(model.last_posted_at)
+
+    def save_watermark(
+        self, source: str, query: str, location: str | None, posted_at: datetime
+    ) -> None:
+        posted_at = self._as_utc(posted_at)
+        model = self._find_watermark_model(source, query, location)
+
+        if model is None:
+            model = SourceWatermarkModel(
+                source=source,
+                query=self._normalize_query(query),
+                location=location or "",
+            )
+            self.session.add(model)
+        elif isinstance(model.last_posted_at, datetime) and (
+            self._as_utc(model.last_posted_at) >= posted_at
+        ):
+            # INFO: Watermarks only move forward
+            return
+
+        setattr(model, "last_posted_at", posted_at)
+        self.session.commit()
+
+        logger.info(
+            "watermark_saved",
+            source=source,
+            query=query,
+            location=location,
+            posted_at=posted_at.isoformat(),
+        )
+
+    def get_schedule(self, query: str, location: str | None) -> RefreshSchedule | None:
+        model = self._find_schedule_model(query, location)
+        return self._schedule_to_domain(model) if model else None
+
+    def save_schedule(self, schedule: RefreshSchedule) -> None:
+        model = self._find_schedule_model(schedule.query, schedule.location)
+
+        if model is None:
+            model = RefreshScheduleModel(
+                query=self._normalize_query(schedule.query),
+                location=schedule.location or "",
+            )
+            self.session.add(model)
+
+        setattr(model, "interval_seconds", schedule.interval_seconds)
+        setattr(model, "next_run_at", schedule.next_run_at)
+        setattr(model, "last_run_at", schedule.last_run_at)
+        setattr(model, "last_new_count", schedule.last_new_count)
+        self.session.commit()
+
+        logger.info(
+            "refresh_schedule_saved",
+            query=schedule.query,
+            location=schedule.location,
+            interval_seconds=schedule.interval_seconds,
+            last_new_count=schedule.last_new_count,
+        )
+
+    def _find_schedule_model(self, query: str, location: str | None) -> RefreshScheduleModel | None:
+        return (
+            self.session.query(RefreshScheduleModel)
+            .filter(
+                RefreshScheduleModel.query == self._normalize_query(query),
+                RefreshScheduleModel.location == (location or ""),
+            )
+            .first()
+        )
+
+    def _schedule_to_domain(self, model: RefreshScheduleModel) -> RefreshSchedule:
+        return RefreshSchedule(
+            query=str(model.query),
+            location=str(model.location) or None,
+            interval_seconds=int(model.interval_seconds),  # type: ignore[arg-type]
+            next_run_at=(
+                self._as_utc(model.next_run_at) if isinstance(model.next_run_at, datetime) else None
+            ),
+            last_run_at=(
+                self._as_utc(model.last_run_at) if isinstance(model.last_run_at, datetime) else None
+            ),
+            last_new_count=int(model.last_new_count or 0),  # type: ignore[arg-type]
+        )
+
+    def _find_watermark_model(
+        self, source: str, query: str, location: str | None
+    ) -> SourceWatermarkModel | None:
+        return (
+            self.session.query(SourceWatermarkModel)
+            .filter(
+                SourceWatermarkModel.source == source,
+                SourceWatermarkModel.query == self._normalize_query(query),
+                SourceWatermarkModel.location == (location or ""),
+            )
+            .first()
+        )
+
+    def _normalize_query(self, query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
+from typing import Any
 
+from sqlalchemy import Select, func, select
 from sqlalchemy.orm import Session
 
-from app.domain.model.resume import Resume
+from app.domain.model.resume import Resume, ResumeSummary
 from app.domain.ports.repositories import ResumeRepository
 from app.infrastructure.database.models import ResumeModel
 from app.infrastructure.logging import get_logger
@@ -10,7 +12,71 @@ from app.infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 
-class SQLAlchemyResumeRepository(ResumeRepository):
+class ResumeModelMapper:
+    """Statements and conversions shared by the sync and async resume repositories."""
+
+    def _new_model(self, resume: Resume) -> ResumeModel:
+        return ResumeModel(
+            id=resume.id,
+            user_id=resume.user_id,
+            file_path=resume.file_path,
+            extracted_text=resume.text,
+            pinecone_id=resume.pinecone_id,
+            uploaded_at=datetime.now(timezone.utc),
+        )
+
+    def _update_model(self, model: ResumeModel, resume: Resume) -> None:
+        setattr(model, "file_path", resume.file_path)
+        setattr(model, "extracted_text", resume.text)
+        setattr(model, "pinecone_id", resume.pinecone_id)
+        setattr(model, "uploaded_at", datetime.now(timezone.utc))
+
+    def _latest_for_user(self, user_id: str) -> Select:
+        return (
+            select(ResumeModel)
+            .where(ResumeModel.user_id == user_id)
+            .order_by(ResumeModel.uploaded_at.desc())
+            .limit(1)
+        )
+
+    def _summary_for_user(self, user_id: str, preview_length: int) -> Select:
+        # INFO: Only the preview of extracted_text leaves the database
+        return (
+            select(
+                ResumeModel.id,
+                ResumeModel.user_id,
+                ResumeModel.file_path,
+                ResumeModel.pinecone_id,
+                ResumeModel.uploaded_at,
+                func.substr(ResumeModel.extracted_text, 1, preview_length),
+            )
+            .where(ResumeModel.user_id == user_id)
+            .order_by(ResumeModel.uploaded_at.desc())
+            .limit(1)
+        )
+
+    def _to_domain(self, model: ResumeModel) -> Resume:
+        return Resume(
+            id=str(model.id),
+            user_id=str(model.user_id),
+            text=str(model.extracted_text),
+            file_path=str(model.file_path),
+            pinecone_id=str(model.pinecone_id),
+        )
+
+    def _to_summary(self, row: Any) -> ResumeSummary:
+        resume_id, user_id, file_path, pinecone_id, uploaded_at, preview = row
+        return ResumeSummary(
+            id=str(resume_id),
+            user_id=str(user_id),
+            file_path=str(file_path),
+            pinecone_id=str(pinecone_id),
+            uploaded_at=uploaded_at,
+            text_preview=preview or "",
+        )
+
+
+class SQLAlchemyResumeRepository(ResumeModelMapper, ResumeRepository):
     """SQLAlchemy implementation of ResumeRepository."""
 
     def __init__(self, session: Session) -> None:
@@ -24,7 +90,7 @@ class SQLAlchemyResumeRepository(ResumeRepository):
         if existing:
             self._update_model(existing, resume)
         else:
-            self._create_model(resume)
+            self.session.add(self._new_model(resume))
 
         self.session.commit()
         logger.info("resume_saved", resume_id=resume.id)
@@ -35,14 +101,15 @@ class SQLAlchemyResumeRepository(ResumeRepository):
         return self._to_domain(model) if model else None
 
     def find_by_user_id(self, user_id: str) -> Resume | None:
-        model = (
-            self.session.query(ResumeModel)
-            .filter(ResumeModel.user_id == user_id)
-            .order_by(ResumeModel.uploaded_at.desc())
-            .first()
-        )
+        model = self.session.scalar(self._latest_for_user(user_id))
         return self._to_domain(model) if model else None
 
+    def find_summary_by_user_id(
+        self, user_id: str, preview_length: int = 500
+    ) -> ResumeSummary | None:
+        row = self.session.execute(self._summary_for_user(user_id, preview_length)).first()
+        return self._to_summary(row) if row else None
+
     def delete(self, resume_id: str) -> bool:
         model = self._find_model_by_id(resume_id)
         if not model:
@@ -55,30 +122,3 @@ class SQLAlchemyResumeRepository(ResumeRepository):
 
     def _find_model_by_id(self, resume_id: str) -> ResumeModel | None:
         return self.session.query(ResumeModel).filter(ResumeModel.id == resume_id).first()
-
-    def _create_model(self, resume: Resume) -> ResumeModel:
-        model = ResumeModel(
-            id=resume.id,
-            user_id=resume.user_id,
-            file_path=resume.file_path,
-            extracted_text=resume.text,
-            pinecone_id=resume.pinecone_id,
-            uploaded_at=datetime.now(timezone.utc),
-        )
-        self.session.add(model)
-        return model
-
-    def _update_model(self, model: ResumeModel, resume: Resume) -> None:
-        setattr(model, "file_path", resume.file_path)
-        setattr(model, "extracted_text", resume.text)
-        setattr(model, "pinecone_id", resume.pinecone_id)
-        setattr(model, "uploaded_at", datetime.now(timezone.utc))
-
-    def _to_domain(self, model: ResumeModel) -> Resume:
-        return Resume(
-            id=str(model.id),
-            user_id=str(model.user_id),
-            text=str(model.extracted_text),
-            file_path=str(model.file_path),
-            pinecone_id=str(model.pinecone_id),
-        )
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+
+from app.domain.model.search import RankedSearch
+from app.domain.ports.search_cache_port import SearchResultCache
+
+
+class InMemorySearchResultCache(SearchResultCache):
+    """Process-local LRU of search rankings with a TTL per entry."""
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 600.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._results: OrderedDict[tuple[str, int, int], tuple[RankedSearch, float]] = OrderedDict()
+        self._resume_ids: dict[str, str] = {}
+        self._catalog_version = 0
+        self._lock = threading.Lock()
+
+    def get_resume_id(self, user_id: str) -> str | None:
+        with self._lock:
+            return self._resume_ids.get(user_id)
+
+    def set_resume_id(self, user_id: str, resume_id: str) -> None:
+        with self._lock:
+            self._resume_ids[user_id] = resume_id
+
+    def invalidate_user(self, user_id: str) -> None:
+        with self._lock:
+            resume_id = self._resume_ids.pop(user_id, None)
+            if resume_id is not None:
+                for key in [key for key in self._results if key[0] == resume_id]:
+                    del self._results[key]
+
+    def get(self, resume_id: str, top_k: int, catalog_version: int) -> RankedSearch | None:
+        key = (resume_id, top_k, catalog_version)
+
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+
+            ranked, cached_at = entry
+            if time.monotonic() - cached_at >= self.ttl_seconds:
+                del self._results[key]
+                return None
+
+            self._results.move_to_end(key)
+            return ranked
+
+    def put(self, ranked: RankedSearch, catalog_version: int) -> None:
+        key = (ranked.resume_id, ranked.top_k, catalog_version)
+
+        with self._lock:
+            self._results[key] = (ranked, time.monotonic())
+            self._results.move_to_end(key)
+
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def catalog_version(self) -> int:
+        return self._catalog_version
+
+    def bump_catalog_version(self) -> int:
+        with self._lock:
+            self._catalog_version += 1
+            # INFO: Entries for older versions can never be hit again
+            self._results.clear()
+            return self._catalog_version
+
+    def close(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._resume_ids.clear()
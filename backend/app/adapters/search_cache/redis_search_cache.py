@@ -0,0 +1,103 @@
+import json
+from dataclasses import asdict
+from typing import Any
+
+from app.domain.model.search import RankedSearch
+from app.domain.ports.search_cache_port import SearchResultCache
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RedisSearchResultCache(SearchResultCache):
+    """
+    Search rankings shared by every API worker through Redis. Old catalog
+    versions are never read again and simply expire with their TTL.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: float = 600.0, prefix: str = "job_search") -> None:
+        self.client = client
+        self.ttl_seconds = int(ttl_seconds)
+        self.prefix = prefix
+
+    def get_resume_id(self, user_id: str) -> str | None:
+        try:
+            value = self.client.get(self._resume_key(user_id))
+        except Exception as e:
+            logger.warning("search_cache_read_failed", error=str(e))
+            return None
+
+        return value.decode() if isinstance(value, bytes) else value
+
+    def set_resume_id(self, user_id: str, resume_id: str) -> None:
+        try:
+            self.client.set(self._resume_key(user_id), resume_id, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning("search_cache_write_failed", error=str(e))
+
+    def invalidate_user(self, user_id: str) -> None:
+        # INFO: Without the pointer the old resume's rankings are unreachable until they expire
+        try:
+            self.client.delete(self._resume_key(user_id))
+        except Exception as e:
+            logger.warning("search_cache_invalidate_failed", user_id=user_id, error=str(e))
+
+    def get(self, resume_id: str, top_k: int, catalog_version: int) -> RankedSearch | None:
+        try:
+            raw = self.client.get(self._results_key(resume_id, top_k, catalog_version))
+        except Exception as e:
+            logger.warning("search_cache_read_failed", error=str(e))
+            return None
+
+        if raw is None:
+            return None
+
+        return RankedSearch(**json.loads(raw))
+
+    def put(self, ranked: RankedSearch, catalog_version: int) -> None:
+        key = self._results_key(ranked.resume_id, ranked.top_k, catalog_version)
+
+        try:
+            self.client.set(key, json.dumps(asdict(ranked)), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning("search_cache_write_failed", error=str(e))
+
+    def catalog_version(self) -> int:
+        try:
+            value = self.client.get(self._catalog_key())
+        except Exception as e:
+            logger.warning("search_cache_read_failed", error=str(e))
+            return 0
+
+        return int(value) if value is not None else 0
+
+    def bump_catalog_version(self) -> int:
+        try:
+            return int(self.client.incr(self._catalog_key()))
+        except Exception as e:
+            logger.error("search_cache_catalog_bump_failed", error=str(e))
+            return self.catalog_version()
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _resume_key(self, user_id: str) -> str:
+        return f"{self.prefix}:resume:{user_id}"
+
+    def _results_key(self, resume_id: str, top_k: int, catalog_version: int) -> str:
+        return f"{self.prefix}:results:{catalog_version}:{resume_id}:{top_k}"
+
+    def _catalog_key(self) -> str:
+        return f"{self.prefix}:catalog_version"
+
+
+def create_redis_search_cache(url: str, ttl_seconds: float = 600.0) -> RedisSearchResultCache:
+    # INFO: redis is an optional dependency, only needed when the shared backend is enabled
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError(
+            "SEARCH_CACHE_BACKEND=redis requires the redis package (pip install '.[cache]')"
+        ) from e
+
+    return RedisSearchResultCache(client=redis.Redis.from_url(url), ttl_seconds=ttl_seconds)
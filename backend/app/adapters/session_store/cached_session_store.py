@@ -0,0 +1,105 @@
+import copy
+import threading
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.interview_session_repository import (
+    SQLAlchemyInterviewSessionRepository,
+)
+from app.domain.model.interview import InterviewSession
+from app.domain.ports.interview_session_store_port import (
+    InterviewSessionStore,
+    SessionConflictError,
+)
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedSessionStore(InterviewSessionStore):
+    """
+    Interview session store backed by the interview_sessions table.
+
+    Reads go through an in-process LRU cache. A cached copy is served only
+    while the stored version still matches it, so probing the version replaces
+    reloading the conversation. Every write reaches the DB before put returns.
+    An update applies only if the row still holds the version it was read at,
+    otherwise put raises SessionConflictError and the caller sees that another
+    worker took the turn.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        max_entries: int = 1024,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_entries = max_entries
+
+        self._cache: OrderedDict[str, InterviewSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> InterviewSession | None:
+        with self._lock:
+            cached = self._cache.get(session_id)
+
+        with self.session_factory() as db:
+            repository = SQLAlchemyInterviewSessionRepository(session=db)
+
+            # INFO: Probing the version is far cheaper than reloading the conversation
+            if cached is not None and repository.find_version(session_id) == cached.version:
+                with self._lock:
+                    if session_id in self._cache:
+                        self._cache.move_to_end(session_id)
+                return copy.deepcopy(cached)
+
+            session = repository.find_by_id(session_id)
+
+        with self._lock:
+            if session is not None:
+                self._remember(session)
+            else:
+                self._cache.pop(session_id, None)
+
+        logger.debug("interview_session_loaded", session_id=session_id, found=session is not None)
+        return copy.deepcopy(session) if session is not None else None
+
+    def put(self, session: InterviewSession) -> None:
+        # INFO: Snapshot so later in-place mutations by the caller never leak into the cache
+        snapshot = copy.deepcopy(session)
+
+        with self.session_factory() as db:
+            repository = SQLAlchemyInterviewSessionRepository(session=db)
+            if snapshot.version == 0:
+                repository.insert(snapshot)
+                conflicts = []
+            else:
+                conflicts = repository.save_all([snapshot])
+
+        if conflicts:
+            with self._lock:
+                # INFO: Another worker wrote first, drop the stale copy and reload next read
+                self._cache.pop(session.id, None)
+            logger.warning("interview_session_write_conflict", session_id=session.id)
+            raise SessionConflictError(session.id)
+
+        session.version = snapshot.version
+        with self._lock:
+            self._remember(snapshot)
+
+    def _remember(self, session: InterviewSession) -> None:
+        self._cache[session.id] = session
+        self._cache.move_to_end(session.id)
+
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+
+def create_cached_session_store(
+    session_factory: Callable[[], AbstractContextManager[Session]],
+    max_entries: int = 1024,
+) -> CachedSessionStore:
+    return CachedSessionStore(session_factory=session_factory, max_entries=max_entries)
@@ -1,35 +1,191 @@
 from fastapi import Depends, Header, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.adapters.auth.stub_auth_adapter import create_stub_auth_adapter
 from app.adapters.embedding.sentence_transformer_adapter import create_embedding_adapter
 from app.adapters.job_sources.adzuna_adapter import create_adzuna_adapter
 from app.adapters.job_sources.remoteok_adapter import create_remoteok_adapter
+from app.adapters.lexical_index.synced_index import create_synced_lexical_index
 from app.adapters.llm.local_llm_adapter import create_local_llm_adapter
+from app.adapters.repositories.async_job_repository import AsyncSQLAlchemyJobRepository
+from app.adapters.repositories.async_resume_repository import AsyncSQLAlchemyResumeRepository
+from app.adapters.repositories.gap_analysis_repository import SQLAlchemyGapAnalysisRepository
+from app.adapters.repositories.indexed_job_repository import IndexedJobRepository
+from app.adapters.repositories.ingest_task_repository import SQLAlchemyIngestTaskRepository
 from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from app.adapters.repositories.match_list_repository import SQLAlchemyMatchListRepository
+from app.adapters.repositories.question_bank_repository import SQLAlchemyQuestionBankRepository
+from app.adapters.repositories.refresh_state_repository import (
+    SQLAlchemyRefreshStateRepository,
+)
 from app.adapters.repositories.resume_repository import SQLAlchemyResumeRepository
+from app.adapters.search_cache.in_memory_search_cache import InMemorySearchResultCache
+from app.adapters.search_cache.redis_search_cache import create_redis_search_cache
+from app.adapters.session_store.cached_session_store import create_cached_session_store
 from app.adapters.vector_db.pinecone_adapter import create_pinecone_adapter
 from app.core.config import settings
 from app.domain.ports.auth_port import AuthPort
 from app.domain.ports.embedding_port import EmbeddingPort
+from app.domain.ports.interview_session_store_port import InterviewSessionStore
 from app.domain.ports.job_source_port import JobSourcePort
+from app.domain.ports.lexical_index_port import LexicalIndexPort
 from app.domain.ports.llm_port import LLMPort
-from app.domain.ports.repositories import JobRepository, ResumeRepository
+from app.domain.ports.repositories import (
+    AsyncJobRepository,
+    AsyncResumeRepository,
+    GapAnalysisRepository,
+    IngestTaskRepository,
+    JobRepository,
+    MatchListRepository,
+    RefreshStateRepository,
+    ResumeRepository,
+)
+from app.domain.ports.search_cache_port import SearchResultCache
 from app.domain.ports.vector_db_port import VectorDBPort
+from app.domain.services.batch_scorer import BatchScorer
+from app.domain.services.ingest_service import IngestService
+from app.domain.services.interview_graph import InterviewGraph
 from app.domain.services.interview_service import InterviewService
 from app.domain.services.job_matching_service import JobMatchingService
 from app.domain.services.job_service import JobService
+from app.domain.services.match_materializer import MatchMaterializer
+from app.domain.services.question_bank_service import QuestionBankService
+from app.domain.services.question_prefetcher import QuestionPrefetcher
+from app.domain.services.ranked_search_cache import RankedSearchCache
+from app.domain.services.resume_matrix import ResumeMatrixStore
 from app.domain.services.resume_service import ResumeService
 from app.domain.services.skill_extraction_service import SkillExtractionService
-from app.infrastructure.database.session import get_db
+from app.domain.skills.dictionary import load_skill_entries, register_skill_entries
+from app.domain.skills.gap_engine import GapEngine
+from app.domain.skills.taxonomy import get_skill_taxonomy
+from app.infrastructure.database.session import get_async_db, get_db, get_db_context
 from app.infrastructure.logging import get_logger
+from app.infrastructure.resources import registry
 
 logger = get_logger(__name__)
 
-# Singleton instances for expensive resources
-_embedding_service: EmbeddingPort | None = None
-_vector_db: VectorDBPort | None = None
-_llm_service: LLMPort | None = None
+EMBEDDING_RESOURCE = "embedding"
+VECTOR_DB_RESOURCE = "vector_db"
+LLM_RESOURCE = "llm"
+INTERVIEW_SESSION_STORE_RESOURCE = "interview_session_store"
+QUESTION_PREFETCHER_RESOURCE = "question_prefetcher"
+QUESTION_BANK_RESOURCE = "question_bank"
+INTERVIEW_GRAPH_RESOURCE = "interview_graph"
+GAP_ENGINE_RESOURCE = "gap_engine"
+RANKED_SEARCH_CACHE_RESOURCE = "ranked_search_cache"
+SEARCH_RESULT_CACHE_RESOURCE = "search_result_cache"
+RESUME_MATRIX_STORE_RESOURCE = "resume_matrix_store"
+LEXICAL_INDEX_RESOURCE = "lexical_index"
+
+
+def _create_search_result_cache() -> SearchResultCache:
+    if settings.SEARCH_CACHE_BACKEND == "redis":
+        if not settings.SEARCH_CACHE_REDIS_URL:
+            raise ValueError("SEARCH_CACHE_REDIS_URL is required for the redis search cache")
+        return create_redis_search_cache(
+            url=settings.SEARCH_CACHE_REDIS_URL, ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS
+        )
+
+    return InMemorySearchResultCache(
+        max_entries=settings.SEARCH_CACHE_SIZE, ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS
+    )
+
+
+def _create_lexical_index() -> LexicalIndexPort:
+    return create_synced_lexical_index(
+        session_factory=get_db_context,
+        ttl_seconds=settings.LEXICAL_INDEX_SYNC_SECONDS,
+        catalog_version=get_search_result_cache().catalog_version,
+    )
+
+
+def _create_vector_db() -> VectorDBPort:
+    return create_pinecone_adapter(
+        api_key=settings.PINECONE_API_KEY,
+        index_name=settings.PINECONE_INDEX_NAME,
+        environment=settings.PINECONE_ENVIRONMENT,
+        dimension=get_embedding_service().get_embedding_dimension(),
+    )
+
+
+# INFO: Extra skills must be registered before the taxonomy and extractor are first built
+if settings.SKILL_DICTIONARY_PATH:
+    register_skill_entries(load_skill_entries(settings.SKILL_DICTIONARY_PATH))
+
+
+# INFO: Expensive resources are shared process-wide by the API and the scheduler
+registry.register(
+    EMBEDDING_RESOURCE,
+    factory=lambda: create_embedding_adapter(settings.EMBEDDING_MODEL),
+    health_check=lambda embedding: embedding.get_embedding_dimension() > 0,
+    eager=True,
+)
+registry.register(VECTOR_DB_RESOURCE, factory=_create_vector_db)
+registry.register(
+    LLM_RESOURCE,
+    factory=lambda: create_local_llm_adapter(
+        endpoint=settings.LLM_ENDPOINT,
+        timeout=settings.LLM_TIMEOUT,
+    ),
+    on_close=lambda llm: llm.close(),
+    eager=True,
+)
+registry.register(
+    INTERVIEW_SESSION_STORE_RESOURCE,
+    factory=lambda: create_cached_session_store(
+        session_factory=get_db_context,
+        max_entries=settings.INTERVIEW_SESSION_CACHE_SIZE,
+    ),
+)
+registry.register(
+    QUESTION_PREFETCHER_RESOURCE,
+    factory=lambda: QuestionPrefetcher(max_workers=settings.INTERVIEW_PREFETCH_WORKERS),
+    on_close=lambda prefetcher: prefetcher.close(),
+)
+registry.register(
+    QUESTION_BANK_RESOURCE,
+    factory=lambda: QuestionBankService(
+        repository=SQLAlchemyQuestionBankRepository(session_factory=get_db_context),
+        llm_service=get_llm_service(),
+        embedding_service=get_embedding_service(),
+        min_stock=settings.QUESTION_BANK_MIN_STOCK,
+        similarity_threshold=settings.QUESTION_BANK_SIMILARITY_THRESHOLD,
+    ),
+    on_close=lambda bank: bank.close(),
+)
+registry.register(
+    INTERVIEW_GRAPH_RESOURCE,
+    factory=lambda: InterviewGraph(
+        llm_service=get_llm_service(),
+        total_questions=5,
+        question_prefetcher=get_question_prefetcher(),
+        question_mode=settings.INTERVIEW_QUESTION_MODE,
+        question_bank=get_question_bank(),
+    ),
+)
+registry.register(
+    GAP_ENGINE_RESOURCE,
+    factory=lambda: GapEngine(
+        taxonomy=get_skill_taxonomy(),
+        embedding_service=get_embedding_service(),
+        fuzzy_threshold=settings.GAP_FUZZY_MATCH_THRESHOLD,
+    ),
+)
+registry.register(
+    RANKED_SEARCH_CACHE_RESOURCE,
+    factory=lambda: RankedSearchCache(ttl_seconds=settings.JOB_SEARCH_CURSOR_TTL_SECONDS),
+)
+registry.register(
+    SEARCH_RESULT_CACHE_RESOURCE,
+    factory=_create_search_result_cache,
+    on_close=lambda cache: cache.close(),
+)
+registry.register(LEXICAL_INDEX_RESOURCE, factory=_create_lexical_index)
+registry.register(
+    RESUME_MATRIX_STORE_RESOURCE,
+    factory=lambda: ResumeMatrixStore(settings.RESUME_MATRIX_DIR),
+)
 
 
 def get_auth_service() -> AuthPort:
@@ -59,34 +215,59 @@ def get_resume_repository(db: Session = Depends(get_db)) -> ResumeRepository:
     return SQLAlchemyResumeRepository(session=db)
 
 
-def get_job_repository(db: Session = Depends(get_db)) -> JobRepository:
-    return SQLAlchemyJobRepository(session=db)
+def get_async_resume_repository(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncResumeRepository:
+    return AsyncSQLAlchemyResumeRepository(session=db)
 
 
-def get_embedding_service() -> EmbeddingPort:
-    global _embedding_service
+def get_lexical_index() -> LexicalIndexPort | None:
+    if settings.JOB_RETRIEVAL_MODE != "hybrid":
+        return None
+    return registry.get(LEXICAL_INDEX_RESOURCE)
+
+
+def get_job_repository(
+    db: Session = Depends(get_db),
+    lexical_index: LexicalIndexPort | None = Depends(get_lexical_index),
+) -> JobRepository:
+    repository = SQLAlchemyJobRepository(session=db)
+    if lexical_index is None:
+        return repository
+    return IndexedJobRepository(repository=repository, lexical_index=lexical_index)
 
-    if _embedding_service is None:
-        logger.info("initializing_embedding_service_singleton")
-        _embedding_service = create_embedding_adapter(settings.EMBEDDING_MODEL)
 
-    return _embedding_service
+def get_async_job_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncJobRepository:
+    # INFO: Request handlers only read through it, writes go through the indexed sync repository
+    return AsyncSQLAlchemyJobRepository(session=db)
+
+
+def get_refresh_state_repository(db: Session = Depends(get_db)) -> RefreshStateRepository:
+    return SQLAlchemyRefreshStateRepository(session=db)
+
+
+def get_gap_analysis_repository(db: Session = Depends(get_db)) -> GapAnalysisRepository:
+    return SQLAlchemyGapAnalysisRepository(session=db)
+
+
+def get_match_list_repository(db: Session = Depends(get_db)) -> MatchListRepository:
+    return SQLAlchemyMatchListRepository(session=db)
+
+
+def get_ingest_task_repository(db: Session = Depends(get_db)) -> IngestTaskRepository:
+    return SQLAlchemyIngestTaskRepository(session=db)
+
+
+def get_embedding_service() -> EmbeddingPort:
+    return registry.get(EMBEDDING_RESOURCE)
 
 
 def get_vector_db() -> VectorDBPort:
-    global _vector_db
-
-    if _vector_db is None:
-        logger.info("initializing_vector_db_singleton")
-        embedding_service = get_embedding_service()
-        _vector_db = create_pinecone_adapter(
-            api_key=settings.PINECONE_API_KEY,
-            index_name=settings.PINECONE_INDEX_NAME,
-            environment=settings.PINECONE_ENVIRONMENT,
-            dimension=embedding_service.get_embedding_dimension(),
-        )
+    return registry.get(VECTOR_DB_RESOURCE)
 
-    return _vector_db
+
+def get_search_result_cache() -> SearchResultCache:
+    return registry.get(SEARCH_RESULT_CACHE_RESOURCE)
 
 
 def get_adzuna_adapter() -> JobSourcePort:
@@ -94,50 +275,135 @@ def get_adzuna_adapter() -> JobSourcePort:
         app_id=settings.ADZUNA_APP_ID,
         api_key=settings.ADZUNA_API_KEY,
         country=settings.ADZUNA_COUNTRY,
+        timeout=settings.JOB_SOURCE_TIMEOUT_SECONDS,
     )
 
 
 def get_remoteok_adapter() -> JobSourcePort:
-    return create_remoteok_adapter()
+    return create_remoteok_adapter(timeout=settings.JOB_SOURCE_TIMEOUT_SECONDS)
 
 
 def get_job_matching_service(
     vector_db: VectorDBPort = Depends(get_vector_db),
     embedding_service: EmbeddingPort = Depends(get_embedding_service),
+    lexical_index: LexicalIndexPort | None = Depends(get_lexical_index),
 ) -> JobMatchingService:
-    return JobMatchingService(vector_db=vector_db, embedding_service=embedding_service)
+    return JobMatchingService(
+        vector_db=vector_db,
+        embedding_service=embedding_service,
+        similarity_weight=settings.MATCH_SIMILARITY_WEIGHT,
+        skill_weight=settings.MATCH_SKILL_WEIGHT,
+        lexical_index=lexical_index,
+        rrf_k=settings.HYBRID_RRF_K,
+    )
 
 
 def get_resume_service(
     resume_repo: ResumeRepository = Depends(get_resume_repository),
     embedding_service: EmbeddingPort = Depends(get_embedding_service),
     vector_db: VectorDBPort = Depends(get_vector_db),
+    gap_analysis_repo: GapAnalysisRepository = Depends(get_gap_analysis_repository),
+    search_result_cache: SearchResultCache = Depends(get_search_result_cache),
 ) -> ResumeService:
     return ResumeService(
         resume_repository=resume_repo,
         embedding_service=embedding_service,
         vector_db=vector_db,
         storage_bucket=settings.STORAGE_BUCKET,
+        gap_analysis_repository=gap_analysis_repo,
+        search_result_cache=search_result_cache,
     )
 
 
 def get_llm_service() -> LLMPort:
-    global _llm_service
+    return registry.get(LLM_RESOURCE)
+
+
+def get_interview_session_store() -> InterviewSessionStore:
+    return registry.get(INTERVIEW_SESSION_STORE_RESOURCE)
+
+
+def get_question_prefetcher() -> QuestionPrefetcher:
+    return registry.get(QUESTION_PREFETCHER_RESOURCE)
+
+
+def get_question_bank() -> QuestionBankService | None:
+    if not settings.QUESTION_BANK_ENABLED:
+        return None
+    return registry.get(QUESTION_BANK_RESOURCE)
 
-    if _llm_service is None:
-        logger.info("initializing_llm_service_singleton")
-        _llm_service = create_local_llm_adapter(
-            endpoint=settings.LLM_ENDPOINT,
-            timeout=50,
-        )
 
-    return _llm_service
+def get_interview_graph() -> InterviewGraph:
+    return registry.get(INTERVIEW_GRAPH_RESOURCE)
+
+
+def get_gap_engine() -> GapEngine | None:
+    if not settings.GAP_ENGINE_ENABLED:
+        return None
+    return registry.get(GAP_ENGINE_RESOURCE)
+
+
+def get_ranked_search_cache() -> RankedSearchCache:
+    return registry.get(RANKED_SEARCH_CACHE_RESOURCE)
 
 
 def get_skill_extraction_service(
     llm_service: LLMPort = Depends(get_llm_service),
+    gap_analysis_repo: GapAnalysisRepository = Depends(get_gap_analysis_repository),
+    gap_engine: GapEngine | None = Depends(get_gap_engine),
 ) -> SkillExtractionService:
-    return SkillExtractionService(llm_service=llm_service)
+    return SkillExtractionService(
+        llm_service=llm_service,
+        gap_analysis_repository=gap_analysis_repo,
+        gap_analysis_version=settings.GAP_ANALYSIS_VERSION,
+        gap_engine=gap_engine,
+        narrative_lease_seconds=settings.GAP_NARRATIVE_LEASE_SECONDS,
+    )
+
+
+def get_resume_matrix_store() -> ResumeMatrixStore | None:
+    if not settings.RESUME_MATRIX_DIR:
+        return None
+    return registry.get(RESUME_MATRIX_STORE_RESOURCE)
+
+
+def get_match_materializer(
+    match_list_repo: MatchListRepository = Depends(get_match_list_repository),
+    resume_matrix_store: ResumeMatrixStore | None = Depends(get_resume_matrix_store),
+) -> MatchMaterializer | None:
+    if not settings.MATCH_LIST_ENABLED:
+        return None
+    return MatchMaterializer(
+        repository=match_list_repo,
+        top_n=settings.MATCH_LIST_SIZE,
+        scorer=BatchScorer(
+            similarity_weight=settings.MATCH_SIMILARITY_WEIGHT,
+            skill_weight=settings.MATCH_SKILL_WEIGHT,
+            block_size=settings.BATCH_SCORE_BLOCK_SIZE,
+        ),
+        matrix_store=resume_matrix_store,
+    )
+
+
+def get_ingest_service(
+    task_repo: IngestTaskRepository = Depends(get_ingest_task_repository),
+    job_repo: JobRepository = Depends(get_job_repository),
+    skill_extraction_service: SkillExtractionService = Depends(get_skill_extraction_service),
+    embedding_service: EmbeddingPort = Depends(get_embedding_service),
+    vector_db: VectorDBPort = Depends(get_vector_db),
+    search_result_cache: SearchResultCache = Depends(get_search_result_cache),
+    match_materializer: MatchMaterializer | None = Depends(get_match_materializer),
+) -> IngestService:
+    return IngestService(
+        task_repository=task_repo,
+        job_repository=job_repo,
+        skill_extraction_service=skill_extraction_service,
+        embedding_service=embedding_service,
+        vector_db=vector_db,
+        max_attempts=settings.INGEST_MAX_ATTEMPTS,
+        search_result_cache=search_result_cache,
+        match_materializer=match_materializer,
+    )
 
 
 def get_job_service(
@@ -147,6 +413,12 @@ def get_job_service(
     embedding_service: EmbeddingPort = Depends(get_embedding_service),
     vector_db: VectorDBPort = Depends(get_vector_db),
     skill_extraction_service: SkillExtractionService = Depends(get_skill_extraction_service),
+    ingest_service: IngestService = Depends(get_ingest_service),
+    refresh_state_repo: RefreshStateRepository = Depends(get_refresh_state_repository),
+    ranked_search_cache: RankedSearchCache = Depends(get_ranked_search_cache),
+    search_result_cache: SearchResultCache = Depends(get_search_result_cache),
+    match_list_repo: MatchListRepository = Depends(get_match_list_repository),
+    match_materializer: MatchMaterializer | None = Depends(get_match_materializer),
 ) -> JobService:
     return JobService(
         job_repository=job_repo,
@@ -155,6 +427,12 @@ def get_job_service(
         embedding_service=embedding_service,
         vector_db=vector_db,
         skill_extraction_service=skill_extraction_service,
+        ingest_service=ingest_service,
+        refresh_state_repository=refresh_state_repo,
+        ranked_search_cache=ranked_search_cache,
+        search_result_cache=search_result_cache,
+        match_list_repository=match_list_repo if settings.MATCH_LIST_ENABLED else None,
+        match_materializer=match_materializer,
     )
 
 
@@ -163,11 +441,14 @@ def get_interview_service(
     skill_extraction_service: SkillExtractionService = Depends(get_skill_extraction_service),
     job_repo: JobRepository = Depends(get_job_repository),
     resume_repo: ResumeRepository = Depends(get_resume_repository),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store),
+    interview_graph: InterviewGraph = Depends(get_interview_graph),
 ) -> InterviewService:
     return InterviewService(
         llm_service=llm_service,
         skill_extraction_service=skill_extraction_service,
         job_repository=job_repo,
         resume_repository=resume_repo,
-        total_questions=5,
+        session_store=session_store,
+        interview_graph=interview_graph,
     )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.dependencies import get_current_user, get_interview_service
 from app.api.schemas import (
@@ -11,6 +12,7 @@ from app.api.schemas import (
     SubmitAnswerRequest,
     SubmitAnswerResponse,
 )
+from app.domain.ports.interview_session_store_port import SessionConflictError
 from app.domain.services.interview_service import InterviewService
 from app.infrastructure.logging import get_logger
 
@@ -27,7 +29,9 @@ async def start_interview(
     logger.info("interview_start_request", user_id=user_id, job_id=request.job_id)
 
     try:
-        session = interview_service.start_interview(user_id, request.job_id)
+        session = await run_in_threadpool(
+            interview_service.start_interview, user_id, request.job_id
+        )
 
         first_question = session.current_question
         if not first_question:
@@ -61,7 +65,9 @@ async def submit_answer(
     logger.info("submit_answer_request", session_id=session_id, user_id=user_id)
 
     try:
-        session = interview_service.submit_answer(session_id, request.answer_text)
+        session = await run_in_threadpool(
+            interview_service.submit_answer, session_id, request.answer_text
+        )
 
         next_question = session.current_question
         question_number = len(session.state["answers"])
@@ -82,6 +88,8 @@ async def submit_answer(
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         logger.error("submit_answer_failed", error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to submit answer: {str(e)}")
@@ -96,7 +104,7 @@ async def get_feedback(
     logger.info("feedback_request", session_id=session_id, user_id=user_id)
 
     try:
-        feedback = interview_service.get_feedback(session_id)
+        feedback = await run_in_threadpool(interview_service.get_feedback, session_id)
 
         return InterviewFeedbackResponse(
             session_id=feedback["session_id"],
@@ -124,7 +132,7 @@ async def get_session(
     logger.info("session_request", session_id=session_id, user_id=user_id)
 
     try:
-        session = interview_service.get_session(session_id)
+        session = await run_in_threadpool(interview_service.get_session, session_id)
 
         return InterviewSessionResponse(
             session_id=session.id,
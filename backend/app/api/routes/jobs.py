@@ -1,7 +1,10 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.dependencies import (
     get_adzuna_adapter,
+    get_async_job_repository,
+    get_async_resume_repository,
     get_current_user,
     get_job_service,
     get_remoteok_adapter,
@@ -14,12 +17,17 @@ from app.api.schemas import (
     JobRefreshResponse,
     JobSearchResponse,
     JobSkills,
+    JobSummary,
     JobWithSkills,
     SkillGapDetail,
 )
-from app.domain.model.job import Job
+from app.core.config import settings
+from app.domain.model import job as job_model
+from app.domain.model.job import Job, JobSearchFilters
 from app.domain.ports.job_source_port import JobSourcePort
+from app.domain.ports.repositories import AsyncJobRepository, AsyncResumeRepository
 from app.domain.services.job_service import JobService
+from app.domain.services.ranked_search_cache import decode_cursor
 from app.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -29,25 +37,60 @@ router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 @router.post("/search", response_model=JobSearchResponse)
 async def search_jobs(
     top_k: int = 50,
+    page_size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+    location: str | None = None,
+    min_salary: int | None = Query(default=None, ge=0),
+    source: list[str] | None = Query(default=None),
+    seniority: list[str] | None = Query(default=None),
+    posted_within_days: int | None = Query(default=None, ge=1),
     user_id: str = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service),
 ) -> JobSearchResponse:
-    logger.info("job_search_request", user_id=user_id, top_k=top_k)
+    logger.info("job_search_request", user_id=user_id, top_k=top_k, page_size=page_size)
+
+    filters = JobSearchFilters(
+        location=location,
+        min_salary=min_salary,
+        sources=tuple(source or ()),
+        seniority_levels=tuple(seniority or ()),
+        posted_within_days=posted_within_days,
+    )
+
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        job_matches, resume_id = job_service.search_jobs(user_id, top_k)
+        # INFO: Embedding, vector search and ranking are sync, keep them off the event loop.
+        # The repository reads sit between those steps, so they share the same thread hop.
+        page = await run_in_threadpool(
+            job_service.search_jobs,
+            user_id,
+            top_k,
+            page_size=page_size,
+            cursor=cursor,
+            filters=filters,
+        )
 
         matches = [
             JobMatchResult(
-                job=_to_job_detail(match.job),
+                job=_to_job_summary(match.job),
                 similarity_score=match.similarity_score,
                 skill_match_score=match.skill_match_score,
                 combined_score=match.combined_score,
             )
-            for match in job_matches
+            for match in page.matches
         ]
 
-        return JobSearchResponse(matches=matches, total=len(matches), resume_id=resume_id)
+        return JobSearchResponse(
+            matches=matches,
+            total=page.total,
+            resume_id=page.resume_id,
+            next_cursor=page.next_cursor,
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -55,17 +98,16 @@ async def search_jobs(
 @router.get("/{job_id}", response_model=JobWithSkills)
 async def get_job(
     job_id: str,
-    job_service: JobService = Depends(get_job_service),
+    job_repository: AsyncJobRepository = Depends(get_async_job_repository),
 ) -> JobWithSkills:
-    try:
-        job = job_service.get_job_by_id(job_id)
+    job = await job_repository.find_by_id(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        return JobWithSkills(
-            **_to_job_detail(job).model_dump(),
-            skills=_extract_skills(job) if job.has_extracted_skills() else None,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    return JobWithSkills(
+        **_to_job_detail(job).model_dump(),
+        skills=_extract_skills(job) if job.has_extracted_skills() else None,
+    )
 
 
 @router.post("/refresh", response_model=JobRefreshResponse)
@@ -101,18 +143,39 @@ async def refresh_jobs(
 @router.get("/{job_id}/gap-analysis", response_model=GapAnalysisResponse)
 async def get_gap_analysis(
     job_id: str,
+    background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service),
+    job_repository: AsyncJobRepository = Depends(get_async_job_repository),
+    resume_repository: AsyncResumeRepository = Depends(get_async_resume_repository),
 ):
     logger.info("gap_analysis_request", user_id=user_id, job_id=job_id)
 
+    resume = await resume_repository.find_by_user_id(user_id)
+    if resume is None:
+        raise HTTPException(status_code=404, detail=f"No resume found for user {user_id}")
+
+    job = await job_repository.find_by_id(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
     try:
-        gap_result = job_service.get_gap_analysis(user_id, job_id)
-        job = job_service.get_job_by_id(job_id)
+        # INFO: The analysis may read the stored result or call the LLM, both sync
+        report = await run_in_threadpool(
+            job_service.analyze_gap,
+            resume,
+            job,
+            request_narrative=settings.GAP_NARRATIVE_ENABLED,
+        )
+        gap_result = report.result
+
+        # INFO: Skill matching is deterministic, only the narrative waits on the LLM
+        if report.queue_narrative:
+            background_tasks.add_task(job_service.narrate_gap_analysis, user_id, job_id)
 
         return GapAnalysisResponse(
-            job_id=job.id,
-            job_title=job.title,
+            job_id=report.job_id,
+            job_title=report.job_title,
             matching_skills=gap_result.matching_skills,
             missing_skills=[
                 SkillGapDetail(
@@ -137,21 +200,22 @@ async def get_gap_analysis(
 @router.get("/{job_id}/skills", response_model=JobSkills)
 async def get_job_skills(
     job_id: str,
-    job_service: JobService = Depends(get_job_service),
+    job_repository: AsyncJobRepository = Depends(get_async_job_repository),
 ):
     logger.info("job_skills_request", job_id=job_id)
 
-    try:
-        job = job_service.get_job_by_id(job_id)
+    jobs = await job_repository.find_summaries_by_ids([job_id])
+    if not jobs:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-        if not job.has_extracted_skills():
-            raise HTTPException(
-                status_code=404,
-                detail="Skills not yet extracted for this job.Try refreshing jobs.",
-            )
-        return _extract_skills(job)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    job = jobs[0]
+
+    if not job.has_extracted_skills():
+        raise HTTPException(
+            status_code=404,
+            detail="Skills not yet extracted for this job.Try refreshing jobs.",
+        )
+    return _extract_skills(job)
 
 
 def _to_job_detail(job: Job) -> JobDetail:
@@ -169,7 +233,20 @@ def _to_job_detail(job: Job) -> JobDetail:
     )
 
 
-def _extract_skills(job: Job) -> JobSkills:
+def _to_job_summary(job: job_model.JobSummary) -> JobSummary:
+    return JobSummary(
+        id=job.id,
+        title=job.title,
+        company=job.company,
+        url=job.url,
+        location=job.location,
+        salary=job.salary,
+        source=job.source,
+        posted_at=job.posted_at,
+    )
+
+
+def _extract_skills(job: job_model.JobSummary) -> JobSkills:
     from app.api.schemas import JobSkills
 
     return JobSkills(
@@ -1,9 +1,17 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
-
-from app.api.dependencies import get_current_user, get_resume_service
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.dependencies import (
+    get_async_resume_repository,
+    get_current_user,
+    get_job_service,
+    get_resume_service,
+)
 from app.api.schemas import ResumeDetail, ResumeUploadResponse
+from app.domain.ports.repositories import AsyncResumeRepository
+from app.domain.services.job_service import JobService
 from app.domain.services.resume_service import ResumeService
 from app.infrastructure.logging import get_logger
 
@@ -17,6 +25,7 @@ async def upload_resume(
     file: UploadFile = File(...),
     user_id: str = Depends(get_current_user),
     resume_service: ResumeService = Depends(get_resume_service),
+    job_service: JobService = Depends(get_job_service),
 ) -> ResumeUploadResponse:
     logger.info("resume_upload_request", user_id=user_id, filename=file.filename)
 
@@ -24,8 +33,10 @@ async def upload_resume(
     pdf_bytes = await _read_file(file)
 
     try:
-        resume = resume_service.process_resume_upload(user_id, pdf_bytes)
+        # INFO: PDF parsing and the sync repository would otherwise block the event loop
+        resume = await run_in_threadpool(resume_service.process_resume_upload, user_id, pdf_bytes)
         background_tasks.add_task(resume_service.generate_and_store_embedding, resume)
+        background_tasks.add_task(job_service.materialize_matches, user_id)
 
         return ResumeUploadResponse(
             id=resume.id,
@@ -40,20 +51,19 @@ async def upload_resume(
 @router.get("", response_model=ResumeDetail)
 async def get_resume(
     user_id: str = Depends(get_current_user),
-    resume_service: ResumeService = Depends(get_resume_service),
+    resume_repository: AsyncResumeRepository = Depends(get_async_resume_repository),
 ) -> ResumeDetail:
-    try:
-        resume = resume_service.get_user_resume(user_id)
-
-        return ResumeDetail(
-            id=resume.id,
-            user_id=resume.user_id,
-            file_path=resume.file_path,
-            text_preview=resume.text[:500],
-            uploaded_at=datetime.now(timezone.utc),
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    resume = await resume_repository.find_summary_by_user_id(user_id)
+    if resume is None:
+        raise HTTPException(status_code=404, detail=f"No resume found for user {user_id}")
+
+    return ResumeDetail(
+        id=resume.id,
+        user_id=resume.user_id,
+        file_path=resume.file_path,
+        text_preview=resume.text_preview,
+        uploaded_at=resume.uploaded_at,
+    )
 
 
 def _validate_file(file: UploadFile) -> None:
@@ -39,12 +39,25 @@ class JobDetail(BaseModel):
     fetched_at: datetime | None = None
 
 
+class JobSummary(BaseModel):
+    """List representation of a job, fetch JobDetail for the description."""
+
+    id: str
+    title: str
+    company: str
+    url: str
+    location: str | None = None
+    salary: str | None = None
+    source: str
+    posted_at: datetime | None = None
+
+
 class JobWithSkills(JobDetail):
     skills: JobSkills | None = None
 
 
 class JobMatchResult(BaseModel):
-    job: JobDetail
+    job: JobSummary
     similarity_score: float = Field(..., ge=0.0, le=1.0, description="Vector similarity score")
     skill_match_score: float = Field(..., ge=0.0, le=1.0, description="Skill overlap score")
     combined_score: float = Field(..., ge=0.0, le=1.0, description="Weighted combined score")
@@ -54,6 +67,7 @@ class JobSearchResponse(BaseModel):
     matches: list[JobMatchResult]
     total: int
     resume_id: str
+    next_cursor: str | None = Field(default=None, description="Pass back to fetch the next page")
 
 
 class GapAnalysis(BaseModel):
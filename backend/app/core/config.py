@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +8,13 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Async driver URL for the async engine, derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: str | None = None
+    # Per engine, the sync and async engines each keep their own pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 3600
 
     # Pinecone
     PINECONE_API_KEY: str
@@ -17,16 +26,76 @@ class Settings(BaseSettings):
     ADZUNA_API_KEY: str
     ADZUNA_COUNTRY: str = "ca"
     REMOTEOK_API_URL: str
+    # Per HTTP call, and for every source fetch of one refresh run together
+    JOB_SOURCE_TIMEOUT_SECONDS: float = 30.0
+    JOB_SOURCE_FETCH_DEADLINE_SECONDS: float = 600.0
 
     # LLM
     LLM_ENDPOINT: str
+    LLM_TIMEOUT: int = 60
+    GAP_ANALYSIS_VERSION: str = "v1"
+    GAP_ENGINE_ENABLED: bool = True
+    GAP_FUZZY_MATCH_THRESHOLD: float = 0.8
+    GAP_NARRATIVE_ENABLED: bool = True
+    # A queued narrative that has not landed after this long may be queued again
+    GAP_NARRATIVE_LEASE_SECONDS: int = 300
+    SKILL_DICTIONARY_PATH: str | None = None
     EMBEDDING_MODEL: str
+    # Load the resources registered as eager (embedding model, LLM client) at API startup
+    PRELOAD_RESOURCES: bool = True
 
     # Auth
     AUTH_STUB_USER_ID: str
 
     # Scheduler
     JOB_REFRESH_CRON: str
+    JOB_REFRESH_MAX_RUNTIME_SECONDS: int = 3600
+    JOB_REFRESH_LOCK_KEY: int = 7_331_001
+    # JSON list of {"query", "location", "limit"} entries refreshed together
+    JOB_REFRESH_PLAN: list[dict[str, Any]] = [
+        {"query": "software engineer", "location": None, "limit": 50}
+    ]
+    JOB_REFRESH_MIN_INTERVAL_SECONDS: int = 3600
+    JOB_REFRESH_MAX_INTERVAL_SECONDS: int = 7 * 86400
+
+    # Ingest queue
+    INGEST_POLL_SECONDS: int = 60
+    INGEST_BATCH_SIZE: int = 20
+    INGEST_MAX_ATTEMPTS: int = 5
+
+    # Interview sessions
+    INTERVIEW_SESSION_CACHE_SIZE: int = 1024
+    INTERVIEW_PREFETCH_WORKERS: int = 4
+    # "incremental" (one LLM call per question) or "batch" (whole set at start)
+    INTERVIEW_QUESTION_MODE: str = "incremental"
+
+    # Job matching
+    MATCH_SIMILARITY_WEIGHT: float = 0.7
+    MATCH_SKILL_WEIGHT: float = 0.3
+    # "vector" (embedding search only) or "hybrid" (fused with an in-process BM25 index)
+    JOB_RETRIEVAL_MODE: str = "vector"
+    HYBRID_RRF_K: int = 60
+    # Seconds between BM25 index catch-ups from the database, a catalog version bump forces one
+    LEXICAL_INDEX_SYNC_SECONDS: float = 60.0
+    JOB_SEARCH_CURSOR_TTL_SECONDS: float = 300.0
+    # "memory" (per process) or "redis" (shared by every worker, needs SEARCH_CACHE_REDIS_URL)
+    SEARCH_CACHE_BACKEND: str = "memory"
+    SEARCH_CACHE_REDIS_URL: str | None = None
+    SEARCH_CACHE_SIZE: int = 2048
+    SEARCH_CACHE_TTL_SECONDS: float = 600.0
+    # Precomputed per-resume top-N match lists, search falls back to on-demand ranking without one
+    MATCH_LIST_ENABLED: bool = True
+    MATCH_LIST_SIZE: int = 200
+    # Resume rows scored per block when new jobs are matched against every resume
+    BATCH_SCORE_BLOCK_SIZE: int = 8192
+    # Local directory for the memory-mapped resume snapshot, unset scores from the database
+    RESUME_MATRIX_DIR: str | None = None
+    RESUME_MATRIX_REBUILD_MINUTES: int = 60
+
+    # Question bank
+    QUESTION_BANK_ENABLED: bool = True
+    QUESTION_BANK_MIN_STOCK: int = 5
+    QUESTION_BANK_SIMILARITY_THRESHOLD: float = 0.6
 
     # Storage
     STORAGE_BUCKET: str
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from app.domain.ports.llm_port import GapAnalysisResult
+
+
+@dataclass
+class GapAnalysisReport:
+    """A gap analysis of one job plus whether this request should queue its LLM narrative."""
+
+    job_id: str
+    job_title: str
+    result: GapAnalysisResult
+    queue_narrative: bool = False
@@ -0,0 +1,27 @@
+import enum
+from dataclasses import dataclass
+from typing import Any
+
+
+class IngestStage(str, enum.Enum):
+    EXTRACT = "extract"
+    EMBED = "embed"
+    UPSERT = "upsert"
+
+
+class IngestTaskStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestTask:
+    """A unit of durable ingest work for one job at one pipeline stage."""
+
+    id: str
+    job_id: str
+    stage: IngestStage
+    attempts: int
+    payload: dict[str, Any] | None = None
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+
+class InterviewSession:
+    def __init__(
+        self,
+        id: str,
+        user_id: str,
+        job_id: str,
+        state: dict,
+        created_at: datetime,
+        completed_at: datetime | None = None,
+        version: int = 0,
+    ) -> None:
+        self.id = id
+        self.user_id = user_id
+        self.job_id = job_id
+        self.state = state
+        self.created_at = created_at
+        self.completed_at = completed_at
+        # INFO: Version of the stored row this state is based on, 0 when never stored
+        self.version = version
+
+    @property
+    def is_completed(self) -> bool:
+        return self.state["status"] == "completed"
+
+    @property
+    def current_question(self) -> dict | None:
+        questions = self.state.get("questions", [])
+        idx = self.state.get("current_question_index", 0)
+
+        if 0 <= idx < len(questions):
+            return questions[idx]
+
+        return None
+
+    @property
+    def overall_score(self) -> float | None:
+        return self.state.get("overall_score")
+
+    @property
+    def final_feedback(self) -> str | None:
+        return self.state.get("final_feedback")
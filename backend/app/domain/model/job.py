@@ -1,18 +1,31 @@
+import hashlib
+import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
+_SALARY_AMOUNT = re.compile(r"\d[\d,]*")
+
+
+def location_terms(location: str | None) -> list[str]:
+    """Lowercased comma-separated parts, "London, UK" -> ["london", "uk"]."""
+    if not location:
+        return []
+    return [part.strip().lower() for part in location.split(",") if part.strip()]
+
 
 @dataclass
-class Job:
-    """Domain model for job posting."""
+class JobSummary:
+    """
+    Job posting without its description, enough for list views and ranking.
+    Read from storage without loading the description column.
+    """
 
     id: str
     external_id: str
     source: str
     title: str
     company: str
-    description: str
     url: str
     pinecone_id: str
     location: str | None = None
@@ -24,6 +37,29 @@ class Job:
     tech_stack: list[str] | None = None
     seniority_level: str | None = None
 
+    def has_extracted_skills(self) -> bool:
+        return self.required_skills is not None
+
+    def salary_ceiling(self) -> int | None:
+        """Highest amount in the formatted salary ("$60,000 - $80,000" -> 80000)."""
+        if not self.salary:
+            return None
+
+        amounts = [int(amount.replace(",", "")) for amount in _SALARY_AMOUNT.findall(self.salary)]
+        return max(amounts) if amounts else None
+
+    def dedup_hash(self) -> str:
+        """Identity of a posting across sources and refresh runs."""
+        normalized = f"{self.title.lower()}|{self.company.lower()}|{(self.location or '').lower()}"
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+@dataclass(kw_only=True)
+class Job(JobSummary):
+    """Domain model for job posting."""
+
+    description: str
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -43,19 +79,52 @@ class Job:
             "seniority_level": self.seniority_level,
         }
 
-    def has_extracted_skills(self) -> bool:
-        return self.required_skills is not None
-
 
 @dataclass
 class JobMatch:
     """Represents a job matched to a resume with similarity score."""
 
-    job: Job
+    job: JobSummary
     similarity_score: float
     skill_match_score: float
+    # INFO: Set by the ranking core, which weighs all candidates at once
+    score: float | None = None
 
     @property
     def combined_score(self) -> float:
         """Weighted combination of similarity and skill match."""
+        if self.score is not None:
+            return self.score
         return (0.7 * self.similarity_score) + (0.3 * self.skill_match_score)
+
+
+@dataclass
+class JobSearchPage:
+    """One page of ranked job matches."""
+
+    matches: list[JobMatch]
+    total: int
+    resume_id: str
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class JobSearchFilters:
+    """Structured search constraints, applied inside the indexes rather than after top_k."""
+
+    location: str | None = None
+    min_salary: int | None = None
+    sources: tuple[str, ...] = ()
+    seniority_levels: tuple[str, ...] = ()
+    posted_within_days: int | None = None
+
+    def is_empty(self) -> bool:
+        return self == JobSearchFilters()
+
+    def location_terms(self) -> list[str]:
+        return location_terms(self.location)
+
+    def posted_after(self, now: datetime) -> datetime | None:
+        if self.posted_within_days is None:
+            return None
+        return now - timedelta(days=self.posted_within_days)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+@dataclass
+class BankedQuestion:
+    """A reusable interview question for a normalized topic and difficulty."""
+
+    id: str
+    topic: str
+    difficulty: str
+    text: str
+    job_family_embedding: list[float] | None = None
+    times_served: int = 0
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True)
+class RefreshQuery:
+    """One entry of the job refresh plan."""
+
+    query: str
+    location: str | None = None
+    limit: int = 50
+
+
+@dataclass
+class RefreshSchedule:
+    """Adaptive cadence for a refresh query, driven by how many new jobs it yields."""
+
+    query: str
+    location: str | None
+    interval_seconds: int
+    next_run_at: datetime | None = None
+    last_run_at: datetime | None = None
+    last_new_count: int = 0
+
+    def is_due(self, now: datetime) -> bool:
+        return self.next_run_at is None or self.next_run_at <= now
+
+    def record_run(
+        self,
+        new_count: int,
+        limit: int,
+        now: datetime,
+        min_interval_seconds: int,
+        max_interval_seconds: int,
+    ) -> None:
+        """
+        Back off queries that yield nothing and speed up queries that fill
+        most of their limit (postings are likely being missed between runs).
+        """
+        if new_count == 0:
+            interval = self.interval_seconds * 2
+        elif new_count >= limit // 2:
+            interval = self.interval_seconds // 2
+        else:
+            interval = self.interval_seconds
+
+        self.interval_seconds = max(min_interval_seconds, min(max_interval_seconds, interval))
+        self.last_new_count = new_count
+        self.last_run_at = now
+        self.next_run_at = now + timedelta(seconds=self.interval_seconds)
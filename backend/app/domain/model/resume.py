@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 
-from app.domain.model.job import Job
+from app.domain.model.job import JobSummary
+from app.domain.skills.extractor import get_skill_extractor
+from app.domain.skills.taxonomy import get_skill_taxonomy
 
 
 @dataclass
@@ -13,54 +16,38 @@ class Resume:
     file_path: str
     pinecone_id: str
 
+    _skills: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+
     def extract_skills(self) -> list[str]:
         """
-        Extract skills from resume text.
+        Extract canonical skill names from resume text, in order of appearance.
         """
+        if self._skills is None:
+            self._skills = get_skill_extractor().extract(self.text)
+        return list(self._skills)
 
-        # HACK: Placeholder - will enhance in Phase 2 with LLM
-        keywords = [
-            "python",
-            "javascript",
-            "typescript",
-            "react",
-            "node",
-            "sql",
-            "postgresql",
-            "docker",
-            "kubernetes",
-            "aws",
-            "gcp",
-            "azure",
-            "fastapi",
-            "django",
-            "flask",
-            "vue",
-            "angular",
-            "java",
-            "go",
-            "rust",
-            "c++",
-            "machine learning",
-            "deep learning",
-            "llm",
-        ]
-
-        text_lower = self.text.lower()
-        found_skills = [skill for skill in keywords if skill in text_lower]
-        return list(set(found_skills))
-
-    def matches_job(self, job: Job) -> float:
+    def matches_job(self, job: JobSummary) -> float:
         """
         Calculates basic match score between resume and job.
         Returns score between 0.0 and 1.0.
         """
-        # HACK: Simple implementation - will enhance to use vector similarity
         resume_skills = set(self.extract_skills())
-        job_skills = set(job.required_skills or [])
+        job_skills = set(get_skill_taxonomy().canonicalize_all(job.required_skills or []))
 
         if not job_skills:
             return 0.0
 
         matching_skills = resume_skills.intersection(job_skills)
         return len(matching_skills) / len(job_skills)
+
+
+@dataclass
+class ResumeSummary:
+    """Resume metadata with a preview of the text instead of the full extracted text."""
+
+    id: str
+    user_id: str
+    file_path: str
+    pinecone_id: str
+    uploaded_at: datetime
+    text_preview: str
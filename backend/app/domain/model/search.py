@@ -0,0 +1,55 @@
+import uuid
+from dataclasses import dataclass, field
+
+from app.domain.model.job import JobMatch
+
+
+@dataclass
+class RankedSearch:
+    """A user's full ranked result list, kept so later pages skip the vector search."""
+
+    user_id: str
+    resume_id: str
+    top_k: int
+    job_ids: list[str]
+    similarity_scores: list[float]
+    skill_match_scores: list[float]
+    scores: list[float]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @classmethod
+    def from_matches(
+        cls, user_id: str, resume_id: str, top_k: int, matches: list[JobMatch]
+    ) -> "RankedSearch":
+        return cls(
+            user_id=user_id,
+            resume_id=resume_id,
+            top_k=top_k,
+            job_ids=[match.job.id for match in matches],
+            similarity_scores=[match.similarity_score for match in matches],
+            skill_match_scores=[match.skill_match_score for match in matches],
+            scores=[match.combined_score for match in matches],
+        )
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+
+@dataclass
+class ResumeVector:
+    """Embedding and skills of a user's active resume, used for batch matching."""
+
+    user_id: str
+    resume_id: str
+    embedding: list[float]
+    skills: list[str]
+
+
+@dataclass
+class MaterializedMatch:
+    """One precomputed entry of a resume's top-N job list."""
+
+    job_id: str
+    similarity_score: float
+    skill_match_score: float
+    score: float
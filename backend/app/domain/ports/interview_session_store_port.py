@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from app.domain.model.interview import InterviewSession
+
+
+class InterviewSessionStore(ABC):
+    """Port for interview session state shared across requests and workers."""
+
+    @abstractmethod
+    def get(self, session_id: str) -> InterviewSession | None: ...
+
+    @abstractmethod
+    def put(self, session: InterviewSession) -> None:
+        """
+        Persist the latest state of a session before returning. Raises
+        SessionConflictError if the session changed since it was read.
+        """
+        ...
+
+
+class SessionConflictError(Exception):
+    """Raised when a session was written by someone else since it was read."""
+
+    def __init__(self, session_id: str) -> None:
+        super().__init__(f"Interview session {session_id} was updated concurrently")
+        self.session_id = session_id
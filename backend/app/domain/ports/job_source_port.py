@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 
@@ -11,9 +12,11 @@ class JobSourcePort(ABC):
         query: str = "software engineer",
         location: str | None = None,
         limit: int = 50,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch jobs from external source.
+        When since is given, only postings at or after that time are returned.
 
         Returns list of raw job data:
         [
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from app.domain.model.job import Job, JobSearchFilters
+
+
+class LexicalIndexPort(ABC):
+    """Port for keyword (inverted index) search over job postings."""
+
+    @abstractmethod
+    def index_jobs(self, jobs: list[Job]) -> None:
+        """Add jobs to the index, replacing earlier versions of the same job ids."""
+        ...
+
+    @abstractmethod
+    def search(
+        self, text: str, top_k: int = 50, filters: JobSearchFilters | None = None
+    ) -> list[tuple[str, float]]:
+        """(job_id, score) of the best keyword matches for text among jobs passing filters."""
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of jobs currently searchable."""
+        ...
@@ -36,6 +36,8 @@ class GapAnalysisResult:
     overall_match_score: float
     summary: str
     recommendations: list[str]
+    # INFO: False while summary/recommendations are the deterministic placeholders
+    narrated: bool = True
 
 
 class LLMPort(ABC):
@@ -98,6 +100,29 @@ class LLMPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def write_gap_narrative(
+        self,
+        job_description: str,
+        matching_skills: list[str],
+        missing_skills: list[str],
+    ) -> tuple[str, list[str]]:
+        """
+        Write the narrative part of an already computed gap analysis.
+
+        Args:
+            job_description: Job description text for context
+            matching_skills: Skills the resume covers
+            missing_skills: Required skills the resume lacks
+
+        Returns:
+            (summary, recommendations)
+
+        Raises:
+            LLMError: If generation fails
+        """
+        ...
+
     @abstractmethod
     def generate_interview_question(
         self,
@@ -124,6 +149,46 @@ class LLMPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def generate_interview_question_set(
+        self,
+        job_description: str,
+        topics: list[tuple[str, str]],
+    ) -> list[str]:
+        """
+        Generate a whole interview question set in a single call.
+
+        Args:
+            job_description: Job description for context
+            topics: (topic, difficulty) for each question, in order
+
+        Returns:
+            Question texts in the same order as topics. May be shorter than
+            topics if the model returned fewer questions.
+
+        Raises:
+            LLMError: If generation fails
+        """
+        ...
+
+    @abstractmethod
+    def evaluate_interview_answer(self, question: str, answer: str, topic: str) -> dict:
+        """
+        Score a candidate's answer to an interview question.
+
+        Args:
+            question: Question text that was asked
+            answer: Candidate's answer text
+            topic: Skill or topic area the question covers
+
+        Returns:
+            Dict with "score" (0-10) and "feedback"
+
+        Raises:
+            LLMError: If evaluation fails
+        """
+        ...
+
 
 class LLMError(Exception):
     ...
@@ -1,7 +1,16 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
 
-from app.domain.model.job import Job
-from app.domain.model.resume import Resume
+from app.domain.model.ingest import IngestStage, IngestTask
+from app.domain.model.interview import InterviewSession
+from app.domain.model.job import Job, JobSummary
+from app.domain.model.question_bank import BankedQuestion
+from app.domain.model.refresh import RefreshSchedule
+from app.domain.model.resume import Resume, ResumeSummary
+from app.domain.model.search import MaterializedMatch, ResumeVector
+from app.domain.ports.llm_port import GapAnalysisResult
 
 
 class ResumeRepository(ABC):
@@ -19,11 +28,44 @@ class ResumeRepository(ABC):
     def find_by_user_id(self, user_id: str) -> Resume | None:
         ...
 
+    @abstractmethod
+    def find_summary_by_user_id(
+        self, user_id: str, preview_length: int = 500
+    ) -> ResumeSummary | None:
+        """Latest resume of the user without loading its full extracted text."""
+        ...
+
     @abstractmethod
     def delete(self, resume_id: str) -> bool:
         ...
 
 
+class AsyncResumeRepository(ABC):
+    """Port for resume persistence awaited from async request handlers."""
+
+    @abstractmethod
+    async def save(self, resume: Resume) -> Resume:
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, resume_id: str) -> Resume | None:
+        ...
+
+    @abstractmethod
+    async def find_by_user_id(self, user_id: str) -> Resume | None:
+        ...
+
+    @abstractmethod
+    async def find_summary_by_user_id(
+        self, user_id: str, preview_length: int = 500
+    ) -> ResumeSummary | None:
+        ...
+
+    @abstractmethod
+    async def delete(self, resume_id: str) -> bool:
+        ...
+
+
 class JobRepository(ABC):
     """Port for job persistence."""
 
@@ -39,10 +81,260 @@ class JobRepository(ABC):
     def find_by_id(self, job_id: str) -> Job | None:
         ...
 
+    @abstractmethod
+    def find_by_ids(self, job_ids: list[str]) -> list[Job]:
+        """Return the stored jobs among job_ids, in the order given."""
+        ...
+
+    @abstractmethod
+    def find_summaries_by_ids(self, job_ids: list[str]) -> list[JobSummary]:
+        """Like find_by_ids without loading descriptions, for list views and ranking."""
+        ...
+
     @abstractmethod
     def find_all(self, limit: int = 100, offset: int = 0) -> list[Job]:
         ...
 
+    @abstractmethod
+    def find_updated_after(
+        self, updated_after: datetime, limit: int = 1000, offset: int = 0
+    ) -> list[Job]:
+        """Jobs saved after updated_after, oldest change first."""
+        ...
+
     @abstractmethod
     def exists_by_dedup_hash(self, dedup_hash: str) -> bool:
         ...
+
+    @abstractmethod
+    def find_existing_dedup_hashes(self, dedup_hashes: list[str]) -> set[str]:
+        """Return the subset of dedup_hashes already stored."""
+        ...
+
+
+class AsyncJobRepository(ABC):
+    """Port for job persistence awaited from async request handlers."""
+
+    @abstractmethod
+    async def save(self, job: Job) -> Job:
+        ...
+
+    @abstractmethod
+    async def bulk_save(self, jobs: list[Job]) -> list[Job]:
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, job_id: str) -> Job | None:
+        ...
+
+    @abstractmethod
+    async def find_by_ids(self, job_ids: list[str]) -> list[Job]:
+        """Return the stored jobs among job_ids, in the order given."""
+        ...
+
+    @abstractmethod
+    async def find_summaries_by_ids(self, job_ids: list[str]) -> list[JobSummary]:
+        ...
+
+    @abstractmethod
+    async def find_all(self, limit: int = 100, offset: int = 0) -> list[Job]:
+        ...
+
+    @abstractmethod
+    async def exists_by_dedup_hash(self, dedup_hash: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def find_existing_dedup_hashes(self, dedup_hashes: list[str]) -> set[str]:
+        ...
+
+
+class RefreshStateRepository(ABC):
+    """Port for incremental job refresh bookkeeping."""
+
+    @abstractmethod
+    def get_watermark(self, source: str, query: str, location: str | None) -> datetime | None:
+        """Return the newest posted_at already ingested for this source and query."""
+        ...
+
+    @abstractmethod
+    def save_watermark(
+        self, source: str, query: str, location: str | None, posted_at: datetime
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def get_schedule(self, query: str, location: str | None) -> RefreshSchedule | None:
+        ...
+
+    @abstractmethod
+    def save_schedule(self, schedule: RefreshSchedule) -> None:
+        ...
+
+
+class IngestTaskRepository(ABC):
+    """Port for the durable ingest work queue."""
+
+    @abstractmethod
+    def enqueue(
+        self,
+        job_ids: list[str],
+        stage: IngestStage,
+        payloads: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def claim_batch(
+        self, stage: IngestStage, limit: int, lease_seconds: int, max_attempts: int
+    ) -> list[IngestTask]:
+        """
+        Atomically claim up to limit runnable tasks for this stage. Tasks whose
+        lease expired (crashed worker) are claimable again until they used
+        max_attempts, then they are marked failed. Concurrent workers never
+        receive the same task.
+        """
+        ...
+
+    @abstractmethod
+    def complete(self, task_ids: list[str]) -> None:
+        ...
+
+    @abstractmethod
+    def advance(
+        self,
+        task_ids: list[str],
+        job_ids: list[str],
+        stage: IngestStage,
+        payloads: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Complete task_ids and enqueue job_ids for the next stage in one transaction."""
+        ...
+
+    @abstractmethod
+    def retry(self, task_id: str, error: str, available_at: datetime) -> None:
+        ...
+
+    @abstractmethod
+    def fail(self, task_id: str, error: str) -> None:
+        ...
+
+
+class InterviewSessionRepository(ABC):
+    """Port for interview session persistence."""
+
+    @abstractmethod
+    def find_by_id(self, session_id: str) -> InterviewSession | None:
+        ...
+
+    @abstractmethod
+    def find_version(self, session_id: str) -> int | None:
+        ...
+
+    @abstractmethod
+    def insert(self, session: InterviewSession) -> None:
+        """Store a new session and set its version."""
+        ...
+
+    @abstractmethod
+    def save_all(self, sessions: list[InterviewSession]) -> list[str]:
+        """
+        Update sessions in a single transaction, each only if the stored row is
+        still at the session's version. Applied sessions get the new version,
+        the ids of the stale ones are returned.
+        """
+        ...
+
+
+class QuestionBankRepository(ABC):
+    """Port for the shared interview question bank."""
+
+    @abstractmethod
+    def find_by_topic(self, topic: str, difficulty: str, limit: int) -> list[BankedQuestion]:
+        """Least served questions first."""
+        ...
+
+    @abstractmethod
+    def add(self, question: BankedQuestion) -> None:
+        ...
+
+    @abstractmethod
+    def mark_served(self, question_id: str) -> None:
+        ...
+
+
+class GapAnalysisRepository(ABC):
+    """Port for persisted gap analysis results."""
+
+    @abstractmethod
+    def find(self, resume_id: str, job_id: str, version: str) -> GapAnalysisResult | None:
+        ...
+
+    @abstractmethod
+    def save(
+        self,
+        user_id: str,
+        resume_id: str,
+        job_id: str,
+        version: str,
+        result: GapAnalysisResult,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def claim_narration(
+        self, resume_id: str, job_id: str, version: str, lease_seconds: int
+    ) -> bool:
+        """
+        Mark a stored analysis as having its narrative queued. Returns False when
+        it is missing or another claim was made within lease_seconds.
+        """
+        ...
+
+    @abstractmethod
+    def delete_by_user_id(self, user_id: str) -> int:
+        """Drop every stored analysis for a user. Returns the number removed."""
+        ...
+
+
+class MatchListRepository(ABC):
+    """Port for materialized per-resume top-N job match lists."""
+
+    @abstractmethod
+    def save_resume_vector(self, vector: ResumeVector) -> None:
+        """Record the user's active resume, replacing any previous one."""
+        ...
+
+    @abstractmethod
+    def find_resume_vectors(self, updated_after: datetime | None = None) -> list[ResumeVector]:
+        """Active resume of every user, or only those saved after updated_after."""
+        ...
+
+    @abstractmethod
+    def iter_resume_vectors(self, batch_size: int = 1000) -> Iterator[ResumeVector]:
+        """Stream every active resume without loading them all at once."""
+        ...
+
+    @abstractmethod
+    def replace_matches(
+        self, user_id: str, resume_id: str, matches: list[MaterializedMatch]
+    ) -> None:
+        """Rewrite the resume's list and drop lists of the user's older resumes."""
+        ...
+
+    @abstractmethod
+    def find_score_floors(self, resume_ids: list[str], top_n: int) -> dict[str, float]:
+        """Lowest stored score of every resume whose list already holds top_n entries."""
+        ...
+
+    @abstractmethod
+    def merge_matches(self, matches: dict[str, list[MaterializedMatch]], top_n: int) -> None:
+        """Upsert new matches per resume id and trim each list back to top_n."""
+        ...
+
+    @abstractmethod
+    def find_matches_for_user(
+        self, user_id: str, limit: int
+    ) -> tuple[str, list[MaterializedMatch]] | None:
+        """(resume_id, best matches first) for the user's active resume, if materialized."""
+        ...
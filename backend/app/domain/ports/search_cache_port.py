@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+from app.domain.model.search import RankedSearch
+
+
+class SearchResultCache(ABC):
+    """
+    Port for cached job search rankings, keyed by (resume_id, top_k,
+    catalog_version). Implementations treat backend failures as misses.
+    """
+
+    @abstractmethod
+    def get_resume_id(self, user_id: str) -> str | None:
+        """The resume a user's cached searches were ranked for."""
+        ...
+
+    @abstractmethod
+    def set_resume_id(self, user_id: str, resume_id: str) -> None: ...
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget the user's resume so their next search ranks afresh."""
+        ...
+
+    @abstractmethod
+    def get(self, resume_id: str, top_k: int, catalog_version: int) -> RankedSearch | None: ...
+
+    @abstractmethod
+    def put(self, ranked: RankedSearch, catalog_version: int) -> None: ...
+
+    @abstractmethod
+    def catalog_version(self) -> int: ...
+
+    @abstractmethod
+    def bump_catalog_version(self) -> int:
+        """Invalidate every cached ranking after the job catalog changed."""
+        ...
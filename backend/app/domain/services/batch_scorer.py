@@ -0,0 +1,91 @@
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.domain.model.job import JobSummary
+from app.domain.services.ranking import (
+    DEFAULT_SIMILARITY_WEIGHT,
+    DEFAULT_SKILL_WEIGHT,
+    combine_scores,
+)
+from app.domain.services.resume_matrix import ResumeMatrix, normalize_rows
+from app.domain.skills.vocabulary import SkillVocabulary, get_skill_vocabulary, pack_skill_ids
+
+
+@dataclass
+class ScoreBlock:
+    """Scores of one block of resume rows against every job, shape (rows, jobs)."""
+
+    user_ids: list[str]
+    resume_ids: list[str]
+    similarity: np.ndarray
+    skill: np.ndarray
+    # INFO: Excluded rows score -inf so no floor or top-k ever selects them
+    scores: np.ndarray
+
+
+class BatchScorer:
+    """
+    Scores a batch of jobs against every resume (job -> resumes), one block
+    of resume rows at a time. Peak memory is bounded by block_size x jobs no
+    matter how many resumes there are, and with memory-mapped matrices only
+    the block being scored is paged in.
+    """
+
+    def __init__(
+        self,
+        skill_vocabulary: SkillVocabulary | None = None,
+        similarity_weight: float = DEFAULT_SIMILARITY_WEIGHT,
+        skill_weight: float = DEFAULT_SKILL_WEIGHT,
+        block_size: int = 8192,
+    ) -> None:
+        self.skill_vocabulary = skill_vocabulary or get_skill_vocabulary()
+        self.similarity_weight = similarity_weight
+        self.skill_weight = skill_weight
+        self.block_size = block_size
+
+    def iter_blocks(
+        self,
+        matrices: Sequence[ResumeMatrix],
+        jobs: list[JobSummary],
+        embeddings: list[list[float]],
+    ) -> Iterator[ScoreBlock]:
+        """Yield scores block by block over every row of every matrix."""
+        if not jobs:
+            return
+
+        vocabulary = self.skill_vocabulary
+        # INFO: Matrix skill ids are local to the matrix, map them onto the shared vocabulary
+        skill_maps = [
+            np.asarray([vocabulary.intern(name) for name in matrix.skill_names], dtype=np.int64)
+            for matrix in matrices
+        ]
+
+        job_matrix = normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        job_skills = vocabulary.encode_many([job.required_skills for job in jobs])
+        width = job_skills.bits.shape[1]
+
+        for matrix, skill_map in zip(matrices, skill_maps, strict=True):
+            for start in range(0, len(matrix), self.block_size):
+                stop = min(start + self.block_size, len(matrix))
+
+                similarity = np.asarray(matrix.embeddings[start:stop]) @ job_matrix.T
+
+                rows, skill_ids = matrix.row_skills(start, stop)
+                resume_bits = pack_skill_ids(rows, skill_map[skill_ids], (stop - start, width))
+                skill = job_skills.match_scores_many(resume_bits)
+
+                scores = combine_scores(
+                    similarity, skill, self.similarity_weight, self.skill_weight
+                )
+                if matrix.excluded is not None:
+                    scores[matrix.excluded[start:stop]] = -np.inf
+
+                yield ScoreBlock(
+                    user_ids=matrix.user_ids[start:stop],
+                    resume_ids=matrix.resume_ids[start:stop],
+                    similarity=similarity,
+                    skill=skill,
+                    scores=scores,
+                )
@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta, timezone
+from threading import Event
+from typing import Any
+
+from app.domain.model.ingest import IngestStage, IngestTask
+from app.domain.model.job import Job, location_terms
+from app.domain.ports.embedding_port import EmbeddingPort
+from app.domain.ports.repositories import IngestTaskRepository, JobRepository
+from app.domain.ports.search_cache_port import SearchResultCache
+from app.domain.ports.vector_db_port import VectorDBPort
+from app.domain.services.match_materializer import MatchMaterializer
+from app.domain.services.skill_extraction_service import SkillExtractionService
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class IngestService:
+    """
+    Drains the durable ingest queue. Every saved job goes through
+    extract (LLM skills) -> embed -> upsert (vector DB); failed tasks are
+    retried with exponential backoff and the queue survives restarts.
+    """
+
+    def __init__(
+        self,
+        task_repository: IngestTaskRepository,
+        job_repository: JobRepository,
+        skill_extraction_service: SkillExtractionService,
+        embedding_service: EmbeddingPort,
+        vector_db: VectorDBPort,
+        max_attempts: int = 5,
+        base_backoff_seconds: int = 30,
+        lease_seconds: int = 600,
+        search_result_cache: SearchResultCache | None = None,
+        match_materializer: MatchMaterializer | None = None,
+    ) -> None:
+        self.task_repository = task_repository
+        self.job_repository = job_repository
+        self.skill_extraction_service = skill_extraction_service
+        self.embedding_service = embedding_service
+        self.vector_db = vector_db
+        self.max_attempts = max_attempts
+        self.base_backoff_seconds = base_backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.search_result_cache = search_result_cache
+        self.match_materializer = match_materializer
+
+    def enqueue_jobs(self, jobs: list[Job]) -> None:
+        self.task_repository.enqueue([job.id for job in jobs], IngestStage.EXTRACT)
+
+    def drain(self, batch_size: int = 20, stop_event: Event | None = None) -> int:
+        """Process batches of every stage until the queue is empty or stop_event is set."""
+        processed = 0
+
+        while stop_event is None or not stop_event.is_set():
+            batch_processed = sum(self.process_batch(stage, batch_size) for stage in IngestStage)
+            if batch_processed == 0:
+                break
+            processed += batch_processed
+
+        logger.info("ingest_queue_drained", processed=processed)
+        return processed
+
+    def process_batch(self, stage: IngestStage, batch_size: int) -> int:
+        tasks = self.task_repository.claim_batch(
+            stage, batch_size, self.lease_seconds, self.max_attempts
+        )
+        if not tasks:
+            return 0
+
+        handlers = {
+            IngestStage.EXTRACT: self._process_extract,
+            IngestStage.EMBED: self._process_embed,
+            IngestStage.UPSERT: self._process_upsert,
+        }
+        handlers[stage](tasks)
+        return len(tasks)
+
+    def _process_extract(self, tasks: list[IngestTask]) -> None:
+        jobs_by_id = {job.id: job for job in self.job_repository.find_by_ids(self._job_ids(tasks))}
+
+        for task in tasks:
+            job = jobs_by_id.get(task.job_id)
+            if job is None:
+                logger.warning("ingest_job_missing", job_id=task.job_id, stage=task.stage.value)
+                self.task_repository.complete([task.id])
+                continue
+
+            try:
+                self.skill_extraction_service.update_job_with_skills(job)
+                self.job_repository.save(job)
+            except Exception as e:
+                logger.warning("skill_extraction_failed", job_id=job.id, error=str(e))
+                if task.attempts >= self.max_attempts:
+                    # INFO: Out of retries, still make the job searchable without skills. Enqueued
+                    # first, a crash before fail() leaves an exhausted lease that the claim fails.
+                    self.task_repository.enqueue([job.id], IngestStage.EMBED)
+                self._retry_or_fail(task, e)
+                continue
+
+            self.task_repository.advance([task.id], [job.id], IngestStage.EMBED)
+
+    def _process_embed(self, tasks: list[IngestTask]) -> None:
+        jobs = self.job_repository.find_by_ids(self._job_ids(tasks))
+        jobs_by_id = {job.id: job for job in jobs}
+
+        try:
+            embeddings = self._generate_embeddings_for_jobs(jobs)
+        except Exception as e:
+            logger.error("job_embedding_failed", count=len(jobs), error=str(e))
+            for task in tasks:
+                self._retry_or_fail(task, e)
+            return
+
+        # INFO: The vector rides in the UPSERT task payload (~8 KB of JSONB per job for a
+        # 384-dim model) so a failed upsert retries without re-embedding. complete() clears
+        # the payload, only pending and failed UPSERT rows keep it.
+        payloads = {
+            job.id: {
+                "vector_id": job.pinecone_id,
+                "embedding": embedding,
+                "metadata": self._vector_metadata(job),
+            }
+            for job, embedding in zip(jobs, embeddings, strict=True)
+        }
+
+        self.task_repository.advance(
+            [task.id for task in tasks], list(payloads.keys()), IngestStage.UPSERT, payloads
+        )
+
+        missing = [task.job_id for task in tasks if task.job_id not in jobs_by_id]
+        if missing:
+            logger.warning("ingest_jobs_missing", job_ids=missing, stage=IngestStage.EMBED.value)
+
+    def _process_upsert(self, tasks: list[IngestTask]) -> None:
+        completed: list[str] = []
+        upserted: dict[str, list[float]] = {}
+
+        for task in tasks:
+            payload = task.payload or {}
+
+            try:
+                self.vector_db.upsert_embedding(
+                    vector_id=payload["vector_id"],
+                    embedding=payload["embedding"],
+                    metadata=payload["metadata"],
+                )
+                completed.append(task.id)
+                upserted[task.job_id] = payload["embedding"]
+            except Exception as e:
+                logger.warning("vector_upsert_failed", job_id=task.job_id, error=str(e))
+                self._retry_or_fail(task, e)
+
+        self.task_repository.complete(completed)
+        logger.info("job_embeddings_generated", count=len(completed))
+
+        # INFO: Upserted jobs are now searchable, cached rankings no longer cover them
+        if completed and self.search_result_cache is not None:
+            self.search_result_cache.bump_catalog_version()
+
+        if upserted and self.match_materializer is not None:
+            self._update_match_lists(upserted)
+
+    def _update_match_lists(self, upserted: dict[str, list[float]]) -> None:
+        """Score only the newly searchable jobs against every active resume."""
+        try:
+            jobs = self.job_repository.find_summaries_by_ids(list(upserted))
+            self.match_materializer.score_new_jobs(jobs, [upserted[job.id] for job in jobs])
+        except Exception as e:
+            # INFO: Lists catch up on the next batch or resume upload, ingest must not stall
+            logger.error("match_list_update_failed", count=len(upserted), error=str(e))
+
+    def _generate_embeddings_for_jobs(self, jobs: list[Job]) -> list[list[float]]:
+        if not jobs:
+            return []
+
+        logger.info("generating_job_embeddings", count=len(jobs))
+
+        descriptions = [job.description for job in jobs]
+        return self.embedding_service.generate_embeddings_batch(descriptions)
+
+    def _vector_metadata(self, job: Job) -> dict[str, Any]:
+        """Search filter attributes are stored with the vector so filters run in the index."""
+        metadata: dict[str, Any] = {"type": "job", "job_id": job.id, "source": job.source}
+
+        # INFO: The vector DB rejects null metadata values, unknown attributes are left out
+        terms = location_terms(job.location)
+        if terms:
+            metadata["location_terms"] = terms
+        salary = job.salary_ceiling()
+        if salary is not None:
+            metadata["salary_max"] = salary
+        if job.seniority_level:
+            metadata["seniority_level"] = job.seniority_level.lower()
+        posted_at = job.posted_at or job.fetched_at
+        if posted_at is not None:
+            metadata["posted_at"] = int(posted_at.timestamp())
+
+        return metadata
+
+    def _retry_or_fail(self, task: IngestTask, error: Exception) -> bool:
+        """Schedule a retry with exponential backoff. Returns False once out of attempts."""
+        if task.attempts >= self.max_attempts:
+            self.task_repository.fail(task.id, str(error))
+            return False
+
+        delay = self.base_backoff_seconds * (2 ** (task.attempts - 1))
+        available_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        self.task_repository.retry(task.id, str(error), available_at)
+
+        logger.info(
+            "ingest_task_retry_scheduled",
+            task_id=task.id,
+            stage=task.stage.value,
+            attempts=task.attempts,
+            delay_seconds=delay,
+        )
+        return True
+
+    def _job_ids(self, tasks: list[IngestTask]) -> list[str]:
+        return [task.job_id for task in tasks]
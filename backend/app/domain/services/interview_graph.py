@@ -1,23 +1,40 @@
-from typing import TypedDict
+from typing import Annotated, TypedDict
 
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from app.domain.ports.llm_port import LLMPort
+from app.domain.services.question_bank_service import QuestionBankService
+from app.domain.services.question_prefetcher import PrefetchKey, QuestionPrefetcher
 from app.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+QUESTION_MODE_INCREMENTAL = "incremental"
+QUESTION_MODE_BATCH = "batch"
+
+_STATUS_PRIORITY = {"in_progress": 0, "completed": 1, "error": 2}
+
+
+def _merge_status(current: str, update: str) -> str:
+    """Reducer for status written by parallel nodes: error beats completed beats in_progress."""
+    if _STATUS_PRIORITY.get(update, -1) >= _STATUS_PRIORITY.get(current, -1):
+        return update
+    return current
+
+
 class InterviewState(TypedDict):
     """State schema for interview conversation."""
 
+    session_id: str
     job_id: str
     job_title: str
     job_description: str
     resume_text: str
     skill_gaps: list[str]  # Focus areas for questions
 
+    planned_questions: list[dict]  # [{text,topic,difficulty}], batch mode only
     questions: list[dict]  # [{text,topic,difficulty}]
     answers: list[dict]  # [{text,score,feedback}]
     current_question_index: int
@@ -26,129 +43,278 @@ class InterviewState(TypedDict):
     overall_score: float | None
     final_feedback: str | None
 
-    status: str  # "in_progress", "completed", "error"
+    status: Annotated[str, _merge_status]  # "in_progress", "completed", "error"
 
 
 class InterviewGraph:
-    """LangGraph-based interview state machine."""
+    """
+    LangGraph-based interview state machine.
+
+    Each invocation handles one turn. A submitted answer fans out to
+    evaluate_answer and generate_question, which run concurrently because the
+    topic schedule does not depend on the evaluation. Nodes return partial
+    updates so the parallel branches merge cleanly.
+
+    In batch mode the whole question set is generated by one LLM call when
+    the interview starts, and later turns only cost the evaluation.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMPort,
+        total_questions: int = 5,
+        question_prefetcher: QuestionPrefetcher | None = None,
+        question_mode: str = QUESTION_MODE_INCREMENTAL,
+        question_bank: QuestionBankService | None = None,
+    ):
+        if question_mode not in (QUESTION_MODE_INCREMENTAL, QUESTION_MODE_BATCH):
+            raise ValueError(f"Unknown interview question mode: {question_mode}")
 
-    def __init__(self, llm_service: LLMPort, total_questions: int = 5):
         self.llm_service = llm_service
         self.total_questions = total_questions
+        self.question_mode = question_mode
+        self.question_bank = question_bank
+        # INFO: Batch mode already has every question, prefetching would only add LLM calls
+        self.question_prefetcher = (
+            question_prefetcher if question_mode == QUESTION_MODE_INCREMENTAL else None
+        )
         self.graph: CompiledStateGraph = self._build_graph()
 
     def _build_graph(self) -> CompiledStateGraph:
         workflow = StateGraph(InterviewState)
 
+        workflow.add_node("plan_questions", self._plan_questions_node)
         workflow.add_node("generate_question", self._generate_question_node)
         workflow.add_node("evaluate_answer", self._evaluate_answer_node)
         workflow.add_node("calculate_final_score", self._calculate_final_score_node)
 
-        workflow.set_entry_point("generate_question")
-
-        workflow.add_conditional_edges(
-            "generate_question",
-            self._should_continue_after_question,
-            {"wait_for_answer": END, "complete": "calculate_final_score"},
+        workflow.set_conditional_entry_point(
+            self._route_turn,
+            ["plan_questions", "generate_question", "evaluate_answer", END],
         )
 
+        workflow.add_edge("plan_questions", "generate_question")
+        workflow.add_edge("generate_question", END)
         workflow.add_conditional_edges(
             "evaluate_answer",
-            self._should_continue_after_evaluation,
-            {
-                "next_question": "generate_question",
-                "complete": "calculate_final_score",
-            },
+            self._should_complete_after_evaluation,
+            {"wait_for_answer": END, "complete": "calculate_final_score"},
         )
-
         workflow.add_edge("calculate_final_score", END)
 
         return workflow.compile()
 
-    def _generate_question_node(self, state: InterviewState) -> InterviewState:
-        logger.info(
-            "generating_interview_question",
-            question_index=state["current_question_index"],
-        )
+    def _route_turn(self, state: InterviewState) -> list[str]:
+        if state["status"] != "in_progress":
+            return [END]
 
-        topic = self._get_next_topic(state)
-        difficulty = self._determine_difficulty(state)
+        if not state["questions"]:
+            if self.question_mode == QUESTION_MODE_BATCH and not state.get("planned_questions"):
+                return ["plan_questions"]
+            return ["generate_question"]
 
-        previous_questions = [q["text"] for q in state["questions"]]
+        if len(state["answers"]) <= state["current_question_index"]:
+            return [END]
+
+        # INFO: Both branches run in the same step, the turn costs max(evaluate, generate)
+        branches = ["evaluate_answer"]
+        if len(state["questions"]) < state["total_questions"]:
+            branches.append("generate_question")
+
+        return branches
+
+    def _plan_questions_node(self, state: InterviewState) -> dict:
+        schedule = [
+            (self._get_topic(state, idx), self._determine_difficulty(idx))
+            for idx in range(state["total_questions"])
+        ]
+
+        logger.info("planning_interview_questions", count=len(schedule))
 
         try:
-            question_text = self.llm_service.generate_interview_question(
+            texts = self.llm_service.generate_interview_question_set(
                 job_description=state["job_description"],
-                topic=topic,
-                difficulty=difficulty,
-                previous_question=previous_questions,
+                topics=schedule,
             )
+        except Exception as e:
+            # INFO: Not fatal, generate_question falls back to one call per question
+            logger.warning("interview_question_planning_failed", error=str(e))
+            return {"planned_questions": []}
 
-            state["questions"].append(
-                {
-                    "text": question_text,
-                    "topic": topic,
-                    "difficulty": difficulty,
-                }
-            )
+        # INFO: The LLM may return fewer questions than asked for, the rest are generated later
+        planned = [
+            {"text": text, "topic": topic, "difficulty": difficulty}
+            for text, (topic, difficulty) in zip(texts, schedule, strict=False)
+        ]
+
+        logger.info("interview_questions_planned", count=len(planned))
+
+        return {"planned_questions": planned}
+
+    def _generate_question_node(self, state: InterviewState) -> dict:
+        question_idx = len(state["questions"])
+
+        planned = state.get("planned_questions") or []
+        if question_idx < len(planned):
+            logger.info("serving_planned_interview_question", question_index=question_idx)
+            return {"questions": [*state["questions"], planned[question_idx]]}
+
+        logger.info("generating_interview_question", question_index=question_idx)
+
+        topic = self._get_topic(state, question_idx)
+        difficulty = self._determine_difficulty(question_idx)
+
+        previous_questions = [q["text"] for q in state["questions"]]
+
+        try:
+            question_text = self._take_prefetched_question(state, question_idx, topic, difficulty)
+            if question_text is None:
+                question_text = self._produce_question(
+                    job_title=state["job_title"],
+                    job_description=state["job_description"],
+                    topic=topic,
+                    difficulty=difficulty,
+                    previous_questions=previous_questions,
+                )
+        except Exception as e:
+            logger.error("question_generation_failed", error=str(e), exc_info=True)
+            return {"status": "error"}
+
+        questions = [
+            *state["questions"],
+            {"text": question_text, "topic": topic, "difficulty": difficulty},
+        ]
+
+        logger.info(
+            "interview_question_generated",
+            topic=topic,
+            difficulty=difficulty,
+        )
+
+        self._prefetch_next_question(state, questions)
+
+        return {"questions": questions}
+
+    def _take_prefetched_question(
+        self, state: InterviewState, question_idx: int, topic: str, difficulty: str
+    ) -> str | None:
+        session_id = state.get("session_id")
+        if self.question_prefetcher is None or not session_id:
+            return None
 
-            logger.info(
-                "interview_question_generated",
+        key: PrefetchKey = (question_idx, topic, difficulty)
+        return self.question_prefetcher.take(session_id, key)
+
+    def _prefetch_next_question(self, state: InterviewState, questions: list[dict]) -> None:
+        """Start generating the following question while the candidate answers this one."""
+        session_id = state.get("session_id")
+        if self.question_prefetcher is None or not session_id:
+            return
+
+        question_idx = len(questions)
+        if question_idx >= state["total_questions"]:
+            return
+
+        topic = self._get_topic(state, question_idx)
+        difficulty = self._determine_difficulty(question_idx)
+        key: PrefetchKey = (question_idx, topic, difficulty)
+
+        job_title = state["job_title"]
+        job_description = state["job_description"]
+        previous_questions = [q["text"] for q in questions]
+
+        self.question_prefetcher.prefetch(
+            session_id,
+            key,
+            lambda: self._produce_question(
+                job_title=job_title,
+                job_description=job_description,
+                topic=topic,
+                difficulty=difficulty,
+                previous_questions=previous_questions,
+            ),
+        )
+
+    def _produce_question(
+        self,
+        job_title: str,
+        job_description: str,
+        topic: str,
+        difficulty: str,
+        previous_questions: list[str],
+    ) -> str:
+        """Draw from the question bank, falling back to the LLM on a miss."""
+        if self.question_bank is not None:
+            banked = self.question_bank.draw(
                 topic=topic,
                 difficulty=difficulty,
+                job_title=job_title,
+                job_description=job_description,
+                previous_questions=previous_questions,
             )
-        except Exception as e:
-            logger.error("question_generation_failed", error=str(e), exc_info=True)
-            state["status"] = "error"
+            if banked is not None:
+                return banked
+
+        question_text = self.llm_service.generate_interview_question(
+            job_description=job_description,
+            topic=topic,
+            difficulty=difficulty,
+            previous_question=previous_questions,
+        )
+
+        if self.question_bank is not None:
+            self.question_bank.store(topic, difficulty, job_title, question_text)
 
-        return state
+        return question_text
 
-    def _evaluate_answer_node(self, state: InterviewState) -> InterviewState:
+    def _evaluate_answer_node(self, state: InterviewState) -> dict:
         logger.info("evaluating_interview_answer")
 
         current_idx = state["current_question_index"]
         question = state["questions"][current_idx]
-
-        if len(state["answers"]) <= current_idx:
-            logger.error("no_answer_provided", question_index=current_idx)
-            state["status"] = "error"
-            return state
-
         answer = state["answers"][current_idx]
 
         try:
-            evaluation = self._evaluate_answer_with_llm(
-                question_text=question["text"],
-                answer_text=answer["text"],
+            evaluation = self.llm_service.evaluate_interview_answer(
+                question=question["text"],
+                answer=answer["text"],
                 topic=question["topic"],
             )
-
-            state["current_question_index"] += 1
-
-            logger.info(
-                "answer_evaluated",
-                score=evaluation["score"],
-                question_index=current_idx,
-            )
         except Exception as e:
             logger.error("answer_evaluation_failed", error=str(e), exc_info=True)
-            state["status"] = "error"
+            return {"status": "error"}
 
-        return state
+        answers = list(state["answers"])
+        answers[current_idx] = {
+            **answer,
+            "score": evaluation["score"],
+            "feedback": evaluation["feedback"],
+        }
+
+        logger.info(
+            "answer_evaluated",
+            score=evaluation["score"],
+            question_index=current_idx,
+        )
+
+        return {"answers": answers, "current_question_index": current_idx + 1}
 
-    def _calculate_final_score_node(self, state: InterviewState) -> InterviewState:
+    def _calculate_final_score_node(self, state: InterviewState) -> dict:
         logger.info("calculating_final_interview_score")
 
+        if self.question_prefetcher is not None and state.get("session_id"):
+            self.question_prefetcher.discard(state["session_id"])
+
         scores = [answer.get("score", 0) for answer in state["answers"] if "score" in answer]
 
         if not scores:
-            state["overall_score"] = 0.0
-            state["final_feedback"] = "Interview incomplete - no answers evaluated."
-            state["status"] = "error"
-            return state
+            return {
+                "overall_score": 0.0,
+                "final_feedback": "Interview incomplete - no answers evaluated.",
+                "status": "error",
+            }
 
         overall_score = sum(scores) / len(scores) / 10.0  # INFO: Normalize to 0-1
-        state["overall_score"] = overall_score
 
         feedback_parts = []
         feedback_parts.append(f"Overall Score: {overall_score:.1%}\n")
@@ -158,41 +324,29 @@ class InterviewGraph:
             feedback_parts.append(f"Score: {answer.get('score', 0)}/10")
             feedback_parts.append(f"Feedback: {answer.get('feedback', 'N/A')}")
 
-        state["final_feedback"] = "\n".join(feedback_parts)
-        state["status"] = "completed"
-
         logger.info("final_score_calculated", overall_score=overall_score)
 
-        return state
-
-    def _should_continue_after_question(self, state: InterviewState) -> str:
-        # If we've generated all questions, we're don
-        if len(state["questions"]) >= state["total_questions"]:
-            return "complete"
-
-        return "wait_for_answer"
+        return {
+            "overall_score": overall_score,
+            "final_feedback": "\n".join(feedback_parts),
+            "status": "completed",
+        }
 
-    def _should_continue_after_evaluation(self, state: InterviewState) -> str:
+    def _should_complete_after_evaluation(self, state: InterviewState) -> str:
         # If we've answered all questions, calculate final score
         if state["current_question_index"] >= state["total_questions"]:
             return "complete"
 
-        return "next_question"
-
-    def _get_next_topic(self, state: InterviewState) -> str:
-        question_idx = len(state["questions"])
+        return "wait_for_answer"
 
-        if state["skill_gaps"] and question_idx < len(state["skill_gaps"]):
-            return state["skill_gaps"][question_idx]
-        elif state["skill_gaps"]:
+    def _get_topic(self, state: InterviewState, question_idx: int) -> str:
+        if state["skill_gaps"]:
             # Wrap around if we have more questions than gaps
             return state["skill_gaps"][question_idx % len(state["skill_gaps"])]
-        else:
-            return "general technical competency"
 
-    def _determine_difficulty(self, state: InterviewState) -> str:
-        question_idx = len(state["questions"])
+        return "general technical competency"
 
+    def _determine_difficulty(self, question_idx: int) -> str:
         if question_idx < 2:
             return "easy"
         elif question_idx < 4:
@@ -200,18 +354,9 @@ class InterviewGraph:
         else:
             return "hard"
 
-    def _evaluate_answer_with_llm(self, question_text: str, answer_text: str, topic: str) -> dict:
-        # TODO: Implement LLM-based evaluation
-        # For now, return mock evaluation
-        logger.warning("using_mock_evaluation", topic=topic)
-
-        return {
-            "score": 7,
-            "feedback": "Good answer. Consider elaborating on implementation details.",
-        }
-
     def create_initial_state(
         self,
+        session_id: str,
         job_id: str,
         job_title: str,
         job_description: str,
@@ -219,11 +364,13 @@ class InterviewGraph:
         skill_gaps: list[str],
     ) -> InterviewState:
         return InterviewState(
+            session_id=session_id,
             job_id=job_id,
             job_title=job_title,
             job_description=job_description,
             resume_text=resume_text,
             skill_gaps=skill_gaps[:5],
+            planned_questions=[],
             questions=[],
             answers=[],
             current_question_index=0,
@@ -1,6 +1,8 @@
 import uuid
 from datetime import datetime, timezone
 
+from app.domain.model.interview import InterviewSession
+from app.domain.ports.interview_session_store_port import InterviewSessionStore
 from app.domain.ports.llm_port import LLMPort
 from app.domain.ports.repositories import JobRepository, ResumeRepository
 from app.domain.services.interview_graph import InterviewGraph
@@ -10,46 +12,6 @@ from app.infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 
-class InterviewSession:
-    def __init__(
-        self,
-        id: str,
-        user_id: str,
-        job_id: str,
-        state: dict,
-        created_at: datetime,
-        completed_at: datetime | None = None,
-    ) -> None:
-        self.id = id
-        self.user_id = user_id
-        self.job_id = job_id
-        self.state = state
-        self.created_at = created_at
-        self.completed_at = completed_at
-
-    @property
-    def is_completed(self) -> bool:
-        return self.state["status"] == "completed"
-
-    @property
-    def current_question(self) -> dict | None:
-        questions = self.state.get("questions", [])
-        idx = self.state.get("current_question_index", 0)
-
-        if 0 <= idx < len(questions):
-            return questions[idx]
-
-        return None
-
-    @property
-    def overall_score(self) -> float | None:
-        return self.state.get("overall_score")
-
-    @property
-    def final_feedback(self) -> str | None:
-        return self.state.get("final_feedback")
-
-
 class InterviewService:
     def __init__(
         self,
@@ -57,21 +19,16 @@ class InterviewService:
         skill_extraction_service: SkillExtractionService,
         job_repository: JobRepository,
         resume_repository: ResumeRepository,
-        total_questions: int = 5,
+        session_store: InterviewSessionStore,
+        interview_graph: InterviewGraph,
     ) -> None:
         self.llm_service = llm_service
         self.skill_extraction_service = skill_extraction_service
         self.job_repository = job_repository
         self.resume_repository = resume_repository
-        self.total_questions = total_questions
-
-        self.interview_graph = InterviewGraph(
-            llm_service=llm_service,
-            total_questions=total_questions,
-        )
-
-        # In-memory session storage (Phase 3 will persist to DB)
-        self._sessions: dict[str, InterviewSession] = {}
+        self.session_store = session_store
+        # INFO: Compiled once per process and shared, the graph keeps no per-interview state
+        self.interview_graph = interview_graph
 
     def start_interview(self, user_id: str, job_id: str) -> InterviewSession:
         logger.info("starting_interview", user_id=user_id, job_id=job_id)
@@ -87,7 +44,10 @@ class InterviewService:
         gap_analysis = self.skill_extraction_service.analyze_gap(resume, job)
         skill_gaps = [gap.skill for gap in gap_analysis.missing_skills[:5]]
 
+        session_id = str(uuid.uuid4())
+
         initial_state = self.interview_graph.create_initial_state(
+            session_id=session_id,
             job_id=job_id,
             job_title=job.title,
             job_description=job.description,
@@ -98,14 +58,14 @@ class InterviewService:
         result_state: dict = self.interview_graph.graph.invoke(initial_state)
 
         session = InterviewSession(
-            id=str(uuid.uuid4()),
+            id=session_id,
             user_id=user_id,
             job_id=job_id,
             state=result_state,
             created_at=datetime.now(timezone.utc),
         )
 
-        self._sessions[session.id] = session
+        self.session_store.put(session)
 
         logger.info(
             "interview_started",
@@ -133,6 +93,10 @@ class InterviewService:
 
         if session.is_completed:
             session.completed_at = datetime.now(timezone.utc)
+
+        self.session_store.put(session)
+
+        if session.is_completed:
             logger.info(
                 "interview_completed",
                 session_id=session_id,
@@ -150,7 +114,7 @@ class InterviewService:
         return session
 
     def get_session(self, session_id: str) -> InterviewSession:
-        session = self._sessions.get(session_id)
+        session = self.session_store.get(session_id)
         if not session:
             raise ValueError(f"Interview session {session_id} not found")
         return session
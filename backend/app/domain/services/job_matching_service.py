@@ -1,9 +1,21 @@
+from datetime import datetime, timezone
 from typing import Any
 
-from app.domain.model.job import Job, JobMatch
+import numpy as np
+
+from app.domain.model.job import JobMatch, JobSearchFilters, JobSummary
 from app.domain.model.resume import Resume
 from app.domain.ports.embedding_port import EmbeddingPort
+from app.domain.ports.lexical_index_port import LexicalIndexPort
 from app.domain.ports.vector_db_port import VectorDBPort
+from app.domain.services.ranking import (
+    DEFAULT_SIMILARITY_WEIGHT,
+    DEFAULT_SKILL_WEIGHT,
+    combine_scores,
+    reciprocal_rank_fusion,
+    top_k_indices,
+)
+from app.domain.skills.vocabulary import SkillVocabulary, get_skill_vocabulary
 from app.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,80 +24,180 @@ logger = get_logger(__name__)
 class JobMatchingService:
     """Domain service for matching resumes to jobs."""
 
-    def __init__(self, vector_db: VectorDBPort, embedding_service: EmbeddingPort):
+    def __init__(
+        self,
+        vector_db: VectorDBPort,
+        embedding_service: EmbeddingPort,
+        skill_vocabulary: SkillVocabulary | None = None,
+        similarity_weight: float = DEFAULT_SIMILARITY_WEIGHT,
+        skill_weight: float = DEFAULT_SKILL_WEIGHT,
+        lexical_index: LexicalIndexPort | None = None,
+        rrf_k: int = 60,
+    ):
         self.vector_db = vector_db
         self.embedding_service = embedding_service
+        self.skill_vocabulary = skill_vocabulary or get_skill_vocabulary()
+        self.similarity_weight = similarity_weight
+        self.skill_weight = skill_weight
+        self.lexical_index = lexical_index
+        self.rrf_k = rrf_k
 
-    def find_similar_jobs(self, resume: Resume, top_k: int = 50) -> list[dict[str, Any]]:
+    def find_similar_jobs(
+        self,
+        resume: Resume,
+        top_k: int = 50,
+        resume_embedding: list[float] | None = None,
+        filters: JobSearchFilters | None = None,
+    ) -> list[dict[str, Any]]:
         logger.info("finding_similar_jobs", resume_id=resume.id, top_k=top_k)
 
-        resume_embedding = self._embed_resume(resume)
-        results = self._search_vector_db(resume_embedding, top_k)
+        if resume_embedding is None:
+            resume_embedding = self._embed_resume(resume)
+        results = self._search_vector_db(resume_embedding, top_k, filters)
+        if self.lexical_index is not None:
+            results = self._fuse_lexical(resume, results, top_k, filters)
 
         logger.info("similar_jobs_found", resume_id=resume.id, count=len(results))
         return results
 
-    def rank_jobs(self, resume: Resume, jobs: list[Job]) -> list[JobMatch]:
+    def rank_jobs(
+        self, resume: Resume, jobs: list[JobSummary], limit: int | None = None
+    ) -> list[JobMatch]:
         """
         Rank provided jobs by relevance to resume.
         Combines vector similarity with skill matching.
         """
+        search_results = self.find_similar_jobs(resume, top_k=len(jobs))
+
+        return self.rank_search_results(resume, jobs, search_results, limit)
+
+    def rank_search_results(
+        self,
+        resume: Resume,
+        jobs: list[JobSummary],
+        search_results: list[dict[str, Any]],
+        limit: int | None = None,
+    ) -> list[JobMatch]:
+        """
+        Rank jobs using similarity scores from an existing vector search, so
+        callers that already searched do not embed and search a second time.
+        Only the returned top `limit` matches are materialized.
+        """
         logger.info("ranking_jobs", resume_id=resume.id, num_jobs=len(jobs))
 
         job_map = self._create_job_map(jobs)
-        resume_embedding = self._embed_resume(resume)
-        search_results = self._search_vector_db(resume_embedding, top_k=len(jobs))
+        candidates, similarity_scores = self._collect_candidates(job_map, search_results)
+
+        skill_scores = self._skill_match_scores(resume, candidates)
+        scores = combine_scores(
+            similarity_scores, skill_scores, self.similarity_weight, self.skill_weight
+        )
 
-        job_matches = self._build_job_matches(resume, job_map, search_results)
-        sorted_matches = self._sort_by_combined_score(job_matches)
+        matches = [
+            JobMatch(
+                job=candidates[i],
+                similarity_score=float(similarity_scores[i]),
+                skill_match_score=float(skill_scores[i]),
+                score=float(scores[i]),
+            )
+            for i in top_k_indices(scores, limit)
+        ]
 
-        logger.info("ranking_complete", resume_id=resume.id, matches_found=len(sorted_matches))
-        return sorted_matches
+        logger.info("ranking_complete", resume_id=resume.id, matches_found=len(matches))
+        return matches
 
     def _embed_resume(self, resume: Resume) -> list[float]:
         return self.embedding_service.generate_embedding(resume.text)
 
-    def _search_vector_db(self, embedding: list[float], top_k: int) -> list[dict[str, Any]]:
+    def _search_vector_db(
+        self, embedding: list[float], top_k: int, filters: JobSearchFilters | None = None
+    ) -> list[dict[str, Any]]:
         return self.vector_db.search_similar(
-            query_embedding=embedding, filter_metadata={"type": "job"}, top_k=top_k
+            query_embedding=embedding, filter_metadata=self._metadata_filter(filters), top_k=top_k
+        )
+
+    def _metadata_filter(self, filters: JobSearchFilters | None) -> dict[str, Any]:
+        """Translate filters onto the attributes ingest stores as vector metadata."""
+        metadata_filter: dict[str, Any] = {"type": "job"}
+        if filters is None:
+            return metadata_filter
+
+        if filters.location_terms():
+            metadata_filter["location_terms"] = {"$in": filters.location_terms()}
+        if filters.min_salary is not None:
+            metadata_filter["salary_max"] = {"$gte": filters.min_salary}
+        if filters.sources:
+            metadata_filter["source"] = {"$in": list(filters.sources)}
+        if filters.seniority_levels:
+            metadata_filter["seniority_level"] = {
+                "$in": [level.lower() for level in filters.seniority_levels]
+            }
+
+        posted_after = filters.posted_after(datetime.now(timezone.utc))
+        if posted_after is not None:
+            metadata_filter["posted_at"] = {"$gte": int(posted_after.timestamp())}
+
+        return metadata_filter
+
+    def _fuse_lexical(
+        self,
+        resume: Resume,
+        vector_results: list[dict[str, Any]],
+        top_k: int,
+        filters: JobSearchFilters | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Merge keyword hits into the vector results by reciprocal rank fusion.
+        The fused score replaces the similarity score, rescaled so a job both
+        lists rank first scores 1.0.
+        """
+        lexical_results = self.lexical_index.search(resume.text, top_k, filters)
+        vector_by_id = {result["metadata"].get("job_id"): result for result in vector_results}
+
+        fused = reciprocal_rank_fusion(
+            [list(vector_by_id), [job_id for job_id, _ in lexical_results]], self.rrf_k
+        )
+        best = 2.0 / (self.rrf_k + 1)
+
+        logger.info(
+            "hybrid_results_fused",
+            resume_id=resume.id,
+            vector=len(vector_results),
+            lexical=len(lexical_results),
         )
+        results = []
+        for job_id, score in fused[:top_k]:
+            result = vector_by_id.get(job_id) or {"id": job_id, "metadata": {"job_id": job_id}}
+            results.append({**result, "score": score / best})
+        return results
 
-    def _create_job_map(self, jobs: list[Job]) -> dict[str, Job]:
+    def _create_job_map(self, jobs: list[JobSummary]) -> dict[str, JobSummary]:
         return {job.id: job for job in jobs}
 
-    def _build_job_matches(
+    def _collect_candidates(
         self,
-        resume: Resume,
-        job_map: dict[str, Job],
+        job_map: dict[str, JobSummary],
         search_results: list[dict[str, Any]],
-    ) -> list[JobMatch]:
-        job_matches: list[JobMatch] = []
+    ) -> tuple[list[JobSummary], np.ndarray]:
+        candidates: list[JobSummary] = []
+        similarity_scores: list[float] = []
 
         for result in search_results:
-            job_match = self._create_job_match(resume, job_map, result)
-            if job_match:
-                job_matches.append(job_match)
+            job_id = result["metadata"].get("job_id")
+            job = job_map.get(job_id)
 
-        return job_matches
+            if not job:
+                logger.warning("job_not_found_in_map", job_id=job_id)
+                continue
 
-    def _create_job_match(
-        self,
-        resume: Resume,
-        job_map: dict[str, Job],
-        result: dict[str, Any],
-    ) -> JobMatch | None:
-        job_id = result["metadata"].get("job_id")
-        job = job_map.get(job_id)
-
-        if not job:
-            logger.warning("job_not_found_in_map", job_id=job_id)
-            return None
-
-        return JobMatch(
-            job=job,
-            similarity_score=result["score"],
-            skill_match_score=resume.matches_job(job),
-        )
+            candidates.append(job)
+            similarity_scores.append(result["score"])
+
+        return candidates, np.asarray(similarity_scores, dtype=np.float32)
+
+    def _skill_match_scores(self, resume: Resume, jobs: list[JobSummary]) -> np.ndarray:
+        """Skill match score for every job in one popcount over packed skill bitsets."""
+        job_skills = self.skill_vocabulary.encode_many([job.required_skills for job in jobs])
+        resume_skills = self.skill_vocabulary.encode(resume.extract_skills())
 
-    def _sort_by_combined_score(self, matches: list[JobMatch]) -> list[JobMatch]:
-        return sorted(matches, key=lambda x: x.combined_score, reverse=True)
+        return job_skills.match_scores(resume_skills)
@@ -1,19 +1,42 @@
+import time
 import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from threading import Event
 
-
-from app.domain.model.job import Job, JobMatch
+from app.domain.model.gap_analysis import GapAnalysisReport
+from app.domain.model.job import Job, JobMatch, JobSearchFilters, JobSearchPage, JobSummary
+from app.domain.model.refresh import RefreshQuery, RefreshSchedule
 from app.domain.model.resume import Resume
+from app.domain.model.search import RankedSearch
 from app.domain.ports.embedding_port import EmbeddingPort
 from app.domain.ports.job_source_port import JobSourcePort
-from app.domain.ports.repositories import JobRepository, ResumeRepository
+from app.domain.ports.repositories import (
+    JobRepository,
+    MatchListRepository,
+    RefreshStateRepository,
+    ResumeRepository,
+)
+from app.domain.ports.search_cache_port import SearchResultCache
 from app.domain.ports.vector_db_port import VectorDBPort
+from app.domain.services.ingest_service import IngestService
 from app.domain.services.job_matching_service import JobMatchingService
+from app.domain.services.match_materializer import MatchMaterializer
+from app.domain.services.ranked_search_cache import (
+    RankedSearchCache,
+    decode_cursor,
+    encode_cursor,
+)
 from app.domain.services.skill_extraction_service import SkillExtractionService
 from app.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+_FETCH_CONCURRENCY = 4
+# INFO: How often a running fetch wakes up to check the stop event and deadline
+_FETCH_POLL_SECONDS = 1.0
+
 
 class JobService:
     def __init__(
@@ -24,6 +47,12 @@ class JobService:
         embedding_service: EmbeddingPort,
         vector_db: VectorDBPort,
         skill_extraction_service: SkillExtractionService,
+        ingest_service: IngestService,
+        refresh_state_repository: RefreshStateRepository | None = None,
+        ranked_search_cache: RankedSearchCache | None = None,
+        search_result_cache: SearchResultCache | None = None,
+        match_list_repository: MatchListRepository | None = None,
+        match_materializer: MatchMaterializer | None = None,
     ) -> None:
         self.job_repository = job_repository
         self.resume_repository = resume_repository
@@ -31,19 +60,87 @@ class JobService:
         self.embedding_service = embedding_service
         self.vector_db = vector_db
         self.skill_extraction_service = skill_extraction_service
+        self.ingest_service = ingest_service
+        self.refresh_state_repository = refresh_state_repository
+        self.ranked_search_cache = ranked_search_cache
+        self.search_result_cache = search_result_cache
+        self.match_list_repository = match_list_repository
+        self.match_materializer = match_materializer
+
+    def search_jobs(
+        self,
+        user_id: str,
+        top_k: int = 50,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        filters: JobSearchFilters | None = None,
+    ) -> JobSearchPage:
+        """
+        Return one page of ranked matches. The first page ranks up to top_k
+        jobs and caches the ranked ids; a cursor serves later pages from that
+        ranking, hydrating only the jobs on the page.
+
+        Filters are pushed down into the vector and lexical indexes so top_k
+        counts matching jobs only. Stored rankings cover the unfiltered search,
+        filtered searches are ranked on demand.
+        """
+        if filters is not None and filters.is_empty():
+            filters = None
+        logger.info(
+            "searching_jobs", user_id=user_id, top_k=top_k, cursor=cursor, filtered=bool(filters)
+        )
 
-    def search_jobs(self, user_id: str, top_k: int = 50) -> tuple[list[JobMatch], str]:
-        logger.info("searching_jobs", user_id=user_id, top_k=top_k)
+        ranked: RankedSearch | None = None
+        offset = 0
 
-        resume = self._get_user_resume(user_id)
-        search_results = self.job_matching_service.find_similar_jobs(resume, top_k)
-        job_ids = [result["metadata"]["job_id"] for result in search_results]
+        if cursor:
+            search_id, offset = decode_cursor(cursor)
+            if self.ranked_search_cache:
+                ranked = self.ranked_search_cache.get(user_id, search_id)
+            if ranked is None:
+                # INFO: Expired or evicted ranking, re-rank and continue at the same offset
+                logger.info("ranked_search_expired", user_id=user_id, search_id=search_id)
 
-        jobs = self._fetch_jobs_by_ids(job_ids)
-        job_matches = self.job_matching_service.rank_jobs(resume, jobs)
+        if ranked is None and filters is None:
+            ranked = self._cached_ranking(user_id, top_k)
+
+        if ranked is not None:
+            page_ids = self._page_ids(ranked, offset, page_size)
+            jobs = self._fetch_jobs_by_ids(page_ids)
+        else:
+            ranked, jobs = self._rank(user_id, top_k, filters)
+
+        page = self._build_page(ranked, jobs, offset, page_size)
+
+        logger.info(
+            "jobs_searched", user_id=user_id, matches_found=len(page.matches), total=page.total
+        )
+        return page
+
+    def materialize_matches(self, user_id: str) -> None:
+        """Build the stored top-N match list for the user's current resume."""
+        if self.match_materializer is None:
+            return
+
+        try:
+            resume = self._get_user_resume(user_id)
+            embedding = self.embedding_service.generate_embedding(resume.text)
+
+            top_n = self.match_materializer.top_n
+            search_results = self.job_matching_service.find_similar_jobs(
+                resume, top_n, resume_embedding=embedding
+            )
+            jobs = self._fetch_jobs_by_ids(
+                [result["metadata"]["job_id"] for result in search_results]
+            )
+            matches = self.job_matching_service.rank_search_results(
+                resume, jobs, search_results, limit=top_n
+            )
 
-        logger.info("jobs_searched", user_id=user_id, matches_found=len(job_matches))
-        return job_matches, resume.id
+            self.match_materializer.rebuild_for_resume(resume, embedding, matches)
+            logger.info("match_list_materialized", user_id=user_id, count=len(matches))
+        except Exception as e:
+            logger.error("match_list_materialization_failed", user_id=user_id, error=str(e))
 
     def get_job_by_id(self, job_id: str) -> Job:
         job = self.job_repository.find_by_id(job_id)
@@ -60,21 +157,71 @@ class JobService:
         location: str | None,
         limit: int,
     ) -> tuple[int, int, int]:
-        logger.info("refreshing_jobs", query=query, location=location, limit=limit)
-
-        all_jobs = self._fetch_from_sources(job_sources, query, location, limit)
-
-        logger.info("extracting_skills_from_job", count=len(all_jobs))
-        for job in all_jobs:
-            try:
-                self.skill_extraction_service.update_job_with_skills(job)
-            except Exception as e:
-                logger.warning("skill_extraction_failed", job_id=job.id, error=str(e))
+        """Refresh a single query immediately, regardless of its schedule."""
+        return self.refresh_plan(
+            job_sources=job_sources,
+            plan=[RefreshQuery(query=query, location=location, limit=limit)],
+            respect_schedule=False,
+        )
 
-        saved_jobs = self.job_repository.bulk_save(all_jobs)
-        self._generate_embeddings_for_jobs(saved_jobs)
+    def refresh_plan(
+        self,
+        job_sources: list[JobSourcePort],
+        plan: list[RefreshQuery],
+        respect_schedule: bool = True,
+        min_interval_seconds: int = 3600,
+        max_interval_seconds: int = 7 * 86400,
+        stop_event: Event | None = None,
+        fetch_deadline_seconds: float | None = None,
+    ) -> tuple[int, int, int]:
+        """
+        Fetch and store new jobs for every due query of the plan in one pass.
+
+        Fetches for all queries are merged and deduplicated (in memory and
+        against stored dedup hashes). Sources are asked only for postings newer
+        than the stored per-source watermark, which advances once the fetched
+        jobs have been saved, unless the source returned a full limit of them.
+        Skill extraction and embedding are queued on the
+        durable ingest queue rather than done inline.
+
+        Fetches still running after fetch_deadline_seconds are abandoned like
+        failed ones. When stop_event is set the run ends without saving, so
+        watermarks and schedules stay where they were.
+        """
+        now = datetime.now(timezone.utc)
+        due_queries = [
+            entry
+            for entry in plan
+            if not respect_schedule or self._get_schedule(entry, min_interval_seconds).is_due(now)
+        ]
+
+        logger.info("refreshing_jobs", planned=len(plan), due=len(due_queries))
+        if not due_queries:
+            return 0, 0, 0
+
+        fetched = self._fetch_plan(job_sources, due_queries, stop_event, fetch_deadline_seconds)
+        if stop_event is not None and stop_event.is_set():
+            logger.warning("job_refresh_stopped", due=len(due_queries))
+            return 0, 0, 0
+
+        fetched_count = sum(len(jobs) for jobs in fetched.values())
+
+        new_jobs, origin = self._dedup_fetched(fetched)
+
+        saved_jobs = self.job_repository.bulk_save(new_jobs)
+        self.ingest_service.enqueue_jobs(saved_jobs)
+
+        if saved_jobs and self.search_result_cache is not None:
+            self.search_result_cache.bump_catalog_version()
+
+        # INFO: Saved jobs are on the durable queue, so watermarks can safely move forward
+        for entry, jobs in fetched.items():
+            self._advance_watermarks(jobs, entry)
+
+        self._record_schedules(
+            due_queries, saved_jobs, origin, now, min_interval_seconds, max_interval_seconds
+        )
 
-        fetched_count = len(all_jobs)
         saved_count = len(saved_jobs)
         duplicates = fetched_count - saved_count
 
@@ -86,13 +233,150 @@ class JobService:
         )
         return fetched_count, saved_count, duplicates
 
-    def get_gap_analysis(self, user_id: str, job_id: str):
-        logger.info("getting_gap_analysis", user_id=user_id, job_id=job_id)
+    def analyze_gap(
+        self, resume: Resume, job: Job, request_narrative: bool = False
+    ) -> GapAnalysisReport:
+        """
+        Return the gap analysis of a loaded resume and job. With request_narrative,
+        an analysis without its LLM narrative is claimed so only one request
+        queues narrate_gap_analysis.
+        """
+        logger.info("getting_gap_analysis", user_id=resume.user_id, job_id=job.id)
+
+        result = self.skill_extraction_service.analyze_gap(resume, job)
+        queue_narrative = (
+            request_narrative
+            and not result.narrated
+            and self.skill_extraction_service.claim_narrative(resume, job)
+        )
+
+        return GapAnalysisReport(
+            job_id=job.id, job_title=job.title, result=result, queue_narrative=queue_narrative
+        )
+
+    def narrate_gap_analysis(self, user_id: str, job_id: str) -> None:
+        """Background pass that adds the LLM narrative to a deterministic gap analysis."""
+        try:
+            resume = self._get_user_resume(user_id)
+            job = self.get_job_by_id(job_id)
+            self.skill_extraction_service.narrate_gap(resume, job)
+        except Exception as e:
+            logger.warning("gap_narrative_failed", user_id=user_id, job_id=job_id, error=str(e))
+
+    def _cached_ranking(self, user_id: str, top_k: int) -> RankedSearch | None:
+        if self.search_result_cache is None:
+            return None
+
+        resume_id = self.search_result_cache.get_resume_id(user_id)
+        if resume_id is None:
+            return None
+
+        version = self.search_result_cache.catalog_version()
+        ranked = self.search_result_cache.get(resume_id, top_k, version)
+        if ranked is None:
+            return None
+
+        logger.info("job_search_cache_hit", user_id=user_id, catalog_version=version)
+        if self.ranked_search_cache:
+            self.ranked_search_cache.put(ranked)
+
+        return ranked
+
+    def _materialized_ranking(self, resume: Resume, top_k: int) -> RankedSearch | None:
+        if self.match_list_repository is None:
+            return None
+
+        user_id = resume.user_id
+        stored = self.match_list_repository.find_matches_for_user(user_id, top_k)
+        if stored is None:
+            return None
+
+        resume_id, matches = stored
+        # INFO: Until materialize_matches succeeds for a new upload, the list ranks the old resume
+        if resume_id != resume.id:
+            logger.info(
+                "job_search_materialized_stale",
+                user_id=user_id,
+                stored_resume_id=resume_id,
+                resume_id=resume.id,
+            )
+            return None
+
+        logger.info("job_search_materialized_hit", user_id=user_id, count=len(matches))
+
+        return RankedSearch(
+            user_id=user_id,
+            resume_id=resume_id,
+            top_k=top_k,
+            job_ids=[match.job_id for match in matches],
+            similarity_scores=[match.similarity_score for match in matches],
+            skill_match_scores=[match.skill_match_score for match in matches],
+            scores=[match.score for match in matches],
+        )
+
+    def _rank(
+        self, user_id: str, top_k: int, filters: JobSearchFilters | None = None
+    ) -> tuple[RankedSearch, list[JobSummary]]:
+        # INFO: Read the version first, a refresh landing mid-ranking must not be cached as current
+        version = self.search_result_cache.catalog_version() if self.search_result_cache else 0
 
         resume = self._get_user_resume(user_id)
-        job = self.get_job_by_id(job_id)
 
-        return self.skill_extraction_service.analyze_gap(resume, job)
+        materialized = self._materialized_ranking(resume, top_k) if filters is None else None
+        if materialized is not None:
+            if self.ranked_search_cache:
+                self.ranked_search_cache.put(materialized)
+            return materialized, self._fetch_jobs_by_ids(materialized.job_ids)
+
+        search_results = self.job_matching_service.find_similar_jobs(resume, top_k, filters=filters)
+        job_ids = [result["metadata"]["job_id"] for result in search_results]
+
+        jobs = self._fetch_jobs_by_ids(job_ids)
+        job_matches = self.job_matching_service.rank_search_results(
+            resume, jobs, search_results, limit=top_k
+        )
+
+        ranked = RankedSearch.from_matches(user_id, resume.id, top_k, job_matches)
+        if self.ranked_search_cache:
+            self.ranked_search_cache.put(ranked)
+        if self.search_result_cache and filters is None:
+            self.search_result_cache.put(ranked, version)
+            self.search_result_cache.set_resume_id(user_id, resume.id)
+
+        return ranked, [match.job for match in job_matches]
+
+    def _page_ids(self, ranked: RankedSearch, offset: int, page_size: int | None) -> list[str]:
+        end = len(ranked) if page_size is None else offset + page_size
+        return ranked.job_ids[offset:end]
+
+    def _build_page(
+        self,
+        ranked: RankedSearch,
+        jobs: list[JobSummary],
+        offset: int,
+        page_size: int | None,
+    ) -> JobSearchPage:
+        jobs_by_id = {job.id: job for job in jobs}
+        end = len(ranked) if page_size is None else min(offset + page_size, len(ranked))
+
+        matches = [
+            JobMatch(
+                job=jobs_by_id[ranked.job_ids[i]],
+                similarity_score=ranked.similarity_scores[i],
+                skill_match_score=ranked.skill_match_scores[i],
+                score=ranked.scores[i],
+            )
+            for i in range(offset, end)
+            # INFO: A job deleted since the ranking was cached is skipped
+            if ranked.job_ids[i] in jobs_by_id
+        ]
+
+        return JobSearchPage(
+            matches=matches,
+            total=len(ranked),
+            resume_id=ranked.resume_id,
+            next_cursor=encode_cursor(ranked.id, end) if end < len(ranked) else None,
+        )
 
     def _get_user_resume(self, user_id: str) -> Resume:
         resume = self.resume_repository.find_by_user_id(user_id)
@@ -102,25 +386,175 @@ class JobService:
 
         return resume
 
-    def _fetch_jobs_by_ids(self, job_ids: list[str]) -> list[Job]:
-        jobs = []
-        for job_id in job_ids:
-            job = self.job_repository.find_by_id(job_id)
-            if job:
-                jobs.append(job)
-        return jobs
+    def _fetch_jobs_by_ids(self, job_ids: list[str]) -> list[JobSummary]:
+        # INFO: Result lists never show descriptions, so they are not loaded
+        return self.job_repository.find_summaries_by_ids(job_ids)
 
-    def _fetch_from_sources(
-        self, sources: list[JobSourcePort], query: str, location: str | None, limit: int
+    def _fetch_plan(
+        self,
+        sources: list[JobSourcePort],
+        plan: list[RefreshQuery],
+        stop_event: Event | None = None,
+        deadline_seconds: float | None = None,
+    ) -> dict[RefreshQuery, list[Job]]:
+        """Fetch every (query, source) pair concurrently, the work is network bound."""
+        fetched: dict[RefreshQuery, list[Job]] = {entry: [] for entry in plan}
+        deadline = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+
+        # INFO: The session is not thread-safe, workers only do network I/O
+        pairs: list[tuple[JobSourcePort, RefreshQuery, datetime | None]] = []
+        for entry in plan:
+            for source in sources:
+                since = self._get_watermark(source.get_source_name(), entry.query, entry.location)
+                pairs.append((source, entry, since))
+
+        executor = ThreadPoolExecutor(max_workers=_FETCH_CONCURRENCY)
+        futures: dict[Future, RefreshQuery] = {
+            executor.submit(self._fetch_from_source, source, entry, since): entry
+            for source, entry, since in pairs
+        }
+        pending = set(futures)
+
+        try:
+            while pending:
+                if stop_event is not None and stop_event.is_set():
+                    logger.warning("job_source_fetch_stopped", pending=len(pending))
+                    break
+
+                timeout = _FETCH_POLL_SECONDS
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.monotonic())
+                    if timeout <= 0:
+                        logger.error("job_source_fetch_deadline_exceeded", pending=len(pending))
+                        break
+
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    entry = futures[future]
+                    try:
+                        fetched[entry].extend(future.result())
+                    except Exception as e:
+                        logger.error("job_source_fetch_failed", query=entry.query, error=str(e))
+        finally:
+            # INFO: Abandoned fetches finish in the background, their results are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return fetched
+
+    def _fetch_from_source(
+        self, source: JobSourcePort, entry: RefreshQuery, since: datetime | None
     ) -> list[Job]:
-        all_jobs = []
+        source_name = source.get_source_name()
+        raw_jobs = source.fetch_jobs(entry.query, entry.location, entry.limit, since=since)
+        return self._convert_raw_jobs_to_domain(raw_jobs, source_name)
+
+    def _dedup_fetched(
+        self, fetched: dict[RefreshQuery, list[Job]]
+    ) -> tuple[list[Job], dict[str, RefreshQuery]]:
+        """
+        Merge fetched jobs across queries, keeping the first posting per dedup
+        hash that is not stored yet. Also returns which query yielded each job.
+        """
+        unique: dict[str, Job] = {}
+        origin: dict[str, RefreshQuery] = {}
+
+        for entry, jobs in fetched.items():
+            for job in jobs:
+                dedup_hash = job.dedup_hash()
+                if dedup_hash not in unique:
+                    unique[dedup_hash] = job
+                    origin[job.id] = entry
+
+        existing = self.job_repository.find_existing_dedup_hashes(list(unique.keys()))
+        new_jobs = [job for dedup_hash, job in unique.items() if dedup_hash not in existing]
+
+        logger.info(
+            "fetched_jobs_deduplicated",
+            unique=len(unique),
+            already_stored=len(existing),
+            new=len(new_jobs),
+        )
+        return new_jobs, origin
+
+    def _get_schedule(self, entry: RefreshQuery, min_interval_seconds: int) -> RefreshSchedule:
+        schedule = None
+        if self.refresh_state_repository is not None:
+            schedule = self.refresh_state_repository.get_schedule(entry.query, entry.location)
+
+        return schedule or RefreshSchedule(
+            query=entry.query,
+            location=entry.location,
+            interval_seconds=min_interval_seconds,
+        )
+
+    def _record_schedules(
+        self,
+        plan: list[RefreshQuery],
+        saved_jobs: list[Job],
+        origin: dict[str, RefreshQuery],
+        now: datetime,
+        min_interval_seconds: int,
+        max_interval_seconds: int,
+    ) -> None:
+        if self.refresh_state_repository is None:
+            return
+
+        new_counts: dict[RefreshQuery, int] = {entry: 0 for entry in plan}
+        for job in saved_jobs:
+            entry = origin.get(job.id)
+            if entry is not None:
+                new_counts[entry] += 1
+
+        for entry, new_count in new_counts.items():
+            schedule = self._get_schedule(entry, min_interval_seconds)
+            schedule.record_run(
+                new_count=new_count,
+                limit=entry.limit,
+                now=now,
+                min_interval_seconds=min_interval_seconds,
+                max_interval_seconds=max_interval_seconds,
+            )
+            self.refresh_state_repository.save_schedule(schedule)
+
+    def _get_watermark(self, source: str, query: str, location: str | None) -> datetime | None:
+        if self.refresh_state_repository is None:
+            return None
+
+        return self.refresh_state_repository.get_watermark(source, query, location)
 
-        for source in sources:
-            raw_jobs = source.fetch_jobs(query, location, limit)
-            jobs = self._convert_raw_jobs_to_domain(raw_jobs, source.get_source_name())
-            all_jobs.extend(jobs)
+    def _advance_watermarks(self, jobs: list[Job], entry: RefreshQuery) -> None:
+        if self.refresh_state_repository is None:
+            return
 
-        return all_jobs
+        fetched_by_source = Counter(job.source for job in jobs)
+        newest_by_source: dict[str, datetime] = {}
+        for job in jobs:
+            if job.posted_at is None:
+                continue
+
+            posted_at = job.posted_at
+            if posted_at.tzinfo is None:
+                posted_at = posted_at.replace(tzinfo=timezone.utc)
+
+            current = newest_by_source.get(job.source)
+            if current is None or posted_at > current:
+                newest_by_source[job.source] = posted_at
+
+        for source, posted_at in newest_by_source.items():
+            # INFO: A full page may have cut off postings older than its newest, fetch them again
+            if fetched_by_source[source] >= entry.limit:
+                logger.info(
+                    "job_watermark_held",
+                    source=source,
+                    query=entry.query,
+                    fetched=fetched_by_source[source],
+                )
+                continue
+
+            self.refresh_state_repository.save_watermark(
+                source, entry.query, entry.location, posted_at
+            )
 
     def _convert_raw_jobs_to_domain(self, raw_jobs: list[dict], source: str) -> list[Job]:
         jobs = []
@@ -143,21 +577,3 @@ class JobService:
             jobs.append(job)
 
         return jobs
-
-    def _generate_embeddings_for_jobs(self, jobs: list[Job]) -> None:
-        if not jobs:
-            return
-
-        logger.info("generating_job_embeddings", count=len(jobs))
-
-        descriptions = [job.description for job in jobs]
-        embeddings = self.embedding_service.generate_embeddings_batch(descriptions)
-
-        for job, embedding in zip(jobs, embeddings):
-            self.vector_db.upsert_embedding(
-                vector_id=job.pinecone_id,
-                embedding=embedding,
-                metadata={"type": "job", "job_id": job.id, "source": job.source},
-            )
-
-        logger.info("job_embeddings_generated", count=len(jobs))
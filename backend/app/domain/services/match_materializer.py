@@ -0,0 +1,129 @@
+import numpy as np
+
+from app.domain.model.job import JobMatch, JobSummary
+from app.domain.model.resume import Resume
+from app.domain.model.search import MaterializedMatch, ResumeVector
+from app.domain.ports.repositories import MatchListRepository
+from app.domain.services.batch_scorer import BatchScorer, ScoreBlock
+from app.domain.services.ranking import (
+    DEFAULT_SIMILARITY_WEIGHT,
+    DEFAULT_SKILL_WEIGHT,
+    top_k_indices,
+)
+from app.domain.services.resume_matrix import ResumeMatrix, ResumeMatrixStore
+from app.domain.skills.vocabulary import SkillVocabulary
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class MatchMaterializer:
+    """
+    Keeps a stored top-N job list per active resume so search is one read.
+
+    A new resume gets its list from a regular ranking. New jobs are scored
+    against every active resume block by block (see BatchScorer), reading
+    the memory-mapped resume snapshot when a matrix store is configured, and
+    merged into the lists they beat; existing jobs are never rescored.
+    """
+
+    def __init__(
+        self,
+        repository: MatchListRepository,
+        skill_vocabulary: SkillVocabulary | None = None,
+        top_n: int = 200,
+        similarity_weight: float = DEFAULT_SIMILARITY_WEIGHT,
+        skill_weight: float = DEFAULT_SKILL_WEIGHT,
+        scorer: BatchScorer | None = None,
+        matrix_store: ResumeMatrixStore | None = None,
+    ) -> None:
+        self.repository = repository
+        self.top_n = top_n
+        self.scorer = scorer or BatchScorer(
+            skill_vocabulary=skill_vocabulary,
+            similarity_weight=similarity_weight,
+            skill_weight=skill_weight,
+        )
+        self.matrix_store = matrix_store
+
+    def rebuild_for_resume(
+        self, resume: Resume, embedding: list[float], matches: list[JobMatch]
+    ) -> None:
+        """Store the resume as the user's active one along with its ranked matches."""
+        self.repository.save_resume_vector(
+            ResumeVector(
+                user_id=resume.user_id,
+                resume_id=resume.id,
+                embedding=embedding,
+                skills=resume.extract_skills(),
+            )
+        )
+        self.repository.replace_matches(
+            resume.user_id,
+            resume.id,
+            [
+                MaterializedMatch(
+                    job_id=match.job.id,
+                    similarity_score=match.similarity_score,
+                    skill_match_score=match.skill_match_score,
+                    score=match.combined_score,
+                )
+                for match in matches[: self.top_n]
+            ],
+        )
+
+    def score_new_jobs(self, jobs: list[JobSummary], embeddings: list[list[float]]) -> int:
+        """Merge new jobs into every resume's list they make the top N of. Returns merges."""
+        if not jobs:
+            return 0
+
+        resumes = merged = 0
+        for block in self.scorer.iter_blocks(self._resume_matrices(), jobs, embeddings):
+            resumes += len(block.resume_ids)
+            merges = self._block_merges(block, jobs)
+            self.repository.merge_matches(merges, self.top_n)
+            merged += sum(len(matches) for matches in merges.values())
+
+        logger.info("match_lists_updated", jobs=len(jobs), resumes=resumes, merged=merged)
+        return merged
+
+    def rebuild_resume_matrix(self) -> None:
+        """Snapshot every active resume for scoring, a no-op without a matrix store."""
+        if self.matrix_store is not None:
+            self.matrix_store.rebuild(self.repository.iter_resume_vectors())
+
+    def _resume_matrices(self) -> list[ResumeMatrix]:
+        snapshot = self.matrix_store.load() if self.matrix_store is not None else None
+        if snapshot is None:
+            return [ResumeMatrix.from_vectors(self.repository.find_resume_vectors())]
+
+        # INFO: Resumes saved since the snapshot are scored from the database instead
+        updates = self.repository.find_resume_vectors(updated_after=snapshot.built_at)
+        return [
+            snapshot.without_users({vector.user_id for vector in updates}),
+            ResumeMatrix.from_vectors(updates),
+        ]
+
+    def _block_merges(
+        self, block: ScoreBlock, jobs: list[JobSummary]
+    ) -> dict[str, list[MaterializedMatch]]:
+        floors = self.repository.find_score_floors(block.resume_ids, self.top_n)
+        floor_scores = np.asarray(
+            [floors.get(resume_id, -np.inf) for resume_id in block.resume_ids], dtype=np.float32
+        )
+        beats_floor = block.scores > floor_scores[:, None]
+
+        merges: dict[str, list[MaterializedMatch]] = {}
+        for row in np.flatnonzero(beats_floor.any(axis=1)):
+            candidates = np.flatnonzero(beats_floor[row])
+            best = candidates[top_k_indices(block.scores[row, candidates], self.top_n)]
+            merges[block.resume_ids[row]] = [
+                MaterializedMatch(
+                    job_id=jobs[col].id,
+                    similarity_score=float(block.similarity[row, col]),
+                    skill_match_score=float(block.skill[row, col]),
+                    score=float(block.scores[row, col]),
+                )
+                for col in best
+            ]
+        return merges
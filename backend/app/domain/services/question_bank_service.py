@@ -0,0 +1,226 @@
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from app.domain.model.question_bank import BankedQuestion
+from app.domain.ports.embedding_port import EmbeddingPort
+from app.domain.ports.llm_port import LLMPort
+from app.domain.ports.repositories import QuestionBankRepository
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def normalize_topic(topic: str) -> str:
+    return " ".join(topic.lower().split())
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+class QuestionBankService:
+    """
+    Serves interview questions from a shared bank before falling back to the LLM.
+
+    Questions are keyed by normalized topic and difficulty, and matched to the
+    job family by cosine similarity of job title embeddings. A question is only
+    served if it does not overlap too much with questions already asked in
+    the session. Misses and low stock are backfilled in the background.
+    """
+
+    def __init__(
+        self,
+        repository: QuestionBankRepository,
+        llm_service: LLMPort,
+        embedding_service: EmbeddingPort,
+        min_stock: int = 5,
+        similarity_threshold: float = 0.6,
+        novelty_threshold: float = 0.6,
+        candidate_limit: int = 50,
+        backfill_workers: int = 2,
+    ) -> None:
+        self.repository = repository
+        self.llm_service = llm_service
+        self.embedding_service = embedding_service
+        self.min_stock = min_stock
+        self.similarity_threshold = similarity_threshold
+        self.novelty_threshold = novelty_threshold
+        self.candidate_limit = candidate_limit
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=backfill_workers, thread_name_prefix="question-bank"
+        )
+        self._backfilling: set[tuple[str, str]] = set()
+        self._embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def draw(
+        self,
+        topic: str,
+        difficulty: str,
+        job_title: str,
+        job_description: str,
+        previous_questions: list[str],
+    ) -> str | None:
+        """Return a banked question for this topic, or None on a miss."""
+        key = (normalize_topic(topic), difficulty)
+
+        try:
+            candidates = self.repository.find_by_topic(*key, limit=self.candidate_limit)
+            job_embedding = self._job_family_embedding(job_title)
+        except Exception as e:
+            logger.warning("question_bank_lookup_failed", topic=key[0], error=str(e))
+            return None
+
+        question = self._select(candidates, job_embedding, previous_questions)
+
+        if question is None:
+            # INFO: The caller generates on a miss and stores the result, which restocks the key
+            logger.info("question_bank_miss", topic=key[0], difficulty=difficulty)
+            return None
+
+        if len(candidates) <= self.min_stock:
+            self._schedule_backfill(key, job_title, job_description, candidates)
+
+        self._executor.submit(self._mark_served, question.id)
+        logger.info("question_bank_hit", topic=key[0], difficulty=difficulty)
+
+        return question.text
+
+    def store(self, topic: str, difficulty: str, job_title: str, text: str) -> None:
+        """Bank an LLM-generated question without blocking the caller."""
+        self._executor.submit(self._store, normalize_topic(topic), difficulty, job_title, text)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _select(
+        self,
+        candidates: list[BankedQuestion],
+        job_embedding: list[float],
+        previous_questions: list[str],
+    ) -> BankedQuestion | None:
+        previous_tokens = [_tokens(text) for text in previous_questions]
+
+        # INFO: Candidates arrive least served first, which spreads usage across the bank
+        for candidate in candidates:
+            similarity = self._similarity(candidate.job_family_embedding, job_embedding)
+            if similarity < self.similarity_threshold:
+                continue
+
+            if self._is_novel(candidate.text, previous_tokens):
+                return candidate
+
+        return None
+
+    def _is_novel(self, text: str, previous_tokens: list[set[str]]) -> bool:
+        tokens = _tokens(text)
+        if not tokens:
+            return False
+
+        for other in previous_tokens:
+            if not other:
+                continue
+            overlap = len(tokens & other) / len(tokens | other)
+            if overlap >= self.novelty_threshold:
+                return False
+
+        return True
+
+    def _similarity(self, banked: list[float] | None, job_embedding: list[float]) -> float:
+        # INFO: Questions banked without an embedding match any job family
+        if not banked:
+            return 1.0
+
+        a = np.asarray(banked, dtype=np.float32)
+        b = np.asarray(job_embedding, dtype=np.float32)
+        denom = float(np.linalg.norm(a) * np.linalg.norm(b))
+
+        return float(a @ b) / denom if denom else 0.0
+
+    def _job_family_embedding(self, job_title: str) -> list[float]:
+        title = " ".join(job_title.lower().split())
+
+        with self._lock:
+            cached = self._embeddings.get(title)
+            if cached is not None:
+                self._embeddings.move_to_end(title)
+                return cached
+
+        embedding = self.embedding_service.generate_embedding(title)
+
+        with self._lock:
+            self._embeddings[title] = embedding
+            while len(self._embeddings) > 1024:
+                self._embeddings.popitem(last=False)
+
+        return embedding
+
+    def _schedule_backfill(
+        self,
+        key: tuple[str, str],
+        job_title: str,
+        job_description: str,
+        candidates: list[BankedQuestion],
+    ) -> None:
+        with self._lock:
+            if key in self._backfilling:
+                return
+            self._backfilling.add(key)
+
+        existing = [candidate.text for candidate in candidates]
+        self._executor.submit(self._backfill, key, job_title, job_description, existing)
+
+    def _backfill(
+        self,
+        key: tuple[str, str],
+        job_title: str,
+        job_description: str,
+        existing: list[str],
+    ) -> None:
+        topic, difficulty = key
+
+        try:
+            text = self.llm_service.generate_interview_question(
+                job_description=job_description,
+                topic=topic,
+                difficulty=difficulty,
+                previous_question=existing,
+            )
+            self._store(topic, difficulty, job_title, text)
+            logger.info("question_bank_backfilled", topic=topic, difficulty=difficulty)
+        except Exception as e:
+            logger.warning("question_bank_backfill_failed", topic=topic, error=str(e))
+        finally:
+            with self._lock:
+                self._backfilling.discard(key)
+
+    def _store(self, topic: str, difficulty: str, job_title: str, text: str) -> None:
+        if not text.strip():
+            return
+
+        try:
+            self.repository.add(
+                BankedQuestion(
+                    id=str(uuid.uuid4()),
+                    topic=topic,
+                    difficulty=difficulty,
+                    text=text.strip(),
+                    job_family_embedding=self._job_family_embedding(job_title),
+                )
+            )
+        except Exception as e:
+            logger.warning("question_bank_store_failed", topic=topic, error=str(e))
+
+    def _mark_served(self, question_id: str) -> None:
+        try:
+            self.repository.mark_served(question_id)
+        except Exception as e:
+            logger.warning("question_bank_mark_served_failed", error=str(e))
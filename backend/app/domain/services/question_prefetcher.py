@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (question_index, topic, difficulty) the question was generated for
+PrefetchKey = tuple[int, str, str]
+
+
+class QuestionPrefetcher:
+    """
+    Generates the next interview question in the background while the
+    candidate is still answering the current one.
+
+    Each session has a single slot. A prefetched question is only served if
+    it was generated for the same index, topic and difficulty the interview
+    asks for; anything else is discarded and generated on demand.
+    """
+
+    def __init__(self, max_workers: int = 4, max_sessions: int = 1024) -> None:
+        self.max_sessions = max_sessions
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="question-prefetch"
+        )
+        self._slots: OrderedDict[str, tuple[PrefetchKey, Future[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefetch(self, session_id: str, key: PrefetchKey, generate: Callable[[], str]) -> None:
+        future = self._executor.submit(generate)
+
+        with self._lock:
+            previous = self._slots.pop(session_id, None)
+            self._slots[session_id] = (key, future)
+
+            while len(self._slots) > self.max_sessions:
+                _, (_, evicted) = self._slots.popitem(last=False)
+                evicted.cancel()
+
+        if previous is not None:
+            previous[1].cancel()
+
+        logger.debug("interview_question_prefetch_started", session_id=session_id, key=key)
+
+    def take(self, session_id: str, key: PrefetchKey, timeout: float | None = None) -> str | None:
+        """
+        Return the prefetched question for key and empty the slot. Waits for an
+        in-flight generation, since it is already ahead of a fresh request.
+        """
+        with self._lock:
+            slot = self._slots.pop(session_id, None)
+
+        if slot is None:
+            return None
+
+        slot_key, future = slot
+        if slot_key != key:
+            future.cancel()
+            logger.info(
+                "interview_question_prefetch_discarded",
+                session_id=session_id,
+                prefetched=slot_key,
+                requested=key,
+            )
+            return None
+
+        try:
+            question = future.result(timeout=timeout)
+        except Exception as e:
+            logger.warning(
+                "interview_question_prefetch_failed", session_id=session_id, error=str(e)
+            )
+            return None
+
+        logger.info("interview_question_prefetch_hit", session_id=session_id, key=key)
+        return question
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            slot = self._slots.pop(session_id, None)
+
+        if slot is not None:
+            slot[1].cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            slots = list(self._slots.values())
+            self._slots.clear()
+
+        for _, future in slots:
+            future.cancel()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
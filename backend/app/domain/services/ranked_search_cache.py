@@ -0,0 +1,70 @@
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from app.domain.model.search import RankedSearch
+
+
+def encode_cursor(search_id: str, offset: int) -> str:
+    raw = json.dumps({"s": search_id, "o": offset}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Return (search_id, offset). Raises ValueError for a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        search_id, offset = str(payload["s"]), int(payload["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid search cursor") from e
+
+    if offset < 0:
+        raise ValueError("Invalid search cursor")
+
+    return search_id, offset
+
+
+class RankedSearchCache:
+    """
+    Short-lived, per-user cache of the latest ranked search. Only the ids and
+    scores are kept; each page hydrates just the jobs it returns.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_users: int = 4096) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+
+        self._entries: OrderedDict[str, tuple[RankedSearch, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, search_id: str) -> RankedSearch | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+
+            ranked, cached_at = entry
+            if time.monotonic() - cached_at >= self.ttl_seconds:
+                del self._entries[user_id]
+                return None
+
+            if ranked.id != search_id:
+                return None
+
+            self._entries.move_to_end(user_id)
+            return ranked
+
+    def put(self, ranked: RankedSearch) -> None:
+        with self._lock:
+            self._entries[ranked.user_id] = (ranked, time.monotonic())
+            self._entries.move_to_end(ranked.user_id)
+
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
@@ -0,0 +1,48 @@
+import numpy as np
+
+DEFAULT_SIMILARITY_WEIGHT = 0.7
+DEFAULT_SKILL_WEIGHT = 0.3
+
+
+def combine_scores(
+    similarity_scores: np.ndarray,
+    skill_match_scores: np.ndarray,
+    similarity_weight: float = DEFAULT_SIMILARITY_WEIGHT,
+    skill_weight: float = DEFAULT_SKILL_WEIGHT,
+) -> np.ndarray:
+    """Weighted combination of similarity and skill match for every candidate."""
+    return similarity_weight * np.asarray(
+        similarity_scores, dtype=np.float32
+    ) + skill_weight * np.asarray(skill_match_scores, dtype=np.float32)
+
+
+def top_k_indices(scores: np.ndarray, k: int | None = None) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first. Only the selected k are
+    sorted; ties keep their original order.
+    """
+    n = scores.shape[0]
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    # INFO: Sort by (score desc, index asc) so results are deterministic across calls
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = 60) -> list[tuple[str, float]]:
+    """
+    Fuse several best-first id rankings into one. Each list contributes
+    1 / (k + rank) per id, so ids ranked high by any list rise without the
+    lists' raw scores having to be comparable. Returns (id, fused score)
+    best first, ties in first-seen order.
+    """
+    fused: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            fused[item] = fused.get(item, 0.0) + 1.0 / (k + rank)
+
+    return sorted(fused.items(), key=lambda entry: entry[1], reverse=True)
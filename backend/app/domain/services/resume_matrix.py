@@ -0,0 +1,263 @@
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from app.domain.model.search import ResumeVector
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_CURRENT = "CURRENT"
+_INDEX = "index.json"
+_EMBEDDINGS = "embeddings.f32"
+_SKILL_IDS = "skill_ids.i32"
+_SKILL_OFFSETS = "skill_offsets.i64"
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+@dataclass(frozen=True)
+class ResumeMatrix:
+    """
+    Active resumes as unit-length float32 embedding rows plus their skills in
+    CSR form (flat ids into skill_names, one offset per row). Loaded from a
+    ResumeMatrixStore the arrays are memory-mapped, so only the rows being
+    scored are paged in.
+    """
+
+    user_ids: list[str]
+    resume_ids: list[str]
+    embeddings: np.ndarray
+    skill_ids: np.ndarray
+    skill_offsets: np.ndarray
+    skill_names: list[str]
+    built_at: datetime | None = None
+    # INFO: Rows superseded by a newer vector of the same user, never scored
+    excluded: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.resume_ids)
+
+    @classmethod
+    def from_vectors(
+        cls, vectors: Iterable[ResumeVector], built_at: datetime | None = None
+    ) -> "ResumeMatrix":
+        builder = _MatrixBuilder()
+        for vector in vectors:
+            builder.add(vector)
+        return builder.build(built_at)
+
+    def without_users(self, user_ids: set[str]) -> "ResumeMatrix":
+        """The same rows with every row of the given users excluded from scoring."""
+        if not user_ids or not len(self):
+            return self
+
+        excluded = np.isin(np.asarray(self.user_ids, dtype=object), list(user_ids))
+        if self.excluded is not None:
+            excluded |= self.excluded
+        return replace(self, excluded=excluded)
+
+    def row_skills(self, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        """(row offset within the slice, skill id) pairs of every skill in rows start:stop."""
+        offsets = np.asarray(self.skill_offsets[start : stop + 1])
+        ids = np.asarray(self.skill_ids[offsets[0] : offsets[-1]])
+        rows = np.repeat(np.arange(stop - start), np.diff(offsets))
+        return rows, ids
+
+
+class _MatrixBuilder:
+    """Accumulates resume vectors in chunks, in memory or straight into snapshot files."""
+
+    def __init__(self, directory: Path | None = None, chunk_size: int = 4096) -> None:
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.user_ids: list[str] = []
+        self.resume_ids: list[str] = []
+        self.skill_names: dict[str, int] = {}
+        self.dimension: int | None = None
+
+        self._rows: list[list[float]] = []
+        self._ids: list[int] = []
+        self._offsets: list[int] = []
+        self._skill_count = 0
+        self._chunks: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+
+    def add(self, vector: ResumeVector) -> None:
+        if self.dimension is None:
+            self.dimension = len(vector.embedding)
+        elif len(vector.embedding) != self.dimension:
+            raise ValueError(
+                f"Resume {vector.resume_id} has dimension {len(vector.embedding)}, "
+                f"expected {self.dimension}"
+            )
+
+        self.user_ids.append(vector.user_id)
+        self.resume_ids.append(vector.resume_id)
+        self._rows.append(vector.embedding)
+
+        skills = dict.fromkeys(vector.skills)
+        self._offsets.append(self._skill_count)
+        names = self.skill_names
+        self._ids.extend(names.setdefault(skill, len(names)) for skill in skills)
+        self._skill_count += len(skills)
+
+        if len(self._rows) >= self.chunk_size:
+            self._flush()
+
+    def build(self, built_at: datetime | None = None) -> ResumeMatrix:
+        self._flush()
+        chunks = self._chunks or [self._empty()]
+
+        return ResumeMatrix(
+            user_ids=self.user_ids,
+            resume_ids=self.resume_ids,
+            embeddings=np.concatenate([chunk[0] for chunk in chunks]),
+            skill_ids=np.concatenate([chunk[1] for chunk in chunks]),
+            skill_offsets=np.append(
+                np.concatenate([chunk[2] for chunk in chunks]), self._skill_count
+            ).astype(np.int64),
+            skill_names=list(self.skill_names),
+            built_at=built_at,
+        )
+
+    def write(self, built_at: datetime) -> None:
+        """Flush the remaining rows and the index into the builder's directory."""
+        self._flush()
+        with open(self.directory / _SKILL_OFFSETS, "ab") as f:
+            f.write(np.asarray([self._skill_count], dtype=np.int64).tobytes())
+
+        index = {
+            "built_at": built_at.isoformat(),
+            "dimension": self.dimension or 0,
+            "user_ids": self.user_ids,
+            "resume_ids": self.resume_ids,
+            "skill_names": list(self.skill_names),
+        }
+        (self.directory / _INDEX).write_text(json.dumps(index))
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+
+        chunk = (
+            normalize_rows(np.asarray(self._rows, dtype=np.float32)).astype(np.float32),
+            np.asarray(self._ids, dtype=np.int32),
+            np.asarray(self._offsets, dtype=np.int64),
+        )
+        self._rows, self._ids, self._offsets = [], [], []
+
+        if self.directory is None:
+            self._chunks.append(chunk)
+            return
+
+        # INFO: Appended chunk by chunk so a rebuild never holds every embedding in memory
+        for name, array in zip((_EMBEDDINGS, _SKILL_IDS, _SKILL_OFFSETS), chunk, strict=True):
+            with open(self.directory / name, "ab") as f:
+                f.write(array.tobytes())
+
+    def _empty(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return (
+            np.zeros((0, self.dimension or 0), dtype=np.float32),
+            np.zeros(0, dtype=np.int32),
+            np.zeros(0, dtype=np.int64),
+        )
+
+
+class ResumeMatrixStore:
+    """
+    Snapshots of every active resume on local disk for batch scoring.
+
+    Each rebuild writes a new generation directory and then atomically
+    repoints CURRENT at it, so readers never see a half-written snapshot.
+    The previous generation is kept for readers still mapping it.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._loaded: tuple[str, ResumeMatrix] | None = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ResumeMatrix | None:
+        """Memory-map the current snapshot, None until the first rebuild."""
+        try:
+            generation = (self.directory / _CURRENT).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            if self._loaded is not None and self._loaded[0] == generation:
+                return self._loaded[1]
+
+            matrix = self._open(self.directory / generation)
+            self._loaded = (generation, matrix)
+            return matrix
+
+    def rebuild(self, vectors: Iterable[ResumeVector]) -> ResumeMatrix:
+        """Stream vectors into a new snapshot and make it current."""
+        # INFO: Taken before reading, vectors saved during the rebuild count as updates
+        built_at = datetime.now(timezone.utc)
+        generation = f"{built_at.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        path = self.directory / generation
+        path.mkdir(parents=True)
+
+        builder = _MatrixBuilder(directory=path)
+        try:
+            for vector in vectors:
+                builder.add(vector)
+            builder.write(built_at)
+        except Exception:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+
+        pointer = self.directory / f"{_CURRENT}.{generation}"
+        pointer.write_text(generation)
+        previous = self._current_generation()
+        os.replace(pointer, self.directory / _CURRENT)
+        self._prune(keep={generation, previous})
+
+        logger.info("resume_matrix_rebuilt", generation=generation, resumes=len(builder.user_ids))
+        return self.load()  # type: ignore[return-value]
+
+    def _current_generation(self) -> str | None:
+        try:
+            return (self.directory / _CURRENT).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def _prune(self, keep: set[str | None]) -> None:
+        for path in self.directory.iterdir():
+            if path.is_dir() and path.name not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _open(self, path: Path) -> ResumeMatrix:
+        index = json.loads((path / _INDEX).read_text())
+        rows = len(index["resume_ids"])
+
+        return ResumeMatrix(
+            user_ids=index["user_ids"],
+            resume_ids=index["resume_ids"],
+            embeddings=_map(path / _EMBEDDINGS, np.float32, (rows, index["dimension"])),
+            skill_ids=_map(path / _SKILL_IDS, np.int32),
+            skill_offsets=_map(path / _SKILL_OFFSETS, np.int64),
+            skill_names=index["skill_names"],
+            built_at=datetime.fromisoformat(index["built_at"]),
+        )
+
+
+def _map(path: Path, dtype: type, shape: tuple[int, ...] | None = None) -> np.ndarray:
+    # INFO: np.memmap rejects empty files, an empty snapshot has nothing to page in anyway
+    if not path.exists() or path.stat().st_size == 0:
+        return np.zeros(shape or (0,), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
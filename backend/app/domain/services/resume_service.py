@@ -5,7 +5,8 @@ from PyPDF2 import PdfReader
 
 from app.domain.model.resume import Resume
 from app.domain.ports.embedding_port import EmbeddingPort
-from app.domain.ports.repositories import ResumeRepository
+from app.domain.ports.repositories import GapAnalysisRepository, ResumeRepository
+from app.domain.ports.search_cache_port import SearchResultCache
 from app.domain.ports.vector_db_port import VectorDBPort
 from app.infrastructure.logging import get_logger
 
@@ -21,11 +22,15 @@ class ResumeService:
         embedding_service: EmbeddingPort,
         vector_db: VectorDBPort,
         storage_bucket: str,
+        gap_analysis_repository: GapAnalysisRepository | None = None,
+        search_result_cache: SearchResultCache | None = None,
     ) -> None:
         self.resume_repository = resume_repository
         self.embedding_service = embedding_service
         self.vector_db = vector_db
         self.storage_bucket = storage_bucket
+        self.gap_analysis_repository = gap_analysis_repository
+        self.search_result_cache = search_result_cache
 
     def process_resume_upload(self, user_id: str, pdf_bytes: bytes) -> Resume:
         """Process resume upload: extract text, save to DB."""
@@ -37,6 +42,12 @@ class ResumeService:
         resume = self._create_resume(user_id, text)
         saved_resume = self.resume_repository.save(resume)
 
+        # INFO: Analyses of the previous resume no longer describe this user
+        if self.gap_analysis_repository is not None:
+            self.gap_analysis_repository.delete_by_user_id(user_id)
+        if self.search_result_cache is not None:
+            self.search_result_cache.invalidate_user(user_id)
+
         logger.info("resume_saved", resume_id=saved_resume.id)
         return saved_resume
 
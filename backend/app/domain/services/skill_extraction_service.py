@@ -6,14 +6,29 @@ from app.domain.ports.llm_port import (
     LLMPort,
     SkillExtractionResult,
 )
+from app.domain.ports.repositories import GapAnalysisRepository
+from app.domain.skills.gap_engine import GapEngine
 from app.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 class SkillExtractionService:
-    def __init__(self, llm_service: LLMPort):
+    def __init__(
+        self,
+        llm_service: LLMPort,
+        gap_analysis_repository: GapAnalysisRepository | None = None,
+        gap_analysis_version: str = "v1",
+        gap_engine: GapEngine | None = None,
+        narrative_lease_seconds: int = 300,
+    ):
         self.llm_service = llm_service
+        self.gap_analysis_repository = gap_analysis_repository
+        # INFO: Bump when the model or gap prompt changes so stored results are not reused.
+        # Engine and LLM results differ, so which one produced a result is part of its version
+        self.gap_analysis_version = f"{gap_analysis_version}-{'engine' if gap_engine else 'llm'}"
+        self.gap_engine = gap_engine
+        self.narrative_lease_seconds = narrative_lease_seconds
 
     def extract_resume_skills(self, resume: Resume) -> SkillExtractionResult:
         logger.info("extracting_resume_skills", resume_id=resume.id)
@@ -66,9 +81,29 @@ class SkillExtractionService:
     def analyze_gap(self, resume: Resume, job: Job) -> GapAnalysisResult:
         logger.info("analyzing_gap", resume_id=resume.id, job_id=job.id)
 
+        if self.gap_analysis_repository is not None:
+            stored = self.gap_analysis_repository.find(resume.id, job.id, self.gap_analysis_version)
+            if stored is not None:
+                logger.info("gap_analysis_reused", resume_id=resume.id, job_id=job.id)
+                return stored
+
         resume_skills = resume.extract_skills()
         job_required_skills = job.required_skills or []
 
+        if self.gap_engine is not None:
+            result = self.gap_engine.analyze(
+                resume_skills, job_required_skills, job.nice_to_have_skills
+            )
+            logger.info(
+                "gap_analysis_computed",
+                resume_id=resume.id,
+                job_id=job.id,
+                match_score=result.overall_match_score,
+            )
+            if job_required_skills:
+                self._save_gap_analysis(resume, job, result)
+            return result
+
         if not job_required_skills:
             logger.warning("no_job_skills_to_compare", job_id=job.id)
             return GapAnalysisResult(
@@ -79,13 +114,59 @@ class SkillExtractionService:
                 recommendations=[],
             )
 
-        return self.llm_service.analyze_gap(
+        result = self.llm_service.analyze_gap(
             resume_text=resume.text,
             job_description=job.description,
             resume_skills=resume_skills,
             job_required_skills=job_required_skills,
         )
 
+        self._save_gap_analysis(resume, job, result)
+
+        return result
+
+    def claim_narrative(self, resume: Resume, job: Job) -> bool:
+        """Return True when the caller should queue the narrative for this analysis."""
+        if self.gap_analysis_repository is None:
+            return True
+
+        return self.gap_analysis_repository.claim_narration(
+            resume.id, job.id, self.gap_analysis_version, self.narrative_lease_seconds
+        )
+
+    def narrate_gap(self, resume: Resume, job: Job) -> GapAnalysisResult:
+        """Replace the placeholder summary and recommendations with an LLM narrative."""
+        result = self.analyze_gap(resume, job)
+        if result.narrated or not (result.matching_skills or result.missing_skills):
+            return result
+
+        summary, recommendations = self.llm_service.write_gap_narrative(
+            job_description=job.description,
+            matching_skills=result.matching_skills,
+            missing_skills=[gap.skill for gap in result.missing_skills],
+        )
+
+        result.summary = summary or result.summary
+        result.recommendations = recommendations or result.recommendations
+        result.narrated = True
+
+        self._save_gap_analysis(resume, job, result)
+        logger.info("gap_analysis_narrated", resume_id=resume.id, job_id=job.id)
+
+        return result
+
+    def _save_gap_analysis(self, resume: Resume, job: Job, result: GapAnalysisResult) -> None:
+        if self.gap_analysis_repository is None:
+            return
+
+        self.gap_analysis_repository.save(
+            user_id=resume.user_id,
+            resume_id=resume.id,
+            job_id=job.id,
+            version=self.gap_analysis_version,
+            result=result,
+        )
+
     def get_all_resume_skills(self, resume: Resume) -> list[str]:
         skills_result = self.extract_resume_skills(resume)
 
@@ -0,0 +1,452 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    """
+    A canonical skill with the spellings that refer to it.
+
+    Skills whose name is also an everyday word or a single letter (Go, R, C)
+    list exact_forms: in free text the name is then only recognized with one
+    of these exact casings, while aliases still match case-insensitively.
+    """
+
+    name: str
+    category: str
+    aliases: tuple[str, ...] = ()
+    exact_forms: tuple[str, ...] = ()
+
+
+SKILLS: tuple[SkillEntry, ...] = (
+    # Languages
+    SkillEntry("python", "language", ("python3",)),
+    SkillEntry("javascript", "language", ("js", "ecmascript", "es6")),
+    SkillEntry("typescript", "language"),
+    SkillEntry("java", "language"),
+    SkillEntry("kotlin", "language"),
+    SkillEntry("scala", "language"),
+    SkillEntry("go", "language", ("golang",), exact_forms=("Go", "GO")),
+    SkillEntry("rust", "language", exact_forms=("Rust",)),
+    SkillEntry("c", "language", exact_forms=("C",)),
+    SkillEntry("c++", "language", ("cpp", "cplusplus")),
+    SkillEntry("c#", "language", ("csharp", "c sharp")),
+    SkillEntry("ruby", "language"),
+    SkillEntry("php", "language"),
+    SkillEntry("swift", "language", exact_forms=("Swift",)),
+    SkillEntry("r", "language", ("rstats", "rlang"), exact_forms=("R",)),
+    SkillEntry("sql", "language"),
+    SkillEntry("bash", "language", ("shell scripting",)),
+    # Frameworks and libraries
+    SkillEntry("react", "framework", ("react.js", "reactjs")),
+    SkillEntry("vue", "framework", ("vue.js", "vuejs")),
+    SkillEntry("angular", "framework", ("angularjs",)),
+    SkillEntry("node", "framework", ("node.js", "nodejs")),
+    SkillEntry("express", "framework", ("express.js", "expressjs"), exact_forms=("Express",)),
+    SkillEntry("next.js", "framework", ("nextjs",)),
+    SkillEntry("django", "framework"),
+    SkillEntry("flask", "framework"),
+    SkillEntry("fastapi", "framework"),
+    SkillEntry("spring", "framework", ("spring boot", "springboot"), exact_forms=("Spring",)),
+    SkillEntry("rails", "framework", ("ruby on rails", "ror")),
+    SkillEntry(".net", "framework", ("dotnet", "asp.net")),
+    SkillEntry("graphql", "framework"),
+    SkillEntry("pandas", "framework"),
+    SkillEntry("numpy", "framework"),
+    SkillEntry("pytorch", "framework", ("torch",)),
+    SkillEntry("tensorflow", "framework"),
+    SkillEntry("scikit-learn", "framework", ("sklearn", "scikit learn")),
+    SkillEntry("spark", "framework", ("apache spark", "pyspark")),
+    # Databases
+    SkillEntry("postgresql", "database", ("postgres", "psql")),
+    SkillEntry("mysql", "database"),
+    SkillEntry("sqlite", "database"),
+    SkillEntry("mongodb", "database", ("mongo",)),
+    SkillEntry("redis", "database"),
+    SkillEntry("elasticsearch", "database", ("elastic search", "opensearch")),
+    SkillEntry("cassandra", "database"),
+    SkillEntry("dynamodb", "database", ("dynamo db",)),
+    SkillEntry("snowflake", "database"),
+    # Cloud and infrastructure
+    SkillEntry("aws", "cloud", ("amazon web services",)),
+    SkillEntry("gcp", "cloud", ("google cloud", "google cloud platform")),
+    SkillEntry("azure", "cloud", ("microsoft azure",)),
+    SkillEntry("docker", "devops", ("containerization",)),
+    SkillEntry("kubernetes", "devops", ("k8s",)),
+    SkillEntry("terraform", "devops"),
+    SkillEntry("ansible", "devops"),
+    SkillEntry("ci/cd", "devops", ("cicd", "continuous integration", "continuous delivery")),
+    SkillEntry("github actions", "devops"),
+    SkillEntry("jenkins", "devops"),
+    SkillEntry("linux", "devops", ("unix",)),
+    SkillEntry("kafka", "devops", ("apache kafka",)),
+    SkillEntry("rabbitmq", "devops"),
+    SkillEntry("prometheus", "devops"),
+    SkillEntry("grafana", "devops"),
+    # Data and ML
+    SkillEntry("machine learning", "data", ("ml",)),
+    SkillEntry("deep learning", "data"),
+    SkillEntry("llm", "data", ("llms", "large language models")),
+    SkillEntry("nlp", "data", ("natural language processing",)),
+    SkillEntry("computer vision", "data"),
+    SkillEntry("data engineering", "data"),
+    SkillEntry("airflow", "data", ("apache airflow",)),
+    SkillEntry("dbt", "data"),
+    # Practices and tools
+    SkillEntry("git", "tool"),
+    SkillEntry("rest", "concept", ("rest api", "restful", "rest apis"), exact_forms=("REST",)),
+    SkillEntry("grpc", "concept"),
+    SkillEntry("microservices", "concept", ("microservice architecture",)),
+    SkillEntry("distributed systems", "concept"),
+    SkillEntry("system design", "concept"),
+    SkillEntry("testing", "concept", ("unit testing", "automated testing", "test automation")),
+    SkillEntry("agile", "concept", ("scrum",)),
+    # More languages
+    SkillEntry("perl", "language"),
+    SkillEntry("haskell", "language"),
+    SkillEntry("elixir", "language"),
+    SkillEntry("erlang", "language"),
+    SkillEntry("clojure", "language"),
+    SkillEntry("f#", "language", ("fsharp",)),
+    SkillEntry("ocaml", "language"),
+    SkillEntry("dart", "language", exact_forms=("Dart",)),
+    SkillEntry("lua", "language"),
+    SkillEntry("julia", "language", exact_forms=("Julia",)),
+    SkillEntry("matlab", "language"),
+    SkillEntry("objective-c", "language", ("objective c", "objc")),
+    SkillEntry("groovy", "language"),
+    SkillEntry("solidity", "language"),
+    SkillEntry("zig", "language"),
+    SkillEntry("powershell", "language"),
+    SkillEntry("html", "language", ("html5",)),
+    SkillEntry("css", "language", ("css3",)),
+    SkillEntry("sass", "language", ("scss",)),
+    SkillEntry("webassembly", "language", ("wasm",)),
+    SkillEntry("cobol", "language"),
+    SkillEntry("fortran", "language"),
+    SkillEntry("assembly", "language", ("x86 assembly", "asm")),
+    SkillEntry("vhdl", "language"),
+    SkillEntry("verilog", "language"),
+    SkillEntry("plsql", "language", ("pl/sql",)),
+    SkillEntry("t-sql", "language", ("tsql", "transact-sql")),
+    # Frontend and mobile
+    SkillEntry("svelte", "framework", ("sveltekit",)),
+    SkillEntry("nuxt", "framework", ("nuxt.js", "nuxtjs")),
+    SkillEntry("redux", "framework"),
+    SkillEntry("jquery", "framework"),
+    SkillEntry("tailwind", "framework", ("tailwindcss", "tailwind css")),
+    SkillEntry("bootstrap", "framework"),
+    SkillEntry("webpack", "tool"),
+    SkillEntry("vite", "tool"),
+    SkillEntry("babel", "tool"),
+    SkillEntry("storybook", "tool"),
+    SkillEntry("react native", "framework"),
+    SkillEntry("flutter", "framework"),
+    SkillEntry("android", "framework", ("android sdk",)),
+    SkillEntry("ios", "framework", ("ios sdk",), exact_forms=("iOS",)),
+    SkillEntry("swiftui", "framework"),
+    SkillEntry("jetpack compose", "framework"),
+    SkillEntry("xamarin", "framework"),
+    SkillEntry("electron", "framework", exact_forms=("Electron",)),
+    SkillEntry("three.js", "framework", ("threejs",)),
+    SkillEntry("d3.js", "framework", ("d3",)),
+    SkillEntry("accessibility", "concept", ("a11y", "wcag")),
+    # Backend frameworks
+    SkillEntry("nestjs", "framework", ("nest.js",)),
+    SkillEntry("koa", "framework"),
+    SkillEntry("hapi", "framework"),
+    SkillEntry("deno", "framework"),
+    SkillEntry("laravel", "framework"),
+    SkillEntry("symfony", "framework"),
+    SkillEntry("asp.net core", "framework", ("aspnet core",)),
+    SkillEntry("entity framework", "framework", ("ef core",)),
+    SkillEntry("actix", "framework", ("actix-web",)),
+    SkillEntry("tokio", "framework"),
+    SkillEntry("play framework", "framework"),
+    SkillEntry("micronaut", "framework"),
+    SkillEntry("quarkus", "framework"),
+    SkillEntry("hibernate", "framework"),
+    SkillEntry("sqlalchemy", "framework"),
+    SkillEntry("celery", "framework"),
+    SkillEntry("pydantic", "framework"),
+    SkillEntry("asyncio", "framework"),
+    SkillEntry("langchain", "framework"),
+    SkillEntry("langgraph", "framework"),
+    SkillEntry("llamaindex", "framework", ("llama index",)),
+    SkillEntry("grpc-web", "framework"),
+    SkillEntry("protobuf", "framework", ("protocol buffers",)),
+    SkillEntry("openapi", "concept", ("swagger",)),
+    SkillEntry("websockets", "concept", ("websocket",)),
+    SkillEntry("oauth", "concept", ("oauth2", "oauth 2.0")),
+    SkillEntry("openid connect", "concept", ("oidc",)),
+    SkillEntry("jwt", "concept", ("json web tokens",)),
+    # Data stores and search
+    SkillEntry("mariadb", "database"),
+    SkillEntry("oracle", "database", ("oracle db", "oracle database"), exact_forms=("Oracle",)),
+    SkillEntry("sql server", "database", ("mssql", "microsoft sql server")),
+    SkillEntry("cockroachdb", "database"),
+    SkillEntry("neo4j", "database"),
+    SkillEntry("couchbase", "database"),
+    SkillEntry("couchdb", "database"),
+    SkillEntry("firebase", "database", ("firestore",)),
+    SkillEntry("supabase", "database"),
+    SkillEntry("memcached", "database"),
+    SkillEntry("clickhouse", "database"),
+    SkillEntry("bigquery", "database", ("google bigquery",)),
+    SkillEntry("redshift", "database", ("amazon redshift",)),
+    SkillEntry("databricks", "database"),
+    SkillEntry("hbase", "database"),
+    SkillEntry("influxdb", "database"),
+    SkillEntry("timescaledb", "database"),
+    SkillEntry("pinecone", "database"),
+    SkillEntry("weaviate", "database"),
+    SkillEntry("milvus", "database"),
+    SkillEntry("pgvector", "database"),
+    SkillEntry("solr", "database", ("apache solr",)),
+    SkillEntry("lucene", "database"),
+    SkillEntry("etcd", "database"),
+    SkillEntry("s3", "cloud", ("amazon s3",)),
+    # Cloud services
+    SkillEntry("ec2", "cloud", ("amazon ec2",)),
+    SkillEntry("lambda", "cloud", ("aws lambda",), exact_forms=("Lambda",)),
+    SkillEntry("ecs", "cloud", ("amazon ecs",)),
+    SkillEntry("eks", "cloud", ("amazon eks",)),
+    SkillEntry("gke", "cloud", ("google kubernetes engine",)),
+    SkillEntry("aks", "cloud", ("azure kubernetes service",)),
+    SkillEntry("cloudformation", "cloud", ("aws cloudformation",)),
+    SkillEntry("cdk", "cloud", ("aws cdk",)),
+    SkillEntry("sqs", "cloud", ("amazon sqs",)),
+    SkillEntry("sns", "cloud", ("amazon sns",)),
+    SkillEntry("kinesis", "cloud", ("amazon kinesis",)),
+    SkillEntry("cloud run", "cloud", ("google cloud run",)),
+    SkillEntry("cloud functions", "cloud"),
+    SkillEntry("app engine", "cloud", ("google app engine",)),
+    SkillEntry("azure functions", "cloud"),
+    SkillEntry("azure devops", "devops"),
+    SkillEntry("heroku", "cloud"),
+    SkillEntry("vercel", "cloud"),
+    SkillEntry("netlify", "cloud"),
+    SkillEntry("cloudflare", "cloud", ("cloudflare workers",)),
+    SkillEntry("digitalocean", "cloud", ("digital ocean",)),
+    SkillEntry("openstack", "cloud"),
+    SkillEntry("serverless", "cloud", ("serverless framework",)),
+    # DevOps and observability
+    SkillEntry("helm", "devops", exact_forms=("Helm",)),
+    SkillEntry("argo cd", "devops", ("argocd",)),
+    SkillEntry("istio", "devops"),
+    SkillEntry("linkerd", "devops"),
+    SkillEntry("envoy", "devops", exact_forms=("Envoy",)),
+    SkillEntry("nginx", "devops"),
+    SkillEntry("haproxy", "devops"),
+    SkillEntry("apache", "devops", ("apache httpd",), exact_forms=("Apache",)),
+    SkillEntry("pulumi", "devops"),
+    SkillEntry("packer", "devops", exact_forms=("Packer",)),
+    SkillEntry("vagrant", "devops"),
+    SkillEntry("saltstack", "devops"),
+    SkillEntry("gitlab ci", "devops", ("gitlab-ci", "gitlab ci/cd")),
+    SkillEntry("circleci", "devops", ("circle ci",)),
+    SkillEntry("travis ci", "devops", ("travisci",)),
+    SkillEntry("teamcity", "devops"),
+    SkillEntry("bazel", "tool"),
+    SkillEntry("gradle", "tool"),
+    SkillEntry("maven", "tool"),
+    SkillEntry("make", "tool", ("makefile", "makefiles"), exact_forms=("GNU Make",)),
+    SkillEntry("cmake", "tool"),
+    SkillEntry("podman", "devops"),
+    SkillEntry("openshift", "devops"),
+    SkillEntry("nomad", "devops", exact_forms=("Nomad",)),
+    SkillEntry("consul", "devops", exact_forms=("Consul",)),
+    SkillEntry("vault", "devops", ("hashicorp vault",), exact_forms=("Vault",)),
+    SkillEntry("datadog", "devops"),
+    SkillEntry("new relic", "devops", ("newrelic",)),
+    SkillEntry("splunk", "devops"),
+    SkillEntry("elk", "devops", ("elk stack", "elastic stack")),
+    SkillEntry("logstash", "devops"),
+    SkillEntry("kibana", "devops"),
+    SkillEntry("opentelemetry", "devops", ("otel",)),
+    SkillEntry("jaeger", "devops"),
+    SkillEntry("sentry", "devops", exact_forms=("Sentry",)),
+    SkillEntry("pagerduty", "devops"),
+    SkillEntry("sre", "concept", ("site reliability engineering",)),
+    SkillEntry("observability", "concept"),
+    SkillEntry("infrastructure as code", "concept", ("iac",)),
+    SkillEntry("gitops", "concept"),
+    SkillEntry("devops", "concept", ("devsecops",)),
+    # Messaging and streaming
+    SkillEntry("pulsar", "devops", ("apache pulsar",)),
+    SkillEntry("nats", "devops"),
+    SkillEntry("activemq", "devops"),
+    SkillEntry("zeromq", "devops", ("zmq",)),
+    SkillEntry("flink", "data", ("apache flink",)),
+    SkillEntry("beam", "data", ("apache beam",)),
+    SkillEntry("storm", "data", ("apache storm",)),
+    SkillEntry("hadoop", "data", ("hdfs", "mapreduce")),
+    SkillEntry("hive", "data", ("apache hive",)),
+    SkillEntry("presto", "data", ("trino",)),
+    SkillEntry("kafka streams", "data"),
+    SkillEntry("spark streaming", "data"),
+    SkillEntry("delta lake", "data"),
+    SkillEntry("iceberg", "data", ("apache iceberg",)),
+    SkillEntry("parquet", "data", ("apache parquet",)),
+    SkillEntry("dagster", "data"),
+    SkillEntry("prefect", "data"),
+    SkillEntry("luigi", "data"),
+    SkillEntry("fivetran", "data"),
+    SkillEntry("airbyte", "data"),
+    SkillEntry("etl", "data", ("elt", "data pipelines")),
+    SkillEntry("data warehousing", "data", ("data warehouse",)),
+    SkillEntry("data modeling", "data", ("data modelling",)),
+    SkillEntry("looker", "data"),
+    SkillEntry("tableau", "data"),
+    SkillEntry("power bi", "data", ("powerbi",)),
+    SkillEntry("excel", "tool", ("microsoft excel",)),
+    SkillEntry("statistics", "data", ("statistical analysis",)),
+    SkillEntry("a/b testing", "data", ("ab testing", "experimentation")),
+    # Machine learning
+    SkillEntry("keras", "framework"),
+    SkillEntry("jax", "framework"),
+    SkillEntry("xgboost", "framework"),
+    SkillEntry("lightgbm", "framework"),
+    SkillEntry("catboost", "framework"),
+    SkillEntry("hugging face", "framework", ("huggingface",)),
+    SkillEntry("spacy", "framework"),
+    SkillEntry("nltk", "framework"),
+    SkillEntry("opencv", "framework"),
+    SkillEntry("mlflow", "tool"),
+    SkillEntry("kubeflow", "tool"),
+    SkillEntry("sagemaker", "cloud", ("amazon sagemaker",)),
+    SkillEntry("vertex ai", "cloud"),
+    SkillEntry("mlops", "concept"),
+    SkillEntry("reinforcement learning", "data"),
+    SkillEntry("generative ai", "data", ("genai", "gen ai")),
+    SkillEntry("prompt engineering", "data"),
+    SkillEntry("rag", "data", ("retrieval augmented generation",), exact_forms=("RAG",)),
+    SkillEntry("fine-tuning", "data", ("fine tuning", "finetuning")),
+    SkillEntry("embeddings", "data", ("vector embeddings",)),
+    SkillEntry("vector search", "data", ("semantic search",)),
+    SkillEntry("recommender systems", "data", ("recommendation systems",)),
+    SkillEntry("time series", "data", ("time series analysis",)),
+    SkillEntry("feature engineering", "data"),
+    SkillEntry("cuda", "tool"),
+    SkillEntry("onnx", "tool"),
+    SkillEntry("triton", "tool", exact_forms=("Triton",)),
+    SkillEntry("vllm", "tool"),
+    SkillEntry("jupyter", "tool", ("jupyter notebook", "jupyterlab")),
+    SkillEntry("matplotlib", "framework"),
+    SkillEntry("seaborn", "framework"),
+    SkillEntry("plotly", "framework"),
+    SkillEntry("polars", "framework"),
+    SkillEntry("dask", "framework"),
+    SkillEntry("scipy", "framework"),
+    # Testing and quality
+    SkillEntry("pytest", "tool"),
+    SkillEntry("junit", "tool"),
+    SkillEntry("jest", "tool"),
+    SkillEntry("mocha", "tool"),
+    SkillEntry("cypress", "tool"),
+    SkillEntry("playwright", "tool"),
+    SkillEntry("selenium", "tool"),
+    SkillEntry("testng", "tool"),
+    SkillEntry("rspec", "tool"),
+    SkillEntry("postman", "tool"),
+    SkillEntry("k6", "tool"),
+    SkillEntry("jmeter", "tool", ("apache jmeter",)),
+    SkillEntry("tdd", "concept", ("test driven development", "test-driven development")),
+    SkillEntry("bdd", "concept", ("behavior driven development",)),
+    SkillEntry("integration testing", "concept"),
+    SkillEntry("load testing", "concept", ("performance testing",)),
+    SkillEntry("code review", "concept", ("code reviews",)),
+    SkillEntry("static analysis", "concept", ("linting",)),
+    SkillEntry("sonarqube", "tool"),
+    # Tools
+    SkillEntry("github", "tool"),
+    SkillEntry("gitlab", "tool"),
+    SkillEntry("bitbucket", "tool"),
+    SkillEntry("jira", "tool"),
+    SkillEntry("confluence", "tool"),
+    SkillEntry("figma", "tool"),
+    SkillEntry("vim", "tool", ("neovim",)),
+    SkillEntry("vs code", "tool", ("vscode", "visual studio code")),
+    SkillEntry("intellij", "tool", ("intellij idea",)),
+    SkillEntry("npm", "tool"),
+    SkillEntry("yarn", "tool"),
+    SkillEntry("pnpm", "tool"),
+    SkillEntry("pip", "tool"),
+    SkillEntry("poetry", "tool", exact_forms=("Poetry",)),
+    SkillEntry("conda", "tool", ("anaconda",)),
+    SkillEntry("uv", "tool", exact_forms=("uv",)),
+    # Concepts and practices
+    SkillEntry("object-oriented programming", "concept", ("oop", "object oriented programming")),
+    SkillEntry("functional programming", "concept"),
+    SkillEntry("data structures", "concept", ("data structures and algorithms",)),
+    SkillEntry("design patterns", "concept"),
+    SkillEntry("domain-driven design", "concept", ("ddd", "domain driven design")),
+    SkillEntry("event-driven architecture", "concept", ("event driven architecture", "eda")),
+    SkillEntry("event sourcing", "concept", ("cqrs",)),
+    SkillEntry("hexagonal architecture", "concept", ("ports and adapters", "clean architecture")),
+    SkillEntry("api design", "concept"),
+    SkillEntry("concurrency", "concept", ("multithreading", "parallel programming")),
+    SkillEntry("performance optimization", "concept", ("performance tuning", "profiling")),
+    SkillEntry("caching", "concept"),
+    SkillEntry("scalability", "concept", ("high availability",)),
+    SkillEntry("networking", "concept", ("tcp/ip", "computer networking")),
+    SkillEntry("security", "concept", ("application security", "appsec", "cybersecurity")),
+    SkillEntry("owasp", "concept"),
+    SkillEntry("penetration testing", "concept", ("pentesting",)),
+    SkillEntry("cryptography", "concept"),
+    SkillEntry("identity and access management", "concept", ("iam",)),
+    SkillEntry("compliance", "concept", ("soc 2", "soc2", "gdpr", "hipaa")),
+    SkillEntry("database design", "concept", ("schema design",)),
+    SkillEntry("query optimization", "concept", ("sql tuning",)),
+    SkillEntry("orm", "concept"),
+    SkillEntry("embedded systems", "concept", ("firmware",)),
+    SkillEntry("rtos", "concept"),
+    SkillEntry("blockchain", "concept", ("web3",)),
+    SkillEntry("game development", "concept", ("gamedev",)),
+    SkillEntry("unity", "framework", ("unity3d",), exact_forms=("Unity",)),
+    SkillEntry("unreal engine", "framework", ("ue4", "ue5")),
+    SkillEntry("kanban", "concept"),
+    SkillEntry("technical writing", "concept"),
+    SkillEntry("mentoring", "soft_skill", ("mentorship",)),
+    SkillEntry("leadership", "soft_skill", ("technical leadership", "team lead")),
+    SkillEntry("communication", "soft_skill", ("communication skills",)),
+    SkillEntry("collaboration", "soft_skill", ("teamwork",)),
+    SkillEntry("problem solving", "soft_skill", ("problem-solving",)),
+    SkillEntry("project management", "soft_skill"),
+    SkillEntry("stakeholder management", "soft_skill"),
+    SkillEntry("product management", "soft_skill"),
+)
+
+
+def load_skill_entries(path: str | Path) -> tuple[SkillEntry, ...]:
+    """
+    Load additional skills from a JSON file: a list of objects with "name",
+    "category" and optional "aliases" / "exact_forms" lists. Large curated
+    vocabularies ship this way rather than in source.
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    return tuple(
+        SkillEntry(
+            name=item["name"],
+            category=item.get("category", "other"),
+            aliases=tuple(item.get("aliases", [])),
+            exact_forms=tuple(item.get("exact_forms", [])),
+        )
+        for item in raw
+    )
+
+
+_extra_entries: tuple[SkillEntry, ...] = ()
+
+
+def register_skill_entries(entries: tuple[SkillEntry, ...]) -> None:
+    """Extend the built-in dictionary. Call at startup, before the first extraction."""
+    global _extra_entries
+    _extra_entries = _extra_entries + tuple(entries)
+
+
+def get_skill_entries() -> tuple[SkillEntry, ...]:
+    return SKILLS + _extra_entries
@@ -0,0 +1,167 @@
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+from app.domain.skills.dictionary import SkillEntry, get_skill_entries
+from app.domain.skills.taxonomy import normalize_skill
+
+# INFO: "+" and "#" are part of tokens so "c" never matches inside "c++" or "c#"
+_WORD_CHARS = frozenset("+#_")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in _WORD_CHARS
+
+
+class _Pattern:
+    __slots__ = ("length", "canonical", "exact_forms")
+
+    def __init__(self, length: int, canonical: str, exact_forms: frozenset[str] | None) -> None:
+        self.length = length
+        self.canonical = canonical
+        # INFO: None means any casing is accepted
+        self.exact_forms = exact_forms
+
+
+class SkillExtractor:
+    """
+    Finds dictionary skills in free text with a single Aho-Corasick automaton.
+
+    Every canonical name and alias is compiled into one trie with failure
+    links, so extraction is one linear pass over the text regardless of the
+    dictionary size. Matches must sit on word boundaries, overlapping matches
+    resolve to the leftmost-longest, and results are memoized by text.
+    """
+
+    def __init__(self, entries: tuple[SkillEntry, ...], cache_size: int = 1024) -> None:
+        self.cache_size = cache_size
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[_Pattern]] = [[]]
+
+        for entry in entries:
+            self._add_entry(entry)
+        self._build_failure_links()
+
+        self._cache: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def extract(self, text: str) -> list[str]:
+        """Canonical skill names in order of first appearance."""
+        key = hashlib.sha1(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return list(cached)
+
+        skills = self._scan(text)
+
+        with self._lock:
+            self._cache[key] = skills
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return list(skills)
+
+    def _add_entry(self, entry: SkillEntry) -> None:
+        canonical = normalize_skill(entry.name)
+        exact = frozenset(entry.exact_forms)
+
+        surfaces: dict[str, frozenset[str] | None] = {}
+        if not exact:
+            surfaces[canonical] = None
+        for alias in entry.aliases:
+            surfaces[normalize_skill(alias)] = None
+        for form in exact:
+            lowered = form.lower()
+            if lowered not in surfaces:
+                surfaces[lowered] = frozenset(f for f in exact if f.lower() == lowered)
+
+        for surface, exact_forms in surfaces.items():
+            if surface:
+                self._add_pattern(surface, _Pattern(len(surface), canonical, exact_forms))
+
+    def _add_pattern(self, surface: str, pattern: _Pattern) -> None:
+        state = 0
+        for char in surface:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def _scan(self, text: str) -> list[str]:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # INFO: A few characters change length when lowercased, keep offsets aligned
+            lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        matches: list[tuple[int, int, str]] = []
+        state = 0
+
+        for end, char in enumerate(lowered, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern in outputs[state]:
+                start = end - pattern.length
+                if not self._on_boundary(lowered, start, end):
+                    continue
+                if pattern.exact_forms is not None and text[start:end] not in pattern.exact_forms:
+                    continue
+                matches.append((start, end, pattern.canonical))
+
+        return self._resolve(matches)
+
+    def _on_boundary(self, text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+            return False
+        return True
+
+    def _resolve(self, matches: list[tuple[int, int, str]]) -> list[str]:
+        """Keep leftmost-longest non-overlapping matches, deduplicated by canonical name."""
+        matches.sort(key=lambda match: (match[0], -match[1]))
+
+        skills: dict[str, None] = {}
+        covered_until = 0
+
+        for start, end, canonical in matches:
+            if start < covered_until:
+                continue
+            skills.setdefault(canonical, None)
+            covered_until = end
+
+        return list(skills)
+
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    return SkillExtractor(get_skill_entries())
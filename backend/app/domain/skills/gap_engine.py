@@ -0,0 +1,135 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from app.domain.ports.embedding_port import EmbeddingPort
+from app.domain.ports.llm_port import GapAnalysisResult, SkillGap
+from app.domain.skills.taxonomy import SkillTaxonomy
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class GapEngine:
+    """
+    Deterministic skill gap analysis.
+
+    Skills on both sides are resolved through the taxonomy, so aliases such as
+    "k8s" and "kubernetes" match exactly. Required skills that are still
+    unmatched are compared to the resume's skills by embedding similarity,
+    which catches near-synonyms the taxonomy does not list. No LLM is involved;
+    the narrative fields get a plain summary that an LLM pass may replace.
+    """
+
+    def __init__(
+        self,
+        taxonomy: SkillTaxonomy,
+        embedding_service: EmbeddingPort | None = None,
+        fuzzy_threshold: float = 0.8,
+        max_cached_embeddings: int = 4096,
+    ) -> None:
+        self.taxonomy = taxonomy
+        self.embedding_service = embedding_service
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_cached_embeddings = max_cached_embeddings
+
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def analyze(
+        self,
+        resume_skills: list[str],
+        required_skills: list[str],
+        nice_to_have_skills: list[str] | None = None,
+    ) -> GapAnalysisResult:
+        resume = self.taxonomy.canonicalize_all(resume_skills)
+        required = self.taxonomy.canonicalize_all(required_skills)
+        nice_to_have = [
+            skill
+            for skill in self.taxonomy.canonicalize_all(nice_to_have_skills or [])
+            if skill not in required
+        ]
+
+        matched_required, missing_required = self._match(resume, required)
+        _, missing_nice_to_have = self._match(resume, nice_to_have)
+
+        missing = [self._gap(skill, "critical") for skill in missing_required] + [
+            self._gap(skill, "nice_to_have") for skill in missing_nice_to_have
+        ]
+
+        score = len(matched_required) / len(required) if required else 0.0
+
+        return GapAnalysisResult(
+            matching_skills=matched_required,
+            missing_skills=missing,
+            overall_match_score=round(score, 4),
+            summary=(
+                f"Matches {len(matched_required)} of {len(required)} required skills."
+                if required
+                else "Job has no extracted skills to compare against."
+            ),
+            recommendations=[gap.recommendation for gap in missing[:5]],
+            narrated=False,
+        )
+
+    def _match(self, resume: list[str], job_skills: list[str]) -> tuple[list[str], list[str]]:
+        resume_set = set(resume)
+        matched = [skill for skill in job_skills if skill in resume_set]
+        unmatched = [skill for skill in job_skills if skill not in resume_set]
+
+        if unmatched and resume and self.embedding_service is not None:
+            fuzzy = self._fuzzy_matches(unmatched, resume)
+            matched += [skill for skill in unmatched if skill in fuzzy]
+            unmatched = [skill for skill in unmatched if skill not in fuzzy]
+
+        return matched, unmatched
+
+    def _fuzzy_matches(self, job_skills: list[str], resume_skills: list[str]) -> set[str]:
+        try:
+            job_vectors = self._embed(job_skills)
+            resume_vectors = self._embed(resume_skills)
+        except Exception as e:
+            logger.warning("gap_engine_embedding_failed", error=str(e))
+            return set()
+
+        similarities = job_vectors @ resume_vectors.T
+        best = similarities.max(axis=1)
+
+        return {
+            skill
+            for skill, score in zip(job_skills, best, strict=True)
+            if score >= self.fuzzy_threshold
+        }
+
+    def _embed(self, skills: list[str]) -> np.ndarray:
+        """Unit-normalized embeddings, one row per skill, cached per skill name."""
+        with self._lock:
+            vectors = {
+                skill: self._embeddings[skill] for skill in skills if skill in self._embeddings
+            }
+
+        missing = [skill for skill in skills if skill not in vectors]
+        if missing and self.embedding_service is not None:
+            computed = np.asarray(
+                self.embedding_service.generate_embeddings_batch(missing), dtype=np.float32
+            )
+            norms = np.linalg.norm(computed, axis=1, keepdims=True)
+            computed = computed / np.where(norms == 0, 1.0, norms)
+            vectors.update(zip(missing, computed, strict=True))
+
+            with self._lock:
+                for skill in missing:
+                    self._embeddings[skill] = vectors[skill]
+                while len(self._embeddings) > self.max_cached_embeddings:
+                    self._embeddings.popitem(last=False)
+
+        return np.stack([vectors[skill] for skill in skills])
+
+    def _gap(self, skill: str, importance: str) -> SkillGap:
+        return SkillGap(
+            skill=skill,
+            category="missing",
+            importance=importance,
+            recommendation=f"Build hands-on experience with {skill}.",
+        )
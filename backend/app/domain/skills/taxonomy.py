@@ -0,0 +1,59 @@
+import re
+from functools import lru_cache
+
+from app.domain.skills.dictionary import SKILLS, SkillEntry, get_skill_entries
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+UNKNOWN_CATEGORY = "other"
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation, keeping c++/c#/.net intact."""
+    text = _WHITESPACE_RE.sub(" ", skill.strip().lower())
+    if text.endswith(".net"):
+        return text
+    return text.rstrip(",;:!?.")
+
+
+class SkillTaxonomy:
+    """Resolves skill spellings and aliases to one canonical name per skill."""
+
+    def __init__(self, entries: tuple[SkillEntry, ...] = SKILLS) -> None:
+        self._canonical: dict[str, str] = {}
+        self._category: dict[str, str] = {}
+
+        for entry in entries:
+            name = normalize_skill(entry.name)
+            self._category[name] = entry.category
+            self._canonical[name] = name
+            for alias in entry.aliases:
+                self._canonical.setdefault(normalize_skill(alias), name)
+
+    def canonicalize(self, skill: str) -> str:
+        normalized = normalize_skill(skill)
+        return self._canonical.get(normalized, normalized)
+
+    def canonicalize_all(self, skills: list[str]) -> list[str]:
+        """Canonical names in first-seen order, without duplicates or blanks."""
+        seen: dict[str, None] = {}
+        for skill in skills:
+            canonical = self.canonicalize(skill)
+            if canonical:
+                seen.setdefault(canonical, None)
+        return list(seen)
+
+    def category(self, skill: str) -> str:
+        return self._category.get(self.canonicalize(skill), UNKNOWN_CATEGORY)
+
+    def is_known(self, skill: str) -> bool:
+        return self.canonicalize(skill) in self._category
+
+    def aliases(self) -> dict[str, str]:
+        """Every known spelling mapped to its canonical name."""
+        return dict(self._canonical)
+
+
+@lru_cache(maxsize=1)
+def get_skill_taxonomy() -> SkillTaxonomy:
+    return SkillTaxonomy(get_skill_entries())
@@ -0,0 +1,153 @@
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from app.domain.skills.taxonomy import SkillTaxonomy, get_skill_taxonomy
+
+_WORD_BITS = 64
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits per uint64 word."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+
+    # INFO: NumPy < 2.0 has no popcount ufunc, count over the unpacked bytes instead
+    as_bytes = words.view(np.uint8).reshape(*words.shape, 8)
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1, dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class SkillMatrix:
+    """Packed skill bitsets, one row of uint64 words per job."""
+
+    bits: np.ndarray
+    counts: np.ndarray
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def match_scores(self, query: np.ndarray) -> np.ndarray:
+        """
+        Fraction of each row's skills present in query, as float32.
+        Rows without skills score 0.0.
+        """
+        query = _fit_width(query, self.bits.shape[1])
+        overlap = _popcount(self.bits & query).sum(axis=1, dtype=np.int32)
+
+        scores = np.zeros(len(self), dtype=np.float32)
+        np.divide(overlap, self.counts, out=scores, where=self.counts > 0)
+        return scores
+
+    def match_scores_many(self, queries: np.ndarray) -> np.ndarray:
+        """match_scores for a stack of query rows, shape (len(queries), len(self))."""
+        queries = _fit_width(queries, self.bits.shape[1])
+        overlap = _popcount(queries[:, None, :] & self.bits[None, :, :]).sum(axis=2, dtype=np.int32)
+
+        scores = np.zeros(overlap.shape, dtype=np.float32)
+        np.divide(overlap, self.counts, out=scores, where=self.counts > 0)
+        return scores
+
+
+class SkillVocabulary:
+    """
+    Interns canonical skill names to dense integer ids so skill sets can be
+    stored as bitsets and compared for many jobs at once with a popcount.
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy | None = None) -> None:
+        self.taxonomy = taxonomy or get_skill_taxonomy()
+        self._ids: dict[str, int] = {}
+        # INFO: Raw spelling -> id, skips canonicalization for spellings seen before
+        self._spellings: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def words(self) -> int:
+        return max(1, -(-len(self._ids) // _WORD_BITS))
+
+    def intern(self, skill: str) -> int:
+        skill_id = self._spellings.get(skill)
+        if skill_id is not None:
+            return skill_id
+
+        canonical = self.taxonomy.canonicalize(skill)
+
+        with self._lock:
+            skill_id = self._ids.setdefault(canonical, len(self._ids))
+            self._spellings[skill] = skill_id
+
+        return skill_id
+
+    def ids(self, skills: Iterable[str]) -> list[int]:
+        spellings = self._spellings
+        return [
+            spellings[skill] if skill in spellings else self.intern(skill)
+            for skill in skills
+            if skill and not skill.isspace()
+        ]
+
+    def encode(self, skills: Iterable[str]) -> np.ndarray:
+        """Pack a skill set into a row of uint64 words."""
+        skill_ids = np.asarray(self.ids(skills), dtype=np.int64)
+        row = np.zeros(self.words, dtype=np.uint64)
+
+        np.bitwise_or.at(row, skill_ids // _WORD_BITS, _bit(skill_ids))
+        return row
+
+    def encode_many(self, skill_lists: Sequence[Iterable[str] | None]) -> SkillMatrix:
+        """Pack one skill set per row into a SkillMatrix."""
+        row_ids: list[int] = []
+        skill_ids: list[int] = []
+
+        for row, skills in enumerate(skill_lists):
+            ids = self.ids(skills or ())
+            skill_ids.extend(ids)
+            row_ids.extend([row] * len(ids))
+
+        bits = pack_skill_ids(
+            np.asarray(row_ids, dtype=np.int64),
+            np.asarray(skill_ids, dtype=np.int64),
+            (len(skill_lists), self.words),
+        )
+
+        # INFO: Counted from the bits so duplicate or aliased skills count once
+        counts = _popcount(bits).sum(axis=1, dtype=np.int32)
+        return SkillMatrix(bits=bits, counts=counts)
+
+
+def pack_skill_ids(rows: np.ndarray, skill_ids: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """
+    Bitset rows from parallel (row, skill id) arrays. Ids beyond the last
+    word of shape are dropped, no row of a matrix that narrow can hold them.
+    """
+    keep = skill_ids < shape[1] * _WORD_BITS
+    rows, skill_ids = rows[keep], skill_ids[keep]
+
+    bits = np.zeros(shape, dtype=np.uint64)
+    np.bitwise_or.at(bits, (rows, skill_ids // _WORD_BITS), _bit(skill_ids))
+    return bits
+
+
+def _fit_width(words: np.ndarray, width: int) -> np.ndarray:
+    """Pad or trim the last axis to width words."""
+    # INFO: Skills interned after a matrix was built cannot appear in any of its rows
+    missing = width - words.shape[-1]
+    if missing > 0:
+        return np.pad(words, [(0, 0)] * (words.ndim - 1) + [(0, missing)])
+    return words[..., :width]
+
+
+def _bit(skill_ids: np.ndarray) -> np.ndarray:
+    return np.left_shift(np.uint64(1), (skill_ids % _WORD_BITS).astype(np.uint64))
+
+
+@lru_cache(maxsize=1)
+def get_skill_vocabulary() -> SkillVocabulary:
+    return SkillVocabulary()
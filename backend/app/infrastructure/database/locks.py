@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+from typing import Generator
+
+from sqlalchemy import text
+
+from app.infrastructure.database.session import engine
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@contextmanager
+def advisory_lock(key: int) -> Generator[bool, None, None]:
+    """
+    Try to take a Postgres session-level advisory lock without blocking.
+    Yields True when this process holds the lock for the duration of the block.
+    Non-Postgres databases (e.g. SQLite in tests) have no cross-process lock
+    and always yield True.
+    """
+    # INFO: Autocommit so the lock holder is not left idle in a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if conn.dialect.name != "postgresql":
+            yield True
+            return
+
+        acquired = bool(
+            conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar()
+        )
+        logger.debug("advisory_lock_attempted", key=key, acquired=acquired)
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                logger.debug("advisory_lock_released", key=key)
@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
 
@@ -30,6 +30,7 @@ class UserModel(Base):
 
 class ResumeModel(Base):
     __tablename__ = "resumes"
+    __table_args__ = (Index("ix_resumes_user_id_uploaded_at", "user_id", "uploaded_at"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -41,6 +42,16 @@ class ResumeModel(Base):
 
 class JobModel(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_fetched_at", "fetched_at"),
+        Index("ix_jobs_updated_at", "updated_at"),
+        Index(
+            "ix_jobs_extracted_skills",
+            "extracted_skills",
+            postgresql_using="gin",
+            postgresql_ops={"extracted_skills": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     external_id = Column(String, nullable=False)
@@ -51,11 +62,18 @@ class JobModel(Base):
     description = Column(String, nullable=False)
     url = Column(String, nullable=False)
     location = Column(String, nullable=True)
-    salary = Column(String, nullable=False)
+    salary = Column(String, nullable=True)
     posted_at = Column(DateTime, nullable=True)
     fetched_at = Column(DateTime, default=datetime.now(timezone.utc), nullable=False)
     pinecone_id = Column(String, nullable=False)
     extracted_skills = Column(JSONB, nullable=True)
+    # INFO: Bumped on every write, lexical indexes in other processes catch up from it
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
 
 
 class InterviewSessionModel(Base):
@@ -70,3 +88,96 @@ class InterviewSessionModel(Base):
     feedback = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.now(timezone.utc), nullable=False)
     completed_at = Column(DateTime, nullable=True)
+    # INFO: Bumped on every write, a flush only applies on top of the version it read
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+
+class SourceWatermarkModel(Base):
+    __tablename__ = "source_watermarks"
+
+    source = Column(String, primary_key=True)
+    query = Column(String, primary_key=True)
+    location = Column(String, primary_key=True, default="")
+    last_posted_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class RefreshScheduleModel(Base):
+    __tablename__ = "refresh_schedules"
+
+    query = Column(String, primary_key=True)
+    location = Column(String, primary_key=True, default="")
+    interval_seconds = Column(Integer, nullable=False)
+    next_run_at = Column(DateTime(timezone=True), nullable=True)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
+    last_new_count = Column(Integer, nullable=False, default=0)
+
+
+class IngestTaskModel(Base):
+    __tablename__ = "ingest_tasks"
+    __table_args__ = (Index("ix_ingest_tasks_claim", "stage", "status", "available_at"),)
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    job_id = Column(String, ForeignKey("jobs.id"), nullable=False)
+    stage = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    payload = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime(timezone=True), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class QuestionBankModel(Base):
+    __tablename__ = "question_bank"
+    __table_args__ = (Index("ix_question_bank_topic_difficulty", "topic", "difficulty"),)
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    topic = Column(String, nullable=False)
+    difficulty = Column(String, nullable=False)
+    text = Column(Text, nullable=False)
+    job_family_embedding = Column(JSONB, nullable=True)
+    times_served = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class GapAnalysisModel(Base):
+    __tablename__ = "gap_analyses"
+    __table_args__ = (Index("ix_gap_analyses_user_id", "user_id"),)
+
+    resume_id = Column(String, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    job_id = Column(String, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(String, primary_key=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    result = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    narration_claimed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ResumeVectorModel(Base):
+    __tablename__ = "resume_vectors"
+    __table_args__ = (Index("ix_resume_vectors_updated_at", "updated_at"),)
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    resume_id = Column(String, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
+    embedding = Column(JSONB, nullable=False)
+    skills = Column(JSONB, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class ResumeJobMatchModel(Base):
+    __tablename__ = "resume_job_matches"
+    __table_args__ = (Index("ix_resume_job_matches_resume_score", "resume_id", "score"),)
+
+    resume_id = Column(String, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    job_id = Column(String, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    similarity_score = Column(Float, nullable=False)
+    skill_match_score = Column(Float, nullable=False)
+    score = Column(Float, nullable=False)
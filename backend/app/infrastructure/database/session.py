@@ -1,7 +1,15 @@
+import threading
+from collections.abc import AsyncGenerator
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import Engine, create_engine, event
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
@@ -13,10 +21,11 @@ logger = get_logger(__name__)
 engine: Engine = create_engine(
     settings.DATABASE_URL,
     poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
     echo=settings.LOG_LEVEL == "DEBUG",
 )
 
@@ -76,6 +85,84 @@ def get_db_context() -> Generator[Session, None, None]:
         db.close()
 
 
+# INFO: Async driver for each sync driver DATABASE_URL may name
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_async_lock = threading.Lock()
+
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL with its driver swapped for the async one, asyncpg for Postgres."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend} databases")
+
+    return parsed.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Process-wide async engine, created on first use so that processes which
+    never touch it (scheduler, migrations) do not need the async driver.
+    """
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        return _async_engine
+
+    with _async_lock:
+        if _async_engine is None:
+            url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+            options = {}
+            # INFO: SQLite has no server side connection limit to size a pool against
+            if make_url(url).get_backend_name() != "sqlite":
+                options = {
+                    "pool_size": settings.DB_POOL_SIZE,
+                    "max_overflow": settings.DB_MAX_OVERFLOW,
+                    "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+                    "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+                }
+
+            engine = create_async_engine(
+                url, pool_pre_ping=True, echo=settings.LOG_LEVEL == "DEBUG", **options
+            )
+            _async_session_factory = async_sessionmaker(
+                bind=engine, autoflush=False, expire_on_commit=False
+            )
+            _async_engine = engine
+            logger.info("async_database_engine_created", pool_size=settings.DB_POOL_SIZE)
+
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    get_async_engine()
+    return _async_session_factory  # type: ignore[return-value]
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for async database sessions, the counterpart of get_db
+    for handlers that await their queries instead of blocking the event loop.
+    """
+    db: AsyncSession = get_async_session_factory()()
+    try:
+        yield db
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.error("database_error", error=str(e), exc_info=True)
+        raise
+    finally:
+        await db.close()
+
+
 def init_db() -> None:
     from app.infrastructure.database.models import Base
 
@@ -86,3 +173,15 @@ def init_db() -> None:
 
 def close_db() -> None:
     logger.info("database_shutdown", message="Closing database connections")
+
+
+async def close_async_db() -> None:
+    global _async_engine, _async_session_factory
+
+    if _async_engine is None:
+        return
+
+    logger.info("async_database_shutdown", message="Closing async database connections")
+    await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
@@ -0,0 +1,121 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Provider:
+    factory: Callable[[], Any]
+    on_close: Callable[[Any], None] | None = None
+    health_check: Callable[[Any], bool] | None = None
+    eager: bool = False
+
+
+class ResourceRegistry:
+    """
+    Process-wide container for expensive shared resources (models, clients).
+    Resources are created lazily on first use and shared by the request path
+    and background jobs alike.
+    """
+
+    def __init__(self) -> None:
+        self._providers: dict[str, _Provider] = {}
+        self._instances: dict[str, Any] = {}
+        self._init_order: list[str] = []
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        on_close: Callable[[Any], None] | None = None,
+        health_check: Callable[[Any], bool] | None = None,
+        eager: bool = False,
+    ) -> None:
+        with self._lock:
+            self._providers[name] = _Provider(
+                factory=factory,
+                on_close=on_close,
+                health_check=health_check,
+                eager=eager,
+            )
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            # Re-check under the lock, another thread may have won the race
+            instance = self._instances.get(name)
+            if instance is not None:
+                return instance
+
+            provider = self._providers.get(name)
+            if provider is None:
+                raise KeyError(f"Resource {name} is not registered")
+
+            logger.info("initializing_resource", resource=name)
+            instance = provider.factory()
+            self._instances[name] = instance
+            self._init_order.append(name)
+            logger.info("resource_initialized", resource=name)
+
+            return instance
+
+    def is_initialized(self, name: str) -> bool:
+        return name in self._instances
+
+    def startup(self) -> None:
+        """Initialize every resource registered as eager."""
+        for name, provider in list(self._providers.items()):
+            if provider.eager:
+                self.get(name)
+
+    def health(self) -> dict[str, str]:
+        statuses: dict[str, str] = {}
+
+        for name, provider in list(self._providers.items()):
+            instance = self._instances.get(name)
+
+            if instance is None:
+                statuses[name] = "not_initialized"
+                continue
+
+            if provider.health_check is None:
+                statuses[name] = "ok"
+                continue
+
+            try:
+                statuses[name] = "ok" if provider.health_check(instance) else "unhealthy"
+            except Exception as e:
+                logger.warning("resource_health_check_failed", resource=name, error=str(e))
+                statuses[name] = "unhealthy"
+
+        return statuses
+
+    def close(self) -> None:
+        """Close initialized resources in reverse initialization order."""
+        with self._lock:
+            for name in reversed(self._init_order):
+                instance = self._instances.pop(name, None)
+                provider = self._providers.get(name)
+
+                if instance is None or provider is None or provider.on_close is None:
+                    continue
+
+                try:
+                    provider.on_close(instance)
+                    logger.info("resource_closed", resource=name)
+                except Exception as e:
+                    logger.error("resource_close_failed", resource=name, error=str(e))
+
+            self._instances.clear()
+            self._init_order.clear()
+
+
+registry = ResourceRegistry()
@@ -0,0 +1,44 @@
+"""
+Standalone ingest worker: python -m app.infrastructure.scheduler.ingest_worker
+
+Run as many as needed, workers coordinate through SKIP LOCKED claims on the
+ingest_tasks table and resume leased work left by crashed workers.
+"""
+
+import signal
+import threading
+
+from app.core.config import settings
+from app.infrastructure.logging import get_logger, setup_logging
+from app.infrastructure.resources import registry
+from app.infrastructure.scheduler.scheduler import drain_ingest_queue_task
+
+logger = get_logger(__name__)
+
+
+def run_worker(stop_event: threading.Event) -> None:
+    logger.info("ingest_worker_started", poll_seconds=settings.INGEST_POLL_SECONDS)
+
+    while not stop_event.is_set():
+        processed = drain_ingest_queue_task(stop_event)
+
+        # INFO: Only sleep when the queue is empty
+        if processed == 0:
+            stop_event.wait(settings.INGEST_POLL_SECONDS)
+
+    registry.close()
+    logger.info("ingest_worker_stopped")
+
+
+def main() -> None:
+    setup_logging(settings.LOG_LEVEL)
+    stop_event = threading.Event()
+
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    run_worker(stop_event)
+
+
+if __name__ == "__main__":
+    main()
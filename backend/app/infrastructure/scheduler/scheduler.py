@@ -1,28 +1,60 @@
+import threading
+
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-
-from app.adapters.embedding.sentence_transformer_adapter import create_embedding_adapter
-from app.adapters.job_sources.adzuna_adapter import create_adzuna_adapter
-from app.adapters.job_sources.remoteok_adapter import create_remoteok_adapter
-from app.adapters.llm.local_llm_adapter import create_local_llm_adapter
-from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.ingest_task_repository import SQLAlchemyIngestTaskRepository
+from app.adapters.repositories.match_list_repository import SQLAlchemyMatchListRepository
+from app.adapters.repositories.refresh_state_repository import (
+    SQLAlchemyRefreshStateRepository,
+)
 from app.adapters.repositories.resume_repository import SQLAlchemyResumeRepository
-from app.adapters.vector_db.pinecone_adapter import create_pinecone_adapter
-from app.api.dependencies import get_job_service
+from app.api.dependencies import (
+    get_adzuna_adapter,
+    get_embedding_service,
+    get_ingest_service,
+    get_job_repository,
+    get_job_service,
+    get_lexical_index,
+    get_llm_service,
+    get_match_materializer,
+    get_ranked_search_cache,
+    get_remoteok_adapter,
+    get_resume_matrix_store,
+    get_search_result_cache,
+    get_vector_db,
+)
 from app.core.config import settings
+from app.domain.model.refresh import RefreshQuery
+from app.domain.services.ingest_service import IngestService
 from app.domain.services.job_matching_service import JobMatchingService
 from app.domain.services.skill_extraction_service import SkillExtractionService
+from app.infrastructure.database.locks import advisory_lock
 from app.infrastructure.database.session import get_db_context
 from app.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 scheduler: AsyncIOScheduler | None = None
 
+REFRESH_EXECUTOR = "refresh"
+INGEST_EXECUTOR = "ingest"
+
 
 def create_scheduler() -> AsyncIOScheduler:
     logger.info("creating_scheduler")
 
-    scheduler = AsyncIOScheduler()
+    # INFO: Blocking refresh work gets its own thread so the API event loop stays free
+    scheduler = AsyncIOScheduler(
+        executors={
+            "default": AsyncIOExecutor(),
+            REFRESH_EXECUTOR: ThreadPoolExecutor(max_workers=1),
+            INGEST_EXECUTOR: ThreadPoolExecutor(max_workers=1),
+        }
+    )
 
     cron_parts = settings.JOB_REFRESH_CRON.split()
 
@@ -42,14 +74,42 @@ def create_scheduler() -> AsyncIOScheduler:
             day_of_week=day_of_week,
         ),
         id="job_refresh",
-        name="Daily Job Refresh",
+        name="Job Refresh Plan",
+        executor=REFRESH_EXECUTOR,
+        max_instances=1,
+        coalesce=True,
         replace_existing=True,
     )
 
+    # INFO: Picks up retries and work left behind by crashed or stopped runs
+    scheduler.add_job(
+        func=drain_ingest_queue_task,
+        trigger=IntervalTrigger(seconds=settings.INGEST_POLL_SECONDS),
+        id="ingest_drain",
+        name="Ingest Queue Drain",
+        executor=INGEST_EXECUTOR,
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+    )
+
+    if settings.MATCH_LIST_ENABLED and settings.RESUME_MATRIX_DIR:
+        scheduler.add_job(
+            func=rebuild_resume_matrix_task,
+            trigger=IntervalTrigger(minutes=settings.RESUME_MATRIX_REBUILD_MINUTES),
+            id="resume_matrix_rebuild",
+            name="Resume Matrix Rebuild",
+            executor=INGEST_EXECUTOR,
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+
     logger.info(
         "scheduler_configured",
         cron=settings.JOB_REFRESH_CRON,
         job_id="job_refresh",
+        ingest_poll_seconds=settings.INGEST_POLL_SECONDS,
     )
 
     return scheduler
@@ -58,31 +118,59 @@ def create_scheduler() -> AsyncIOScheduler:
 def refresh_jobs_task():
     logger.info("job_refresh_task_started")
 
+    with advisory_lock(settings.JOB_REFRESH_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.info("job_refresh_task_skipped", reason="refresh_running_on_another_replica")
+            return
+
+        stop_event = threading.Event()
+        watchdog = threading.Timer(
+            settings.JOB_REFRESH_MAX_RUNTIME_SECONDS,
+            _on_refresh_timeout,
+            args=(stop_event,),
+        )
+        watchdog.daemon = True
+        watchdog.start()
+
+        try:
+            _run_refresh(stop_event)
+        finally:
+            watchdog.cancel()
+
+
+def _on_refresh_timeout(stop_event: threading.Event) -> None:
+    logger.error(
+        "job_refresh_task_timed_out",
+        max_runtime_seconds=settings.JOB_REFRESH_MAX_RUNTIME_SECONDS,
+    )
+    stop_event.set()
+
+
+def _run_refresh(stop_event: threading.Event) -> None:
     try:
         with get_db_context() as db:
-            job_repo = SQLAlchemyJobRepository(session=db)
+            job_repo = get_job_repository(db, get_lexical_index())
             resume_repo = SQLAlchemyResumeRepository(session=db)
+            refresh_state_repo = SQLAlchemyRefreshStateRepository(session=db)
+            match_list_repo = SQLAlchemyMatchListRepository(session=db)
 
-            embedding_service = create_embedding_adapter(settings.EMBEDDING_MODEL)
-
-            vector_db = create_pinecone_adapter(
-                api_key=settings.PINECONE_API_KEY,
-                index_name=settings.PINECONE_INDEX_NAME,
-                environment=settings.PINECONE_ENVIRONMENT,
-                dimension=embedding_service.get_embedding_dimension(),
-            )
-
-            llm_service = create_local_llm_adapter(
-                endpoint=settings.LLM_ENDPOINT,
-                timeout=60,
-            )
+            # INFO: Shared with the request path, the model is only loaded once per process
+            embedding_service = get_embedding_service()
+            vector_db = get_vector_db()
 
-            skill_extraction_service = SkillExtractionService(llm_service=llm_service)
+            skill_extraction_service = SkillExtractionService(llm_service=get_llm_service())
 
             job_matching_service = JobMatchingService(
-                vector_db=vector_db, embedding_service=embedding_service
+                vector_db=vector_db,
+                embedding_service=embedding_service,
+                similarity_weight=settings.MATCH_SIMILARITY_WEIGHT,
+                skill_weight=settings.MATCH_SKILL_WEIGHT,
+                lexical_index=get_lexical_index(),
+                rrf_k=settings.HYBRID_RRF_K,
             )
 
+            ingest_service = build_ingest_service(db)
+
             job_service = get_job_service(
                 job_repo=job_repo,
                 resume_repo=resume_repo,
@@ -90,20 +178,29 @@ def refresh_jobs_task():
                 embedding_service=embedding_service,
                 vector_db=vector_db,
                 skill_extraction_service=skill_extraction_service,
+                ingest_service=ingest_service,
+                refresh_state_repo=refresh_state_repo,
+                ranked_search_cache=get_ranked_search_cache(),
+                search_result_cache=get_search_result_cache(),
+                match_list_repo=match_list_repo,
+                match_materializer=get_match_materializer(
+                    match_list_repo, get_resume_matrix_store()
+                ),
             )
 
-            adzuna = create_adzuna_adapter(
-                app_id=settings.ADZUNA_APP_ID,
-                api_key=settings.ADZUNA_API_KEY,
-                country=settings.ADZUNA_COUNTRY,
-            )
-
-            remoteok = create_remoteok_adapter()
+            sources = [get_adzuna_adapter(), get_remoteok_adapter()]
 
-            sources = [adzuna, remoteok]
+            fetched, saved, duplicates = job_service.refresh_plan(
+                job_sources=sources,
+                plan=build_refresh_plan(),
+                min_interval_seconds=settings.JOB_REFRESH_MIN_INTERVAL_SECONDS,
+                max_interval_seconds=settings.JOB_REFRESH_MAX_INTERVAL_SECONDS,
+                stop_event=stop_event,
+                fetch_deadline_seconds=settings.JOB_SOURCE_FETCH_DEADLINE_SECONDS,
+            )
 
-            fetched, saved, duplicates = job_service.refresh_jobs(
-                job_sources=sources, query="software engineer", location=None, limit=50
+            processed = ingest_service.drain(
+                batch_size=settings.INGEST_BATCH_SIZE, stop_event=stop_event
             )
 
             logger.info(
@@ -111,11 +208,62 @@ def refresh_jobs_task():
                 fetched=fetched,
                 saved=saved,
                 duplicates=duplicates,
+                ingest_tasks_processed=processed,
             )
     except Exception as e:
         logger.error("job_refresh_task_failed", error=str(e), exc_info=True)
 
 
+def drain_ingest_queue_task(stop_event: threading.Event | None = None) -> int:
+    try:
+        with get_db_context() as db:
+            return build_ingest_service(db).drain(
+                batch_size=settings.INGEST_BATCH_SIZE, stop_event=stop_event
+            )
+    except Exception as e:
+        logger.error("ingest_drain_task_failed", error=str(e), exc_info=True)
+        return 0
+
+
+def rebuild_resume_matrix_task() -> None:
+    try:
+        with get_db_context() as db:
+            materializer = get_match_materializer(
+                SQLAlchemyMatchListRepository(session=db), get_resume_matrix_store()
+            )
+            if materializer is not None:
+                materializer.rebuild_resume_matrix()
+    except Exception as e:
+        logger.error("resume_matrix_rebuild_failed", error=str(e), exc_info=True)
+
+
+def build_ingest_service(db: Session) -> IngestService:
+    job_repo = get_job_repository(db, get_lexical_index())
+
+    return get_ingest_service(
+        task_repo=SQLAlchemyIngestTaskRepository(session=db),
+        job_repo=job_repo,
+        skill_extraction_service=SkillExtractionService(llm_service=get_llm_service()),
+        embedding_service=get_embedding_service(),
+        vector_db=get_vector_db(),
+        search_result_cache=get_search_result_cache(),
+        match_materializer=get_match_materializer(
+            SQLAlchemyMatchListRepository(session=db), get_resume_matrix_store()
+        ),
+    )
+
+
+def build_refresh_plan() -> list[RefreshQuery]:
+    return [
+        RefreshQuery(
+            query=entry["query"],
+            location=entry.get("location"),
+            limit=int(entry.get("limit", 50)),
+        )
+        for entry in settings.JOB_REFRESH_PLAN
+    ]
+
+
 def start_scheduler():
     global scheduler
 
@@ -6,18 +6,42 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.middleware import LoggingMiddleware
 from app.api.routes import interview, jobs, resume
 from app.core.config import settings
+from app.infrastructure.database.session import close_async_db
 from app.infrastructure.logging import get_logger, setup_logging
+from app.infrastructure.resources import registry
 from app.infrastructure.scheduler.scheduler import shutdown_scheduler, start_scheduler
 
 # INFO: Setup logging
 setup_logging(settings.LOG_LEVEL)
 logger = get_logger(__name__)
 
+
+# INFO: Lifespan handling
+@asynccontextmanager
+async def lifespan(app):
+    logger.info("application_startup", message="SkillGap API starting up")
+
+    # INFO: Pay the model load before the first request instead of during it
+    if settings.PRELOAD_RESOURCES:
+        registry.startup()
+
+    start_scheduler()
+    logger.info("scheduler_started")
+
+    yield
+
+    shutdown_scheduler()
+    registry.close()
+    await close_async_db()
+    logger.info("application_shutdown", message="SkillGap API shutting donw")
+
+
 # INFO: Create FastAPI app
 app = FastAPI(
     title="SkillGap API",
     description="AI-powered job search assistant",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # INFO: Add middlewares
@@ -35,20 +59,6 @@ app.add_middleware(
 )
 
 
-# INFO: Lifespan handling
-@asynccontextmanager
-async def lifespan(app):
-    logger.info("application_startup", message="SkillGap API starting up")
-
-    start_scheduler()
-    logger.info("scheduler_started")
-
-    yield
-
-    shutdown_scheduler()
-    logger.info("application_shutdown", message="SkillGap API shutting donw")
-
-
 # INFO: Register routes
 app.include_router(resume.router)
 app.include_router(jobs.router)
@@ -59,3 +69,8 @@ app.include_router(interview.router)
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "skillgap-ai"}
+
+
+@app.get("/health/resources")
+async def resources_health_check():
+    return {"resources": registry.health()}
@@ -0,0 +1,83 @@
+"""
+Measure batch (job -> resumes) scoring over a memory-mapped resume snapshot.
+
+Writes a snapshot of synthetic resumes to a temporary directory, then scores
+a batch of new jobs against it block by block, as MatchMaterializer does
+before merging each block into the per-resume match lists.
+
+Usage (from backend/):
+    python -m benchmarks.batch_score_benchmark --resumes 1000000 --jobs 20
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from app.domain.model.job import Job
+from app.domain.model.search import ResumeVector
+from app.domain.services.batch_scorer import BatchScorer
+from app.domain.services.resume_matrix import ResumeMatrixStore
+from app.domain.skills.dictionary import SKILLS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=200_000)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--block-size", type=int, default=8192)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+    names = [entry.name for entry in SKILLS]
+
+    def vectors():
+        for i in range(args.resumes):
+            yield ResumeVector(
+                user_id=str(i),
+                resume_id=str(i),
+                embedding=np_rng.normal(size=args.dimension).astype(np.float32).tolist(),
+                skills=rng.sample(names, rng.randint(5, 30)),
+            )
+
+    jobs = [
+        Job(
+            id=str(i),
+            external_id=str(i),
+            source="bench",
+            title="Engineer",
+            company="Bench",
+            description="",
+            url="",
+            pinecone_id="",
+            required_skills=rng.sample(names, rng.randint(3, 12)),
+        )
+        for i in range(args.jobs)
+    ]
+    embeddings = np_rng.normal(size=(args.jobs, args.dimension)).tolist()
+    scorer = BatchScorer(block_size=args.block_size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        matrix = ResumeMatrixStore(directory).rebuild(vectors())
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        blocks = rows = 0
+        for block in scorer.iter_blocks([matrix], jobs, embeddings):
+            blocks += 1
+            rows += len(block.resume_ids)
+        scoring = time.perf_counter() - start
+
+    print(f"resumes={args.resumes} jobs={args.jobs} block_size={args.block_size}")
+    print(f"snapshot build:   {build * 1000:10.1f} ms")
+    print(f"block scoring:    {scoring * 1000:10.1f} ms")
+    print(f"blocks scored:    {blocks} ({rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
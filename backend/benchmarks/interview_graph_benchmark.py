@@ -0,0 +1,113 @@
+"""
+Measure what an interview request pays for InterviewGraph construction.
+
+Compares compiling a fresh graph per request (the old per-request
+InterviewService behaviour) with the compiled graph the resource registry
+hands every request, as app.api.dependencies.get_interview_graph does.
+
+Usage (from backend/):
+    python -m benchmarks.interview_graph_benchmark --requests 200
+"""
+
+import argparse
+import statistics
+import time
+
+from app.domain.ports.llm_port import (
+    GapAnalysisResult,
+    JobSkillsResult,
+    LLMPort,
+    SkillExtractionResult,
+)
+from app.domain.services.interview_graph import InterviewGraph
+from app.infrastructure.resources import ResourceRegistry
+
+
+class _NoopLLM(LLMPort):
+    def extract_skills_from_resume(self, resume_text: str) -> SkillExtractionResult:
+        return SkillExtractionResult([], [], [], [], [])
+
+    def extract_skills_from_job(self, job_description: str) -> JobSkillsResult:
+        return JobSkillsResult([], [], [], None)
+
+    def analyze_gap(
+        self,
+        resume_text: str,
+        job_description: str,
+        resume_skills: list[str],
+        job_required_skills: list[str],
+    ) -> GapAnalysisResult:
+        return GapAnalysisResult([], [], 0.0, "", [])
+
+    def write_gap_narrative(
+        self,
+        job_description: str,
+        matching_skills: list[str],
+        missing_skills: list[str],
+    ) -> tuple[str, list[str]]:
+        return "", []
+
+    def generate_interview_question(
+        self,
+        job_description: str,
+        topic: str,
+        difficulty: str,
+        previous_question: list[str],
+    ) -> str:
+        return f"Tell me about {topic}."
+
+    def generate_interview_question_set(
+        self, job_description: str, topics: list[tuple[str, str]]
+    ) -> list[str]:
+        return [f"Tell me about {topic}." for topic, _ in topics]
+
+    def evaluate_interview_answer(self, question: str, answer: str, topic: str) -> dict:
+        return {"score": 7, "feedback": ""}
+
+
+def _time_ms(fn, requests: int) -> list[float]:
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<22} first={timings[0]:8.3f}ms "
+        f"median={statistics.median(timings):8.3f}ms p95={p95:8.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--total-questions", type=int, default=5)
+    args = parser.parse_args()
+
+    llm = _NoopLLM()
+
+    per_request = _time_ms(
+        lambda: InterviewGraph(llm_service=llm, total_questions=args.total_questions),
+        args.requests,
+    )
+
+    # INFO: A registry of its own, so the benchmark needs no settings or real LLM client
+    registry = ResourceRegistry()
+    registry.register(
+        "interview_graph",
+        factory=lambda: InterviewGraph(llm_service=llm, total_questions=args.total_questions),
+    )
+    cached = _time_ms(lambda: registry.get("interview_graph"), args.requests)
+    registry.close()
+
+    _report("compile per request", per_request)
+    _report("registry graph", cached)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure BM25 query latency over the in-process job index.
+
+Indexes synthetic job postings mixing skill dictionary names with words
+drawn Zipf-like from a larger vocabulary, then times resume-length queries.
+Every query is timed cold: its rare terms are weighted on first use, as they
+are after any indexing clears the weights.
+
+Usage (from backend/):
+    python -m benchmarks.lexical_search_benchmark --jobs 50000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.adapters.lexical_index.bm25_index import BM25Index
+from app.domain.model.job import Job
+from app.domain.skills.dictionary import SKILLS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--query-words", type=int, default=400)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--max-query-terms", type=int, default=16)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [entry.name for entry in SKILLS]
+    words = [f"word{i}" for i in range(args.vocabulary)]
+    weights = [1 / (rank + 1) for rank in range(args.vocabulary)]
+
+    def text(count: int) -> str:
+        skills = rng.choices(names, k=count // 5)
+        return " ".join(skills + rng.choices(words, weights=weights, k=count - len(skills)))
+
+    jobs = [
+        Job(
+            id=str(i),
+            external_id=str(i),
+            source="bench",
+            title=f"{rng.choice(names)} Engineer",
+            company="Bench",
+            description=text(200),
+            url="",
+            pinecone_id="",
+            required_skills=rng.sample(names, rng.randint(3, 12)),
+        )
+        for i in range(args.jobs)
+    ]
+
+    index = BM25Index(max_query_terms=args.max_query_terms)
+    start = time.perf_counter()
+    index.index_jobs(jobs)
+    build = time.perf_counter() - start
+
+    queries = [text(args.query_words) for _ in range(args.queries)]
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, top_k=50)
+        samples.append(time.perf_counter() - start)
+
+    print(f"jobs={args.jobs} query_words={args.query_words} max_query_terms={args.max_query_terms}")
+    print(f"index build:  {build * 1000:10.1f} ms")
+    print(f"query median: {statistics.median(samples) * 1000:10.3f} ms")
+    print(f"query p95:    {sorted(samples)[int(len(samples) * 0.95)] * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,25 @@
-from typing import Generator
+import asyncio
+from typing import AsyncGenerator, Callable, Generator
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.core.config import settings
+from app.domain.model.job import Job
+from app.domain.model.resume import Resume
+from app.domain.services.job_matching_service import JobMatchingService
+from app.domain.services.job_service import JobService
 from app.infrastructure.database.models import Base
-from app.infrastructure.database.session import get_db
+from app.infrastructure.database.session import get_async_db, get_db
 from app.main import app
 
 TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -54,19 +64,44 @@ def test_db_session(test_db_engine) -> Generator[Session, None, None]:
 
 
 @pytest.fixture(scope="function")
-def client(test_db_session: Session) -> Generator[TestClient, None, None]:
+async def test_async_db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:
+    # INFO: Same SQLite file as test_db_engine, which has already created the tables
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+    session_local = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async with session_local() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def client(
+    test_db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TestClient, None, None]:
+    # INFO: Tests never load the real embedding model or reach the LLM at startup
+    monkeypatch.setattr(settings, "PRELOAD_RESOURCES", False)
+
     def override_get_db() -> Generator[Session, None, None]:
         try:
             yield test_db_session
         finally:
             pass
 
+    async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with async_sessionmaker(bind=async_engine, expire_on_commit=False)() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
 
     app.dependency_overrides.clear()
+    asyncio.run(async_engine.dispose())
 
 
 @pytest.fixture(scope="function")
@@ -81,3 +116,62 @@ def default_user(test_db_session: Session) -> str:
     test_db_session.refresh(user)
 
     return str(user.id)
+
+
+@pytest.fixture
+def make_job() -> Callable[..., Job]:
+    def make(job_id: str, **fields) -> Job:
+        defaults = dict(
+            external_id=job_id,
+            source="adzuna",
+            title=f"Engineer {job_id}",
+            company="Acme",
+            description="",
+            url="",
+            pinecone_id=job_id,
+        )
+        return Job(id=job_id, **{**defaults, **fields})
+
+    return make
+
+
+@pytest.fixture
+def make_job_service(make_job: Callable[..., Job]) -> Callable[..., JobService]:
+    """
+    JobService over mocks, vector search ranks jobs "0" to num_jobs - 1 in that order.
+    Keyword arguments add or replace any of its collaborators.
+    """
+
+    def make(num_jobs: int = 3, **services) -> JobService:
+        jobs = {str(i): make_job(str(i), required_skills=["python"]) for i in range(num_jobs)}
+
+        job_repo = MagicMock()
+        job_repo.find_summaries_by_ids.side_effect = lambda ids: [jobs[i] for i in ids if i in jobs]
+        job_repo.bulk_save.side_effect = lambda new_jobs: new_jobs
+        job_repo.find_existing_dedup_hashes.return_value = set()
+        resume_repo = MagicMock()
+        resume_repo.find_by_user_id.return_value = Resume(
+            id="r1", user_id="u1", text="Python", file_path="", pinecone_id=""
+        )
+
+        vector_db = MagicMock()
+        vector_db.search_similar.return_value = [
+            {"score": 1.0 - i / 100, "metadata": {"job_id": str(i)}} for i in range(num_jobs)
+        ]
+        embedding_service = MagicMock()
+        embedding_service.generate_embedding.return_value = [0.1]
+
+        defaults = dict(
+            job_repository=job_repo,
+            resume_repository=resume_repo,
+            job_matching_service=JobMatchingService(
+                vector_db=vector_db, embedding_service=embedding_service
+            ),
+            embedding_service=embedding_service,
+            vector_db=vector_db,
+            skill_extraction_service=MagicMock(),
+            ingest_service=MagicMock(),
+        )
+        return JobService(**{**defaults, **services})
+
+    return make
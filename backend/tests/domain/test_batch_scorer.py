@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.domain.model.job import Job
+from app.domain.model.search import ResumeVector
+from app.domain.services.batch_scorer import BatchScorer
+from app.domain.services.match_materializer import MatchMaterializer
+from app.domain.services.resume_matrix import ResumeMatrix, ResumeMatrixStore
+
+SKILLS = ["python", "sql", "java", "go", "docker"]
+
+
+def _vectors(count: int, dimension: int = 8) -> list[ResumeVector]:
+    rng = np.random.default_rng(0)
+    return [
+        ResumeVector(
+            user_id=f"user-{i}",
+            resume_id=f"resume-{i}",
+            embedding=rng.normal(size=dimension).tolist(),
+            skills=list(rng.choice(SKILLS, size=int(rng.integers(0, 4)), replace=False)),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+def test_memory_mapped_blocks_match_dense_scores(
+    tmp_path: Path, make_job: Callable[..., Job]
+) -> None:
+    vectors = _vectors(50)
+    jobs = [
+        make_job("a", required_skills=["python", "sql"]),
+        make_job("b", required_skills=["go"]),
+        make_job("c", required_skills=[]),
+    ]
+    embeddings = np.random.default_rng(1).normal(size=(3, 8)).tolist()
+
+    snapshot = ResumeMatrixStore(tmp_path).rebuild(iter(vectors))
+    assert isinstance(snapshot.embeddings, np.memmap)
+
+    scorer = BatchScorer(block_size=16)
+    blocks = list(scorer.iter_blocks([snapshot], jobs, embeddings))
+    assert [len(block.resume_ids) for block in blocks] == [16, 16, 16, 2]
+
+    dense = BatchScorer(block_size=1000).iter_blocks(
+        [ResumeMatrix.from_vectors(vectors)], jobs, embeddings
+    )
+    np.testing.assert_allclose(
+        np.concatenate([block.scores for block in blocks]), next(dense).scores, rtol=1e-6
+    )
+
+    skill = np.concatenate([block.skill for block in blocks])
+    for row, vector in enumerate(vectors):
+        assert skill[row, 0] == len({"python", "sql"} & set(vector.skills)) / 2
+
+
+@pytest.mark.unit
+def test_blocks_span_every_matrix_and_exclude_replaced_users(make_job: Callable[..., Job]) -> None:
+    vectors = _vectors(40)
+    jobs = [
+        make_job("a", required_skills=["python"]),
+        make_job("b", required_skills=["docker", "java"]),
+    ]
+    embeddings = np.random.default_rng(2).normal(size=(2, 8)).tolist()
+    snapshot = ResumeMatrix.from_vectors(vectors[:30]).without_users({"user-0", "user-1"})
+    updates = ResumeMatrix.from_vectors(vectors[30:])
+
+    blocks = list(BatchScorer(block_size=7).iter_blocks([snapshot, updates], jobs, embeddings))
+
+    # INFO: Blocks never straddle two matrices
+    assert [len(block.resume_ids) for block in blocks] == [7, 7, 7, 7, 2, 7, 3]
+    resume_ids = [resume_id for block in blocks for resume_id in block.resume_ids]
+    assert resume_ids == [f"resume-{i}" for i in range(40)]
+
+    scores = np.concatenate([block.scores for block in blocks])
+    assert scores.shape == (40, 2)
+    assert np.isneginf(scores[:2]).all()
+    assert np.isfinite(scores[2:]).all()
+
+
+@pytest.mark.unit
+def test_resumes_saved_after_snapshot_replace_their_rows(
+    tmp_path: Path, make_job: Callable[..., Job]
+) -> None:
+    store = ResumeMatrixStore(tmp_path)
+    old = ResumeVector(user_id="u1", resume_id="old", embedding=[1.0, 0.0], skills=["python"])
+    other = ResumeVector(user_id="u2", resume_id="other", embedding=[0.0, 1.0], skills=[])
+    new = ResumeVector(user_id="u1", resume_id="new", embedding=[1.0, 0.0], skills=["python"])
+
+    repository = MagicMock()
+    repository.iter_resume_vectors.return_value = iter([old, other])
+    repository.find_resume_vectors.return_value = [new]
+    repository.find_score_floors.return_value = {}
+
+    materializer = MatchMaterializer(repository=repository, matrix_store=store)
+    materializer.rebuild_resume_matrix()
+    store.rebuild(iter([old, other]))
+    assert len([path for path in tmp_path.iterdir() if path.is_dir()]) == 2
+
+    materializer.score_new_jobs([make_job("j1", required_skills=["python"])], [[1.0, 0.0]])
+
+    built_at = repository.find_resume_vectors.call_args.kwargs["updated_after"]
+    assert built_at > datetime.now(timezone.utc) - timedelta(minutes=1)
+    merged = {
+        resume_id for call in repository.merge_matches.call_args_list for resume_id in call.args[0]
+    }
+    assert merged == {"new", "other"}
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.skills.gap_engine import GapEngine
+from app.domain.skills.taxonomy import SkillTaxonomy
+
+
+@pytest.mark.unit
+def test_aliases_resolve_to_canonical_skills() -> None:
+    engine = GapEngine(taxonomy=SkillTaxonomy())
+
+    result = engine.analyze(
+        resume_skills=["Python3", "Postgres", "K8s"],
+        required_skills=["python", "PostgreSQL", "kubernetes", "Terraform"],
+        nice_to_have_skills=["golang"],
+    )
+
+    assert result.matching_skills == ["python", "postgresql", "kubernetes"]
+    assert [(gap.skill, gap.importance) for gap in result.missing_skills] == [
+        ("terraform", "critical"),
+        ("go", "nice_to_have"),
+    ]
+    assert result.overall_match_score == 0.75
+    assert not result.narrated
+
+
+@pytest.mark.unit
+def test_embedding_similarity_matches_unlisted_synonyms() -> None:
+    vectors = {
+        "message queues": [1.0, 0.0],
+        "kafka": [0.9, 0.1],
+        "terraform": [0.0, 1.0],
+    }
+    embedding_service = MagicMock()
+    embedding_service.generate_embeddings_batch.side_effect = lambda skills: [
+        vectors[skill] for skill in skills
+    ]
+    engine = GapEngine(
+        taxonomy=SkillTaxonomy(), embedding_service=embedding_service, fuzzy_threshold=0.9
+    )
+
+    result = engine.analyze(
+        resume_skills=["kafka"], required_skills=["message queues", "terraform"]
+    )
+
+    assert result.matching_skills == ["message queues"]
+    assert [gap.skill for gap in result.missing_skills] == ["terraform"]
@@ -0,0 +1,112 @@
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.adapters.lexical_index.bm25_index import BM25Index, tokenize
+from app.adapters.repositories.indexed_job_repository import IndexedJobRepository
+from app.domain.model.job import Job
+from app.domain.model.resume import Resume
+from app.domain.services.job_matching_service import JobMatchingService
+from app.domain.services.ranking import reciprocal_rank_fusion
+
+
+@pytest.fixture
+def jobs(make_job: Callable[..., Job]) -> list[Job]:
+    return [
+        make_job(
+            "1", title="Backend Engineer", description="Build APIs with FastAPI and PostgreSQL"
+        ),
+        make_job(
+            "2", title="Frontend Engineer", description="React and TypeScript user interfaces"
+        ),
+        make_job(
+            "3",
+            title="Data Engineer",
+            description="Spark pipelines",
+            required_skills=["python", "sql"],
+        ),
+        make_job("4", title="Engineer", description="Embedded C++ firmware for sensors"),
+    ]
+
+
+@pytest.mark.unit
+def test_tokenizer_keeps_technology_names() -> None:
+    assert tokenize("C++, C# and Node.js. Done.") == ["c++", "c#", "and", "node.js", "done"]
+
+
+@pytest.mark.unit
+def test_bm25_ranks_exact_keyword_matches(jobs: list[Job]) -> None:
+    index = BM25Index()
+    index.index_jobs(jobs)
+
+    assert [job_id for job_id, _ in index.search("fastapi developer")] == ["1"]
+    assert index.search("c++")[0][0] == "4"
+    # INFO: "engineer" is in every job, it is dropped instead of matching everything
+    assert index.search("engineer") == []
+
+    ranked = index.search("python spark typescript")
+    assert {job_id for job_id, _ in ranked} == {"2", "3"}
+
+
+@pytest.mark.unit
+def test_reindexing_replaces_the_previous_version(
+    make_job: Callable[..., Job], jobs: list[Job]
+) -> None:
+    index = BM25Index()
+    index.index_jobs(jobs)
+    index.index_jobs([make_job("2", title="Frontend Engineer", description="Vue single page apps")])
+
+    assert len(index) == 4
+    assert index.search("react") == []
+    assert index.search("vue")[0][0] == "2"
+
+    for _ in range(3):
+        index.index_jobs(
+            [make_job(str(i), title="Engineer", description=f"Kotlin {i}") for i in range(1, 500)]
+        )
+    assert len(index) == 499
+    assert len(index.search("kotlin", top_k=1000)) == 0
+    assert [job_id for job_id, _ in index.search("kotlin 42")] == ["42"]
+
+
+@pytest.mark.unit
+def test_indexed_repository_indexes_only_saved_jobs(jobs: list[Job]) -> None:
+    inner = MagicMock()
+    inner.bulk_save.return_value = [jobs[0]]
+    index = BM25Index()
+
+    IndexedJobRepository(repository=inner, lexical_index=index).bulk_save(jobs[:2])
+
+    assert len(index) == 1
+    assert index.search("fastapi")[0][0] == "1"
+
+
+@pytest.mark.unit
+def test_hybrid_search_fuses_keyword_hits_with_vector_results(jobs: list[Job]) -> None:
+    index = BM25Index()
+    index.index_jobs(jobs)
+
+    vector_db = MagicMock()
+    vector_db.search_similar.return_value = [
+        {"id": "job-2", "score": 0.9, "metadata": {"job_id": "2", "type": "job"}},
+        {"id": "job-1", "score": 0.8, "metadata": {"job_id": "1", "type": "job"}},
+    ]
+    service = JobMatchingService(
+        vector_db=vector_db, embedding_service=MagicMock(), lexical_index=index
+    )
+    resume = Resume(id="r1", user_id="u1", text="FastAPI and Spark", file_path="", pinecone_id="")
+
+    results = service.find_similar_jobs(resume, top_k=3)
+
+    assert [result["metadata"]["job_id"] for result in results] == ["1", "2", "3"]
+    assert results[0]["id"] == "job-1"
+    assert results[0]["score"] == pytest.approx((1 / 62 + 1 / 61) / (2 / 61))
+
+
+@pytest.mark.unit
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a"]], k=1)
+
+    assert [item for item, _ in fused] == ["a", "c", "b"]
+    assert fused[0][1] == pytest.approx(1 / 2 + 1 / 3)
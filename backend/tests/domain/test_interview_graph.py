@@ -0,0 +1,147 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api import dependencies
+from app.domain.services.interview_graph import InterviewGraph
+from app.domain.services.question_prefetcher import QuestionPrefetcher
+from app.infrastructure.resources import registry
+
+
+@pytest.mark.unit
+def test_compiled_graph_is_shared_until_registry_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    llms = iter([MagicMock(), MagicMock()])
+    monkeypatch.setattr(dependencies, "get_llm_service", lambda: next(llms))
+    monkeypatch.setattr(dependencies, "get_question_prefetcher", lambda: None)
+    monkeypatch.setattr(dependencies, "get_question_bank", lambda: None)
+    registry.close()
+
+    graph = dependencies.get_interview_graph()
+    assert dependencies.get_interview_graph() is graph
+
+    # INFO: A closed registry must not hand out a graph bound to the old dependencies
+    registry.close()
+    rebuilt = dependencies.get_interview_graph()
+
+    assert rebuilt is not graph
+    assert rebuilt.llm_service is not graph.llm_service
+    registry.close()
+
+
+@pytest.mark.unit
+def test_next_question_is_served_from_prefetch_slot() -> None:
+    llm = MagicMock()
+    llm.generate_interview_question.side_effect = lambda **kwargs: f"Q about {kwargs['topic']}"
+    llm.evaluate_interview_answer.return_value = {"score": 8, "feedback": "Solid"}
+    prefetcher = QuestionPrefetcher(max_workers=1)
+    graph = InterviewGraph(llm_service=llm, total_questions=3, question_prefetcher=prefetcher)
+
+    state = graph.create_initial_state(
+        session_id="s1",
+        job_id="job-1",
+        job_title="Backend Engineer",
+        job_description="Python and Kubernetes",
+        resume_text="",
+        skill_gaps=["python", "kubernetes"],
+    )
+    state = graph.graph.invoke(state)
+    state["answers"].append({"text": "answer"})
+    state = graph.graph.invoke(state)
+
+    assert [q["text"] for q in state["questions"]] == ["Q about python", "Q about kubernetes"]
+    topics = [call.kwargs["topic"] for call in llm.generate_interview_question.call_args_list]
+    assert topics.count("kubernetes") == 1
+    prefetcher.close()
+
+
+@pytest.mark.unit
+def test_prefetched_question_is_discarded_when_flow_changes() -> None:
+    prefetcher = QuestionPrefetcher(max_workers=1)
+    prefetcher.prefetch("s1", (1, "python", "easy"), lambda: "stale question")
+
+    assert prefetcher.take("s1", (1, "python", "medium")) is None
+    assert prefetcher.take("s1", (1, "python", "easy")) is None
+    prefetcher.close()
+
+
+@pytest.mark.unit
+def test_answer_is_evaluated_while_next_question_is_generated() -> None:
+    release = threading.Event()
+    llm = MagicMock()
+
+    def generate_interview_question(**kwargs) -> str:
+        return f"Q about {kwargs['topic']}"
+
+    def evaluate_interview_answer(**kwargs) -> dict:
+        # INFO: Only returns once generation ran concurrently and released it
+        assert release.wait(timeout=5)
+        return {"score": 6, "feedback": "Mention trade-offs"}
+
+    def generate_then_release(**kwargs) -> str:
+        release.set()
+        return generate_interview_question(**kwargs)
+
+    llm.generate_interview_question.side_effect = generate_interview_question
+    llm.evaluate_interview_answer.side_effect = evaluate_interview_answer
+    graph = InterviewGraph(llm_service=llm, total_questions=2)
+
+    state = graph.create_initial_state(
+        session_id="s1",
+        job_id="job-1",
+        job_title="Backend Engineer",
+        job_description="Python",
+        resume_text="",
+        skill_gaps=["python"],
+    )
+    state = graph.graph.invoke(state)
+    llm.generate_interview_question.side_effect = generate_then_release
+
+    state["answers"].append({"text": "first answer"})
+    state = graph.graph.invoke(state)
+
+    assert len(state["questions"]) == 2
+    assert state["current_question_index"] == 1
+    assert state["answers"][0]["score"] == 6
+    assert state["status"] == "in_progress"
+
+    state["answers"].append({"text": "second answer"})
+    state = graph.graph.invoke(state)
+
+    assert state["status"] == "completed"
+    assert state["overall_score"] == pytest.approx(0.6)
+    assert llm.generate_interview_question.call_count == 2
+
+
+@pytest.mark.unit
+def test_batch_mode_generates_question_set_once() -> None:
+    llm = MagicMock()
+    llm.generate_interview_question_set.side_effect = lambda job_description, topics: [
+        f"Q about {topic} ({difficulty})" for topic, difficulty in topics
+    ]
+    llm.evaluate_interview_answer.return_value = {"score": 9, "feedback": "Great"}
+    graph = InterviewGraph(llm_service=llm, total_questions=3, question_mode="batch")
+
+    state = graph.create_initial_state(
+        session_id="s1",
+        job_id="job-1",
+        job_title="Backend Engineer",
+        job_description="Python and Go",
+        resume_text="",
+        skill_gaps=["python", "go"],
+    )
+    state = graph.graph.invoke(state)
+
+    for answer in ("a1", "a2", "a3"):
+        state["answers"].append({"text": answer})
+        state = graph.graph.invoke(state)
+
+    assert [q["text"] for q in state["questions"]] == [
+        "Q about python (easy)",
+        "Q about go (easy)",
+        "Q about python (medium)",
+    ]
+    assert state["status"] == "completed"
+    llm.generate_interview_question_set.assert_called_once()
+    llm.generate_interview_question.assert_not_called()
+    assert llm.evaluate_interview_answer.call_count == 3
@@ -0,0 +1,50 @@
+from typing import Callable
+
+import pytest
+
+from app.domain.services.job_service import JobService
+from app.domain.services.ranked_search_cache import (
+    RankedSearchCache,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.mark.unit
+def test_follow_up_pages_are_served_from_cached_ranking(
+    make_job_service: Callable[..., JobService],
+) -> None:
+    service = make_job_service(5, ranked_search_cache=RankedSearchCache())
+
+    first = service.search_jobs("u1", top_k=5, page_size=2)
+    second = service.search_jobs("u1", top_k=5, page_size=2, cursor=first.next_cursor)
+    third = service.search_jobs("u1", top_k=5, page_size=2, cursor=second.next_cursor)
+
+    assert [m.job.id for m in first.matches] == ["0", "1"]
+    assert [m.job.id for m in second.matches] == ["2", "3"]
+    assert [m.job.id for m in third.matches] == ["4"]
+    assert third.next_cursor is None
+    assert first.total == 5
+    assert service.vector_db.search_similar.call_count == 1
+    assert service.job_repository.find_summaries_by_ids.call_args.args[0] == ["4"]
+
+
+@pytest.mark.unit
+def test_expired_cursor_reranks_and_continues_at_offset(
+    make_job_service: Callable[..., JobService],
+) -> None:
+    service = make_job_service(5, ranked_search_cache=RankedSearchCache(ttl_seconds=0.0))
+
+    first = service.search_jobs("u1", top_k=5, page_size=2)
+    second = service.search_jobs("u1", top_k=5, page_size=2, cursor=first.next_cursor)
+
+    assert [m.job.id for m in second.matches] == ["2", "3"]
+    assert service.vector_db.search_similar.call_count == 2
+
+
+@pytest.mark.unit
+def test_cursor_round_trip_and_rejects_garbage() -> None:
+    assert decode_cursor(encode_cursor("abc", 40)) == ("abc", 40)
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
@@ -0,0 +1,71 @@
+from typing import Callable
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.domain.model.job import Job
+from app.domain.model.resume import Resume
+from app.domain.services.job_matching_service import JobMatchingService
+from app.domain.services.ranking import combine_scores, top_k_indices
+
+
+@pytest.mark.unit
+def test_top_k_matches_full_sort() -> None:
+    rng = np.random.default_rng(3)
+    scores = rng.random(1000).astype(np.float32)
+
+    expected = np.argsort(-scores, kind="stable")
+
+    for k in (1, 10, 999, 1000, 5000, None):
+        np.testing.assert_array_equal(top_k_indices(scores, k), expected[:k])
+    assert top_k_indices(scores, 0).size == 0
+
+
+@pytest.mark.unit
+def test_top_k_ties_keep_input_order() -> None:
+    scores = np.array([0.5, 0.9, 0.5, 0.5, 0.1], dtype=np.float32)
+
+    assert top_k_indices(scores, 3).tolist() == [1, 0, 2]
+
+
+@pytest.mark.unit
+def test_combine_scores_uses_weights() -> None:
+    combined = combine_scores(np.array([1.0, 0.0]), np.array([0.0, 1.0]), 0.5, 0.5)
+
+    np.testing.assert_allclose(combined, [0.5, 0.5])
+
+
+@pytest.mark.unit
+def test_rank_search_results_reuses_search_and_returns_top_page(
+    make_job: Callable[..., Job],
+) -> None:
+    embedding_service = MagicMock()
+    vector_db = MagicMock()
+    service = JobMatchingService(
+        vector_db=vector_db,
+        embedding_service=embedding_service,
+        similarity_weight=0.5,
+        skill_weight=0.5,
+    )
+
+    resume = Resume(id="r1", user_id="u1", text="Python, SQL", file_path="", pinecone_id="")
+    jobs = [
+        make_job("a", required_skills=["python", "sql"]),
+        make_job("b", required_skills=["java"]),
+        make_job("c", required_skills=["python", "rust"]),
+    ]
+    search_results = [
+        {"score": 0.9, "metadata": {"job_id": "b"}},
+        {"score": 0.6, "metadata": {"job_id": "a"}},
+        {"score": 0.8, "metadata": {"job_id": "c"}},
+        {"score": 0.99, "metadata": {"job_id": "missing"}},
+    ]
+
+    matches = service.rank_search_results(resume, jobs, search_results, limit=2)
+
+    assert [match.job.id for match in matches] == ["a", "c"]
+    assert matches[0].combined_score == pytest.approx(0.8)
+    assert matches[1].skill_match_score == pytest.approx(0.5)
+    embedding_service.generate_embedding.assert_not_called()
+    vector_db.search_similar.assert_not_called()
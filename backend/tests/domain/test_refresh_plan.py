@@ -0,0 +1,262 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.model.refresh import RefreshQuery, RefreshSchedule
+from app.domain.ports.job_source_port import JobSourcePort
+from app.domain.services.job_service import JobService
+
+
+class FakeJobSource(JobSourcePort):
+    def __init__(self, name: str, jobs_by_query: dict[str, list[dict]]):
+        self.name = name
+        self.jobs_by_query = jobs_by_query
+
+    def fetch_jobs(self, query="software engineer", location=None, limit=50, since=None):
+        return self.jobs_by_query.get(query, [])
+
+    def get_source_name(self) -> str:
+        return self.name
+
+
+def _raw_job(title: str, company: str = "Acme") -> dict:
+    return {
+        "external_id": title,
+        "title": title,
+        "company": company,
+        "description": f"{title} at {company}",
+        "url": "https://example.com",
+        "location": "Remote",
+    }
+
+
+@pytest.mark.unit
+def test_schedule_backs_off_when_query_yields_nothing() -> None:
+    now = datetime.now(timezone.utc)
+    schedule = RefreshSchedule(query="rust", location=None, interval_seconds=3600)
+
+    schedule.record_run(
+        new_count=0, limit=50, now=now, min_interval_seconds=60, max_interval_seconds=5000
+    )
+
+    assert schedule.interval_seconds == 5000
+    assert schedule.next_run_at == now + timedelta(seconds=5000)
+    assert not schedule.is_due(now)
+
+
+@pytest.mark.unit
+def test_schedule_speeds_up_when_query_saturates_limit() -> None:
+    now = datetime.now(timezone.utc)
+    schedule = RefreshSchedule(query="python", location=None, interval_seconds=3600)
+
+    schedule.record_run(
+        new_count=40, limit=50, now=now, min_interval_seconds=60, max_interval_seconds=86400
+    )
+
+    assert schedule.interval_seconds == 1800
+
+
+@pytest.mark.unit
+def test_refresh_plan_dedups_across_queries_before_ingest() -> None:
+    job_repository = MagicMock()
+    job_repository.find_existing_dedup_hashes.return_value = set()
+    job_repository.bulk_save.side_effect = lambda jobs: jobs
+    ingest_service = MagicMock()
+
+    service = JobService(
+        job_repository=job_repository,
+        resume_repository=MagicMock(),
+        job_matching_service=MagicMock(),
+        embedding_service=MagicMock(),
+        vector_db=MagicMock(),
+        skill_extraction_service=MagicMock(),
+        ingest_service=ingest_service,
+    )
+    source = FakeJobSource(
+        "remoteok",
+        {
+            "python": [_raw_job("Backend Engineer"), _raw_job("Data Engineer")],
+            "backend": [_raw_job("Backend Engineer")],
+        },
+    )
+
+    fetched, saved, duplicates = service.refresh_plan(
+        job_sources=[source],
+        plan=[RefreshQuery(query="python"), RefreshQuery(query="backend")],
+        respect_schedule=False,
+    )
+
+    assert (fetched, saved, duplicates) == (3, 2, 1)
+    (enqueued_jobs,), _ = ingest_service.enqueue_jobs.call_args
+    assert len(enqueued_jobs) == 2
+
+
+class BlockingJobSource(FakeJobSource):
+    def __init__(self, name: str, release: threading.Event):
+        super().__init__(name, {})
+        self.release = release
+
+    def fetch_jobs(self, query="software engineer", location=None, limit=50, since=None):
+        self.release.wait(timeout=5)
+        return [_raw_job(f"{self.name} engineer")]
+
+
+@pytest.mark.unit
+def test_refresh_plan_stops_without_saving_when_stop_event_set() -> None:
+    job_repository = MagicMock()
+    release = threading.Event()
+    stop_event = threading.Event()
+
+    service = JobService(
+        job_repository=job_repository,
+        resume_repository=MagicMock(),
+        job_matching_service=MagicMock(),
+        embedding_service=MagicMock(),
+        vector_db=MagicMock(),
+        skill_extraction_service=MagicMock(),
+        ingest_service=MagicMock(),
+    )
+    threading.Timer(0.05, stop_event.set).start()
+
+    started = time.monotonic()
+    result = service.refresh_plan(
+        job_sources=[BlockingJobSource("remoteok", release)],
+        plan=[RefreshQuery(query="python")],
+        respect_schedule=False,
+        stop_event=stop_event,
+    )
+    release.set()
+
+    assert result == (0, 0, 0)
+    assert time.monotonic() - started < 3
+    job_repository.bulk_save.assert_not_called()
+
+
+@pytest.mark.unit
+def test_refresh_plan_abandons_fetches_past_the_deadline() -> None:
+    job_repository = MagicMock()
+    job_repository.find_existing_dedup_hashes.return_value = set()
+    job_repository.bulk_save.side_effect = lambda jobs: jobs
+    release = threading.Event()
+
+    service = JobService(
+        job_repository=job_repository,
+        resume_repository=MagicMock(),
+        job_matching_service=MagicMock(),
+        embedding_service=MagicMock(),
+        vector_db=MagicMock(),
+        skill_extraction_service=MagicMock(),
+        ingest_service=MagicMock(),
+    )
+    fast_source = FakeJobSource("adzuna", {"python": [_raw_job("Backend Engineer")]})
+
+    fetched, saved, _ = service.refresh_plan(
+        job_sources=[fast_source, BlockingJobSource("remoteok", release)],
+        plan=[RefreshQuery(query="python")],
+        respect_schedule=False,
+        fetch_deadline_seconds=0.2,
+    )
+    release.set()
+
+    assert (fetched, saved) == (1, 1)
+
+
+class ThreadRecordingRepository:
+    """Proxy that records which thread each repository call came from."""
+
+    def __init__(self, repository: MagicMock):
+        self.repository = repository
+        self.threads: set[int] = set()
+
+    def __getattr__(self, name: str):
+        method = getattr(self.repository, name)
+
+        def call(*args, **kwargs):
+            self.threads.add(threading.get_ident())
+            return method(*args, **kwargs)
+
+        return call
+
+
+@pytest.mark.unit
+def test_refresh_plan_reads_watermarks_on_the_calling_thread() -> None:
+    job_repository = MagicMock()
+    job_repository.find_existing_dedup_hashes.return_value = set()
+    job_repository.bulk_save.side_effect = lambda jobs: jobs
+    refresh_state = MagicMock()
+    refresh_state.get_watermark.return_value = None
+    refresh_state.get_schedule.return_value = None
+    recorder = ThreadRecordingRepository(refresh_state)
+    fetch_threads: set[int] = set()
+
+    class RecordingSource(FakeJobSource):
+        def fetch_jobs(self, query="software engineer", location=None, limit=50, since=None):
+            fetch_threads.add(threading.get_ident())
+            return super().fetch_jobs(query, location, limit, since)
+
+    service = JobService(
+        job_repository=job_repository,
+        resume_repository=MagicMock(),
+        job_matching_service=MagicMock(),
+        embedding_service=MagicMock(),
+        vector_db=MagicMock(),
+        skill_extraction_service=MagicMock(),
+        ingest_service=MagicMock(),
+        refresh_state_repository=recorder,  # type: ignore[arg-type]
+    )
+    sources = [
+        RecordingSource(name, {"python": [_raw_job(f"{name} engineer")]})
+        for name in ("adzuna", "remoteok", "indeed", "greenhouse")
+    ]
+
+    service.refresh_plan(
+        job_sources=sources,
+        plan=[RefreshQuery(query="python"), RefreshQuery(query="backend", location="Toronto")],
+        respect_schedule=False,
+    )
+
+    assert refresh_state.get_watermark.call_count == 8
+    assert recorder.threads == {threading.get_ident()}
+    assert fetch_threads and threading.get_ident() not in fetch_threads
+
+
+@pytest.mark.unit
+def test_watermark_holds_when_a_source_fills_its_limit() -> None:
+    job_repository = MagicMock()
+    job_repository.find_existing_dedup_hashes.return_value = set()
+    job_repository.bulk_save.side_effect = lambda jobs: jobs
+    refresh_state = MagicMock()
+    refresh_state.get_watermark.return_value = None
+    refresh_state.get_schedule.return_value = None
+
+    service = JobService(
+        job_repository=job_repository,
+        resume_repository=MagicMock(),
+        job_matching_service=MagicMock(),
+        embedding_service=MagicMock(),
+        vector_db=MagicMock(),
+        skill_extraction_service=MagicMock(),
+        ingest_service=MagicMock(),
+        refresh_state_repository=refresh_state,
+    )
+    posted_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def posted(title: str, days: int) -> dict:
+        return {**_raw_job(title), "posted_at": posted_at + timedelta(days=days)}
+
+    full = FakeJobSource("adzuna", {"python": [posted("Backend", 1), posted("Data", 2)]})
+    partial = FakeJobSource("remoteok", {"python": [posted("Platform", 3)]})
+
+    service.refresh_plan(
+        job_sources=[full, partial],
+        plan=[RefreshQuery(query="python", limit=2)],
+        respect_schedule=False,
+    )
+
+    # INFO: adzuna may have more postings between the old watermark and its oldest result
+    refresh_state.save_watermark.assert_called_once_with(
+        "remoteok", "python", None, posted_at + timedelta(days=3)
+    )
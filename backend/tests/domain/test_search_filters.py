@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.adapters.lexical_index.bm25_index import BM25Index
+from app.adapters.search_cache.in_memory_search_cache import InMemorySearchResultCache
+from app.domain.model.job import Job, JobSearchFilters
+from app.domain.services.ingest_service import IngestService
+from app.domain.services.job_service import JobService
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def jobs(make_job: Callable[..., Job]) -> list[Job]:
+    python_job = dict(title="Python Engineer", description="Python services")
+    return [
+        make_job(
+            "1", location="London, UK", salary="$60,000 - $90,000", posted_at=NOW, **python_job
+        ),
+        make_job(
+            "2",
+            location="Remote",
+            source="remoteok",
+            salary="Up to $50,000",
+            posted_at=NOW,
+            **python_job,
+        ),
+        make_job(
+            "3",
+            location="Berlin",
+            seniority_level="Senior",
+            posted_at=NOW - timedelta(days=30),
+            **python_job,
+        ),
+    ]
+
+
+@pytest.mark.unit
+def test_vector_metadata_carries_filter_attributes(jobs: list[Job]) -> None:
+    service = IngestService(*(MagicMock() for _ in range(5)))
+
+    assert service._vector_metadata(jobs[0]) == {
+        "type": "job",
+        "job_id": "1",
+        "source": "adzuna",
+        "location_terms": ["london", "uk"],
+        "salary_max": 90000,
+        "posted_at": int(NOW.timestamp()),
+    }
+    assert service._vector_metadata(jobs[2])["seniority_level"] == "senior"
+    assert "salary_max" not in service._vector_metadata(jobs[2])
+
+
+@pytest.mark.unit
+def test_filters_are_pushed_down_and_skip_stored_rankings(
+    make_job_service: Callable[..., JobService],
+) -> None:
+    cache = InMemorySearchResultCache()
+    service = make_job_service(0, search_result_cache=cache, match_list_repository=MagicMock())
+    filters = JobSearchFilters(
+        location="London", min_salary=70000, sources=("adzuna",), posted_within_days=7
+    )
+
+    service.search_jobs("u1", top_k=10, filters=filters)
+
+    metadata_filter = service.vector_db.search_similar.call_args.kwargs["filter_metadata"]
+    assert metadata_filter["type"] == "job"
+    assert metadata_filter["location_terms"] == {"$in": ["london"]}
+    assert metadata_filter["salary_max"] == {"$gte": 70000}
+    assert metadata_filter["source"] == {"$in": ["adzuna"]}
+    assert metadata_filter["posted_at"]["$gte"] < int(NOW.timestamp())
+    service.match_list_repository.find_matches_for_user.assert_not_called()
+    assert cache.get_resume_id("u1") is None
+
+
+@pytest.mark.unit
+def test_lexical_search_applies_filter_masks(make_job: Callable[..., Job], jobs: list[Job]) -> None:
+    index = BM25Index()
+    fillers = [make_job(f"filler-{i}", title="Filler", description="filler") for i in range(9)]
+    index.index_jobs(jobs + fillers)
+
+    def search(**filters) -> list[str]:
+        return [job_id for job_id, _ in index.search("python", filters=JobSearchFilters(**filters))]
+
+    assert sorted(search()) == ["1", "2", "3"]
+    assert search(location="london") == ["1"]
+    assert search(sources=("remoteok",)) == ["2"]
+    assert search(min_salary=55000) == ["1"]
+    assert search(seniority_levels=("senior",)) == ["3"]
+    assert sorted(search(posted_within_days=7)) == ["1", "2"]
+    assert search(location="Paris") == []
+
+    # INFO: Re-indexed versions replace the old facets, including after compaction
+    for _ in range(3):
+        index.index_jobs(
+            [make_job("1", title="Python Engineer", location="Paris", posted_at=NOW)] * 400
+        )
+    assert search(location="london") == []
+    assert search(location="paris") == ["1"]
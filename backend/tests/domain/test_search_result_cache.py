@@ -0,0 +1,81 @@
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.adapters.search_cache.in_memory_search_cache import InMemorySearchResultCache
+from app.adapters.search_cache.redis_search_cache import RedisSearchResultCache
+from app.domain.model.search import RankedSearch
+from app.domain.services.job_service import JobService
+from app.domain.services.resume_service import ResumeService
+
+
+@pytest.mark.unit
+def test_repeat_search_is_a_cache_hit(make_job_service: Callable[..., JobService]) -> None:
+    service = make_job_service(search_result_cache=InMemorySearchResultCache())
+
+    first = service.search_jobs("u1", top_k=3)
+    second = service.search_jobs("u1", top_k=3)
+
+    assert [m.job.id for m in second.matches] == [m.job.id for m in first.matches]
+    assert service.vector_db.search_similar.call_count == 1
+    assert service.resume_repository.find_by_user_id.call_count == 1
+
+    service.search_jobs("u1", top_k=2)
+    assert service.vector_db.search_similar.call_count == 2
+
+
+@pytest.mark.unit
+def test_catalog_bump_and_resume_upload_invalidate(
+    make_job_service: Callable[..., JobService],
+) -> None:
+    cache = InMemorySearchResultCache()
+    service = make_job_service(search_result_cache=cache)
+
+    service.search_jobs("u1", top_k=3)
+    cache.bump_catalog_version()
+    service.search_jobs("u1", top_k=3)
+    assert service.vector_db.search_similar.call_count == 2
+
+    resume_service = ResumeService(
+        resume_repository=MagicMock(),
+        embedding_service=MagicMock(),
+        vector_db=MagicMock(),
+        storage_bucket="",
+        search_result_cache=cache,
+    )
+    resume_service._extract_text_from_pdf = lambda pdf_bytes: "Python developer " * 20
+    resume_service.process_resume_upload("u1", b"%PDF")
+
+    service.search_jobs("u1", top_k=3)
+    assert service.vector_db.search_similar.call_count == 3
+
+
+@pytest.mark.unit
+def test_redis_cache_round_trips_rankings() -> None:
+    store: dict[str, object] = {}
+
+    def incr(key: str) -> int:
+        store[key] = int(store.get(key, 0)) + 1
+        return store[key]
+
+    client = MagicMock()
+    client.get.side_effect = store.get
+    client.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+    client.incr.side_effect = incr
+    cache = RedisSearchResultCache(client=client)
+
+    ranked = RankedSearch(
+        user_id="u1",
+        resume_id="r1",
+        top_k=2,
+        job_ids=["a", "b"],
+        similarity_scores=[0.9, 0.8],
+        skill_match_scores=[1.0, 0.0],
+        scores=[0.93, 0.56],
+    )
+    cache.put(ranked, catalog_version=cache.catalog_version())
+
+    assert cache.get("r1", 2, 0) == ranked
+    assert cache.bump_catalog_version() == 1
+    assert cache.get("r1", 2, cache.catalog_version()) is None
@@ -0,0 +1,70 @@
+import pytest
+
+from app.domain.model.job import Job
+from app.domain.model.resume import Resume
+from app.domain.skills.dictionary import SKILLS, SkillEntry
+from app.domain.skills.extractor import SkillExtractor
+
+
+@pytest.mark.unit
+def test_ambiguous_short_names_only_match_exact_casing() -> None:
+    extractor = SkillExtractor(SKILLS)
+
+    skills = extractor.extract("Built services in Go and R. Let's go, we are ready to ship C.")
+
+    assert skills == ["go", "r", "c"]
+    assert extractor.extract("we go to r/programming and c the results") == []
+
+
+@pytest.mark.unit
+def test_matches_respect_word_boundaries() -> None:
+    extractor = SkillExtractor(SKILLS)
+
+    assert extractor.extract("Ten years of C++ and C#, some Java") == ["c++", "c#", "java"]
+    assert extractor.extract("javascript engineer, javanese speaker") == ["javascript"]
+
+
+@pytest.mark.unit
+def test_aliases_resolve_to_canonical_names() -> None:
+    extractor = SkillExtractor(SKILLS)
+
+    skills = extractor.extract("Deployed Node.js apps on K8s with Golang sidecars")
+
+    assert skills == ["node", "kubernetes", "go"]
+
+
+@pytest.mark.unit
+def test_overlapping_matches_prefer_the_longest() -> None:
+    extractor = SkillExtractor(SKILLS)
+
+    assert extractor.extract("React Native developer") == ["react native"]
+    assert extractor.extract("React Native and React web") == ["react native", "react"]
+
+
+@pytest.mark.unit
+def test_custom_entries_and_memoization() -> None:
+    extractor = SkillExtractor((SkillEntry("apache spark", "data", ("pyspark",)),))
+
+    first = extractor.extract("PySpark jobs")
+    first.append("mutated")
+
+    assert extractor.extract("PySpark jobs") == ["apache spark"]
+
+
+@pytest.mark.unit
+def test_resume_extracts_once_and_matches_job_aliases() -> None:
+    resume = Resume(id="r1", user_id="u1", text="Python and K8s", file_path="", pinecone_id="")
+    job = Job(
+        id="j1",
+        external_id="e1",
+        source="adzuna",
+        title="Platform Engineer",
+        company="Acme",
+        description="",
+        url="",
+        pinecone_id="",
+        required_skills=["Kubernetes", "Python3", "Terraform", "AWS"],
+    )
+
+    assert resume.extract_skills() == ["python", "kubernetes"]
+    assert resume.matches_job(job) == 0.5
@@ -0,0 +1,69 @@
+import random
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from app.domain.model.job import Job
+from app.domain.model.resume import Resume
+from app.domain.skills import vocabulary
+from app.domain.skills.dictionary import SKILLS
+from app.domain.skills.vocabulary import SkillVocabulary
+
+
+@pytest.mark.unit
+def test_bitset_scores_match_set_intersection(make_job: Callable[..., Job]) -> None:
+    rng = random.Random(7)
+    names = [entry.name for entry in SKILLS]
+    resume = Resume(
+        id="r1",
+        user_id="u1",
+        text=", ".join(rng.sample(names, 40)),
+        file_path="",
+        pinecone_id="",
+    )
+    jobs = [
+        make_job(str(i), required_skills=rng.sample(names, rng.randint(0, 12))) for i in range(300)
+    ]
+    jobs.append(make_job("none", required_skills=None))
+
+    vocab = SkillVocabulary()
+    scores = vocab.encode_many([job.required_skills for job in jobs]).match_scores(
+        vocab.encode(resume.extract_skills())
+    )
+
+    expected = np.array([resume.matches_job(job) for job in jobs], dtype=np.float32)
+    np.testing.assert_allclose(scores, expected, rtol=1e-6)
+
+
+@pytest.mark.unit
+def test_aliases_and_duplicates_share_one_bit() -> None:
+    vocab = SkillVocabulary()
+
+    matrix = vocab.encode_many([["Kubernetes", "k8s", "Python3"], ["terraform"]])
+
+    assert vocab.intern("K8s") == vocab.intern("kubernetes")
+    assert matrix.counts.tolist() == [2, 1]
+    assert matrix.match_scores(vocab.encode(["python"])).tolist() == [0.5, 0.0]
+
+
+@pytest.mark.unit
+def test_query_wider_than_matrix_after_vocabulary_growth() -> None:
+    vocab = SkillVocabulary()
+    matrix = vocab.encode_many([["python", "sql"]])
+
+    # INFO: Push the vocabulary past one 64-bit word
+    query = vocab.encode(["python"] + [f"skill-{i}" for i in range(100)])
+
+    assert query.shape[0] > matrix.bits.shape[1]
+    assert matrix.match_scores(query).tolist() == [0.5]
+
+
+@pytest.mark.unit
+def test_popcount_fallback_without_bitwise_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    words = np.array([[0, 1, 2**64 - 1, 0b1011]], dtype=np.uint64)
+    expected = np.bitwise_count(words)
+
+    monkeypatch.delattr(np, "bitwise_count")
+
+    np.testing.assert_array_equal(vocabulary._popcount(words), expected)
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.async_job_repository import AsyncSQLAlchemyJobRepository
+from app.adapters.repositories.async_resume_repository import AsyncSQLAlchemyResumeRepository
+from app.domain.model.job import Job, JobSummary
+from app.domain.model.resume import Resume
+from app.infrastructure.database.models import ResumeModel
+
+
+def _resume(resume_id: str, user_id: str, text: str) -> Resume:
+    return Resume(
+        id=resume_id,
+        user_id=user_id,
+        text=text,
+        file_path=f"s3://b/{resume_id}.pdf",
+        pinecone_id=f"resume-{user_id}",
+    )
+
+
+@pytest.mark.integration
+async def test_async_job_repository_round_trip(
+    test_async_db_session: AsyncSession, make_job: Callable[..., Job]
+) -> None:
+    repository = AsyncSQLAlchemyJobRepository(session=test_async_db_session)
+    now = datetime.now(timezone.utc)
+
+    saved = await repository.bulk_save(
+        [
+            make_job(
+                "a",
+                title="Backend Engineer",
+                description="Build services in Python",
+                fetched_at=now - timedelta(hours=1),
+                required_skills=["python"],
+            ),
+            make_job("b", title="Data Engineer", fetched_at=now),
+            # INFO: Same title, company and location as "a", a duplicate within the batch
+            make_job("a-again", title="Backend Engineer", fetched_at=now),
+        ]
+    )
+    duplicates = await repository.bulk_save(
+        [make_job("b-again", title="Data Engineer", fetched_at=now)]
+    )
+
+    assert [job.id for job in saved] == ["a", "b"]
+    assert duplicates == []
+    assert await repository.exists_by_dedup_hash(saved[0].dedup_hash())
+
+    assert [job.id for job in await repository.find_all()] == ["b", "a"]
+    assert [job.id for job in await repository.find_by_ids(["b", "missing", "a"])] == ["b", "a"]
+
+    summaries = await repository.find_summaries_by_ids(["a"])
+    assert type(summaries[0]) is JobSummary
+    assert summaries[0].required_skills == ["python"]
+    assert summaries[0].location is None
+
+    job = await repository.find_by_id("a")
+    assert job is not None and job.description == "Build services in Python"
+
+
+@pytest.mark.integration
+async def test_async_resume_repository_round_trip(
+    test_async_db_session: AsyncSession, default_user: str
+) -> None:
+    repository = AsyncSQLAlchemyResumeRepository(session=test_async_db_session)
+
+    await repository.save(_resume("resume-1", default_user, "Go and Kubernetes"))
+    await repository.save(_resume("resume-2", default_user, "Python and SQL " * 100))
+
+    latest = await repository.find_by_user_id(default_user)
+    summary = await repository.find_summary_by_user_id(default_user, preview_length=10)
+
+    assert latest is not None and latest.id == "resume-2"
+    assert summary is not None and summary.text_preview == "Python and"
+    assert await repository.delete("resume-2")
+    assert await repository.find_by_id("resume-2") is None
+    assert await repository.find_summary_by_user_id("nobody") is None
+
+
+@pytest.mark.integration
+def test_read_routes_await_async_repositories(
+    client: TestClient, test_db_session: Session, default_user: str
+) -> None:
+    headers = {"Authorization": "Bearer token"}
+
+    assert client.get("/api/resume", headers=headers).status_code == 404
+    assert client.get("/api/jobs/missing", headers=headers).status_code == 404
+    assert client.get("/api/jobs/missing/skills", headers=headers).status_code == 404
+
+    test_db_session.add(
+        ResumeModel(
+            id="resume-1",
+            user_id=default_user,
+            file_path="s3://b/r.pdf",
+            extracted_text="Python " * 200,
+            pinecone_id="resume-default-user",
+            uploaded_at=datetime(2026, 1, 2),
+        )
+    )
+    test_db_session.commit()
+
+    response = client.get("/api/resume", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == "resume-1"
+    assert len(response.json()["text_preview"]) == 500
+    assert response.json()["uploaded_at"].startswith("2026-01-02")
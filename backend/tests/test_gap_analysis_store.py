@@ -0,0 +1,192 @@
+from datetime import datetime, timezone
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.gap_analysis_repository import SQLAlchemyGapAnalysisRepository
+from app.api.dependencies import get_job_service
+from app.domain.model.job import Job
+from app.domain.model.resume import Resume
+from app.domain.ports.llm_port import GapAnalysisResult, SkillGap
+from app.domain.services.job_service import JobService
+from app.domain.services.skill_extraction_service import SkillExtractionService
+from app.infrastructure.database.models import JobModel, JobSource, ResumeModel
+from app.main import app
+
+
+def _seed(session: Session, user_id: str) -> tuple[Resume, Job]:
+    now = datetime.now(timezone.utc)
+    session.add(
+        ResumeModel(
+            id="resume-1",
+            user_id=user_id,
+            file_path="s3://b/r.pdf",
+            extracted_text="Python developer with Django and PostgreSQL experience",
+            pinecone_id="resume-default-user",
+            uploaded_at=now,
+        )
+    )
+    session.add(
+        JobModel(
+            id="job-1",
+            external_id="ext-1",
+            source=JobSource.REMOTEOK,
+            dedup_hash="hash-1",
+            title="Platform Engineer",
+            company="Acme",
+            description="Kubernetes and Go",
+            url="https://example.com",
+            fetched_at=now,
+            pinecone_id="job-1",
+        )
+    )
+    session.commit()
+
+    resume = Resume(
+        id="resume-1",
+        user_id=user_id,
+        text="Python developer with Django and PostgreSQL experience",
+        file_path="s3://b/r.pdf",
+        pinecone_id="resume-default-user",
+    )
+    job = Job(
+        id="job-1",
+        external_id="ext-1",
+        source="remoteok",
+        title="Platform Engineer",
+        company="Acme",
+        description="Kubernetes and Go",
+        url="https://example.com",
+        pinecone_id="job-1",
+        location=None,
+        salary=None,
+        fetched_at=now,
+        required_skills=["kubernetes", "go"],
+    )
+    return resume, job
+
+
+@pytest.mark.integration
+def test_gap_analysis_is_reused_until_invalidated(
+    test_db_session: Session, default_user: str
+) -> None:
+    resume, job = _seed(test_db_session, default_user)
+    repository = SQLAlchemyGapAnalysisRepository(session=test_db_session)
+    llm = MagicMock()
+    llm.analyze_gap.return_value = GapAnalysisResult(
+        matching_skills=[],
+        missing_skills=[SkillGap("kubernetes", "technical", "high", "Run a cluster")],
+        overall_match_score=0.1,
+        summary="Missing platform skills",
+        recommendations=["Learn Kubernetes"],
+    )
+    service = SkillExtractionService(llm_service=llm, gap_analysis_repository=repository)
+
+    first = service.analyze_gap(resume, job)
+    second = service.analyze_gap(resume, job)
+
+    assert llm.analyze_gap.call_count == 1
+    assert second == first
+
+    assert repository.delete_by_user_id(default_user) == 1
+    service.analyze_gap(resume, job)
+    assert llm.analyze_gap.call_count == 2
+
+
+@pytest.mark.integration
+def test_engine_and_llm_results_are_stored_under_separate_versions(
+    test_db_session: Session, default_user: str
+) -> None:
+    resume, job = _seed(test_db_session, default_user)
+    repository = SQLAlchemyGapAnalysisRepository(session=test_db_session)
+    engine = MagicMock()
+    engine.analyze.return_value = GapAnalysisResult(
+        matching_skills=[],
+        missing_skills=[SkillGap("go", "technical", "high", "")],
+        overall_match_score=0.0,
+        summary="",
+        recommendations=[],
+        narrated=False,
+    )
+    llm = MagicMock()
+    llm.analyze_gap.return_value = GapAnalysisResult(
+        matching_skills=[],
+        missing_skills=[],
+        overall_match_score=0.5,
+        summary="From the LLM",
+        recommendations=[],
+    )
+
+    engine_service = SkillExtractionService(
+        llm_service=llm, gap_analysis_repository=repository, gap_engine=engine
+    )
+    llm_service = SkillExtractionService(llm_service=llm, gap_analysis_repository=repository)
+
+    assert not engine_service.analyze_gap(resume, job).narrated
+    # INFO: Turning the engine off must not serve the engine's unnarrated result
+    assert llm_service.analyze_gap(resume, job).summary == "From the LLM"
+    assert engine_service.gap_analysis_version != llm_service.gap_analysis_version
+
+
+@pytest.mark.integration
+def test_narrative_is_claimed_once_per_lease(test_db_session: Session, default_user: str) -> None:
+    resume, job = _seed(test_db_session, default_user)
+    repository = SQLAlchemyGapAnalysisRepository(session=test_db_session)
+    engine = MagicMock()
+    engine.analyze.return_value = GapAnalysisResult(
+        matching_skills=["python"],
+        missing_skills=[],
+        overall_match_score=1.0,
+        summary="",
+        recommendations=[],
+        narrated=False,
+    )
+    service = SkillExtractionService(
+        llm_service=MagicMock(), gap_analysis_repository=repository, gap_engine=engine
+    )
+    service.analyze_gap(resume, job)
+
+    assert service.claim_narrative(resume, job)
+    assert not service.claim_narrative(resume, job)
+
+    # INFO: An expired claim, e.g. from a crashed worker, can be taken over
+    expired = SkillExtractionService(
+        llm_service=MagicMock(),
+        gap_analysis_repository=repository,
+        gap_engine=engine,
+        narrative_lease_seconds=-1,
+    )
+    assert expired.claim_narrative(resume, job)
+
+
+@pytest.mark.integration
+def test_gap_route_loads_resume_and_job_through_async_repositories(
+    client: TestClient,
+    test_db_session: Session,
+    default_user: str,
+    make_job_service: Callable[..., JobService],
+) -> None:
+    headers = {"Authorization": "Bearer token"}
+    service = make_job_service()
+    service.skill_extraction_service.analyze_gap.return_value = GapAnalysisResult(
+        matching_skills=["go"],
+        missing_skills=[],
+        overall_match_score=1.0,
+        summary="",
+        recommendations=[],
+    )
+    app.dependency_overrides[get_job_service] = lambda: service
+
+    assert client.get("/api/jobs/job-1/gap-analysis", headers=headers).status_code == 404
+
+    _seed(test_db_session, default_user)
+    response = client.get("/api/jobs/job-1/gap-analysis", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["job_title"] == "Platform Engineer"
+    resume, job = service.skill_extraction_service.analyze_gap.call_args.args
+    assert (resume.id, job.id) == ("resume-1", "job-1")
+    service.job_repository.find_by_id.assert_not_called()
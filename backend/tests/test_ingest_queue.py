@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.ingest_task_repository import SQLAlchemyIngestTaskRepository
+from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from app.domain.model.ingest import IngestStage, IngestTaskStatus
+from app.domain.model.job import Job
+from app.domain.services.ingest_service import IngestService
+from app.infrastructure.database.models import IngestTaskModel
+
+
+@pytest.mark.integration
+def test_claimed_tasks_are_not_claimed_twice(test_db_session: Session) -> None:
+    queue = SQLAlchemyIngestTaskRepository(session=test_db_session)
+    queue.enqueue(["job-a", "job-b"], IngestStage.EXTRACT)
+
+    first = queue.claim_batch(IngestStage.EXTRACT, limit=1, lease_seconds=600, max_attempts=5)
+    second = queue.claim_batch(IngestStage.EXTRACT, limit=10, lease_seconds=600, max_attempts=5)
+
+    assert len(first) == 1 and len(second) == 1
+    assert first[0].job_id != second[0].job_id
+    assert queue.claim_batch(IngestStage.EXTRACT, limit=10, lease_seconds=600, max_attempts=5) == []
+
+
+@pytest.mark.integration
+def test_expired_lease_is_reclaimed(test_db_session: Session) -> None:
+    queue = SQLAlchemyIngestTaskRepository(session=test_db_session)
+    queue.enqueue(["job-a"], IngestStage.EMBED)
+    queue.claim_batch(IngestStage.EMBED, limit=1, lease_seconds=600, max_attempts=5)
+
+    reclaimed = queue.claim_batch(IngestStage.EMBED, limit=1, lease_seconds=-1, max_attempts=5)
+
+    assert len(reclaimed) == 1
+    assert reclaimed[0].attempts == 2
+
+
+@pytest.mark.integration
+def test_expired_lease_on_the_last_attempt_fails_the_task(test_db_session: Session) -> None:
+    queue = SQLAlchemyIngestTaskRepository(session=test_db_session)
+    queue.enqueue(["job-a"], IngestStage.EMBED)
+    queue.claim_batch(IngestStage.EMBED, limit=1, lease_seconds=600, max_attempts=2)
+    queue.claim_batch(IngestStage.EMBED, limit=1, lease_seconds=-1, max_attempts=2)
+
+    assert queue.claim_batch(IngestStage.EMBED, limit=1, lease_seconds=-1, max_attempts=2) == []
+
+    model = test_db_session.query(IngestTaskModel).one()
+    test_db_session.refresh(model)
+    assert model.status == IngestTaskStatus.FAILED.value
+    assert model.locked_at is None
+
+
+@pytest.mark.integration
+def test_advance_completes_and_enqueues_in_one_transaction(test_db_session: Session) -> None:
+    queue = SQLAlchemyIngestTaskRepository(session=test_db_session)
+    queue.enqueue(["job-a"], IngestStage.EXTRACT)
+    (task,) = queue.claim_batch(IngestStage.EXTRACT, limit=1, lease_seconds=600, max_attempts=5)
+
+    with (
+        patch.object(test_db_session, "commit", side_effect=RuntimeError("connection lost")),
+        pytest.raises(RuntimeError),
+    ):
+        queue.advance([task.id], ["job-a"], IngestStage.EMBED)
+    test_db_session.rollback()
+
+    # INFO: Neither half landed, the lease expires and the extraction is retried
+    assert test_db_session.query(IngestTaskModel).one().status == IngestTaskStatus.RUNNING.value
+
+    queue.advance([task.id], ["job-a"], IngestStage.EMBED)
+
+    statuses = dict(test_db_session.query(IngestTaskModel.stage, IngestTaskModel.status).all())
+    assert statuses == {
+        IngestStage.EXTRACT.value: IngestTaskStatus.DONE.value,
+        IngestStage.EMBED.value: IngestTaskStatus.PENDING.value,
+    }
+
+
+@pytest.mark.integration
+def test_drain_retries_failed_extraction_then_embeds(
+    test_db_session: Session, make_job: Callable[..., Job]
+) -> None:
+    job_repo = SQLAlchemyJobRepository(session=test_db_session)
+    queue = SQLAlchemyIngestTaskRepository(session=test_db_session)
+    job = make_job("job-backend", description="Backend building distributed systems in Python")
+    job_repo.bulk_save([job])
+
+    skill_extraction_service = MagicMock()
+    skill_extraction_service.update_job_with_skills.side_effect = [RuntimeError("llm down"), None]
+    embedding_service = MagicMock()
+    embedding_service.generate_embeddings_batch.side_effect = lambda texts: [[0.1] * 3] * len(texts)
+    vector_db = MagicMock()
+
+    service = IngestService(
+        task_repository=queue,
+        job_repository=job_repo,
+        skill_extraction_service=skill_extraction_service,
+        embedding_service=embedding_service,
+        vector_db=vector_db,
+        base_backoff_seconds=0,
+    )
+    service.enqueue_jobs([job])
+
+    service.drain()
+    assert vector_db.upsert_embedding.call_count == 1
+    assert skill_extraction_service.update_job_with_skills.call_count == 2
+    assert queue.claim_batch(IngestStage.EXTRACT, 10, 600, 5) == []
+
+
+@pytest.mark.integration
+def test_retry_respects_backoff(test_db_session: Session) -> None:
+    queue = SQLAlchemyIngestTaskRepository(session=test_db_session)
+    queue.enqueue(["job-a"], IngestStage.UPSERT)
+    (task,) = queue.claim_batch(IngestStage.UPSERT, limit=1, lease_seconds=600, max_attempts=5)
+
+    queue.retry(task.id, "boom", datetime.now(timezone.utc) + timedelta(hours=1))
+
+    assert queue.claim_batch(IngestStage.UPSERT, limit=1, lease_seconds=600, max_attempts=5) == []
@@ -0,0 +1,141 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Generator
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.adapters.session_store.cached_session_store import CachedSessionStore
+from app.domain.model.interview import InterviewSession
+from app.domain.ports.interview_session_store_port import SessionConflictError
+from app.infrastructure.database.models import InterviewSessionModel
+
+
+def _interview(session_id: str = "interview-1") -> InterviewSession:
+    return InterviewSession(
+        id=session_id,
+        user_id="default-user",
+        job_id="job-1",
+        state={"status": "in_progress", "questions": [{"text": "Why Python?"}], "answers": []},
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def make_store(test_db_engine) -> Callable[[], CachedSessionStore]:
+    session_local = sessionmaker(bind=test_db_engine, expire_on_commit=False)
+
+    @contextmanager
+    def session_factory() -> Generator[Session, None, None]:
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def make() -> CachedSessionStore:
+        return CachedSessionStore(session_factory)
+
+    return make
+
+
+@pytest.fixture
+def store(make_store: Callable[[], CachedSessionStore]) -> CachedSessionStore:
+    return make_store()
+
+
+@pytest.mark.integration
+def test_new_sessions_are_written_through(
+    make_store: Callable[[], CachedSessionStore], test_db_session: Session
+) -> None:
+    interview = _interview()
+    make_store().put(interview)
+
+    model = test_db_session.query(InterviewSessionModel).one()
+    assert model.version == 1
+    assert interview.version == 1
+
+    # INFO: Another worker can answer right after the session was created
+    loaded = make_store().get("interview-1")
+    assert loaded is not None
+    assert loaded.current_question == {"text": "Why Python?"}
+
+
+@pytest.mark.integration
+def test_updates_are_written_before_put_returns(
+    store: CachedSessionStore, test_db_session: Session
+) -> None:
+    interview = _interview()
+    store.put(interview)
+
+    interview.state["answers"].append({"text": "It is readable"})
+    store.put(interview)
+
+    model = test_db_session.query(InterviewSessionModel).one()
+    assert model.conversation_history["answers"] == [{"text": "It is readable"}]
+    assert model.version == 2
+    assert interview.version == 2
+    assert store.get("missing") is None
+
+
+@pytest.mark.integration
+def test_cached_reads_pick_up_writes_from_other_workers(
+    make_store: Callable[[], CachedSessionStore],
+) -> None:
+    first, second = make_store(), make_store()
+    first.put(_interview())
+    assert second.get("interview-1") is not None
+
+    interview = first.get("interview-1")
+    interview.state["answers"].append({"text": "It is readable"})
+    first.put(interview)
+
+    loaded = second.get("interview-1")
+
+    assert loaded is not None
+    assert loaded.state["answers"] == [{"text": "It is readable"}]
+    assert loaded.version == 2
+
+
+@pytest.mark.integration
+def test_stale_put_raises_and_keeps_the_newer_row(
+    make_store: Callable[[], CachedSessionStore], test_db_session: Session
+) -> None:
+    first, second = make_store(), make_store()
+    first.put(_interview())
+
+    ahead = first.get("interview-1")
+    stale = second.get("interview-1")
+    ahead.state["answers"].append({"text": "From the first worker"})
+    stale.state["answers"].append({"text": "From the second worker"})
+
+    first.put(ahead)
+    # INFO: The second worker learns of the lost turn before it answers its request
+    with pytest.raises(SessionConflictError):
+        second.put(stale)
+
+    model = test_db_session.query(InterviewSessionModel).one()
+    assert model.conversation_history["answers"] == [{"text": "From the first worker"}]
+    assert model.version == 2
+    assert second.get("interview-1").state["answers"] == [{"text": "From the first worker"}]
+
+
+@pytest.mark.integration
+def test_consecutive_puts_keep_versions_in_step(
+    store: CachedSessionStore, test_db_session: Session
+) -> None:
+    interview = _interview()
+    store.put(interview)
+
+    for answer in ("one", "two", "three"):
+        interview = store.get("interview-1")
+        interview.state["answers"].append({"text": answer})
+        store.put(interview)
+
+    model = test_db_session.query(InterviewSessionModel).one()
+    assert [answer["text"] for answer in model.conversation_history["answers"]] == [
+        "one",
+        "two",
+        "three",
+    ]
+    assert model.version == 4
@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from typing import Callable, Generator
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.adapters.lexical_index.synced_index import (
+    SyncedLexicalIndex,
+    create_synced_lexical_index,
+)
+from app.adapters.repositories.indexed_job_repository import IndexedJobRepository
+from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from app.adapters.search_cache.in_memory_search_cache import InMemorySearchResultCache
+from app.domain.model.job import Job
+
+
+@pytest.fixture
+def session_factory(test_db_engine) -> Callable[[], Generator[Session, None, None]]:
+    session_local = sessionmaker(bind=test_db_engine, expire_on_commit=False)
+
+    @contextmanager
+    def factory() -> Generator[Session, None, None]:
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return factory
+
+
+def _ids(index: SyncedLexicalIndex, text: str) -> set[str]:
+    return {job_id for job_id, _ in index.search(text)}
+
+
+@pytest.mark.integration
+def test_catalog_version_bump_catches_other_workers_up(
+    session_factory, make_job: Callable[..., Job]
+) -> None:
+    # INFO: One cache stands in for the redis catalog version every worker shares
+    cache = InMemorySearchResultCache()
+    with session_factory() as db:
+        SQLAlchemyJobRepository(session=db).bulk_save([make_job("a", title="Python Engineer")])
+
+    api_worker = create_synced_lexical_index(
+        session_factory, ttl_seconds=3600, catalog_version=cache.catalog_version
+    )
+    ingest_worker = create_synced_lexical_index(
+        session_factory, ttl_seconds=3600, catalog_version=cache.catalog_version
+    )
+
+    with session_factory() as db:
+        repository = IndexedJobRepository(SQLAlchemyJobRepository(session=db), ingest_worker)
+        repository.bulk_save([make_job("b", title="Rust Engineer")])
+
+    assert _ids(ingest_worker, "rust") == {"b"}
+    assert _ids(api_worker, "rust") == set()
+
+    cache.bump_catalog_version()
+
+    assert _ids(api_worker, "rust") == {"b"}
+    assert _ids(api_worker, "python") == {"a"}
+    assert len(api_worker) == 2
+
+
+@pytest.mark.integration
+def test_ttl_expiry_picks_up_updated_jobs(session_factory, make_job: Callable[..., Job]) -> None:
+    with session_factory() as db:
+        SQLAlchemyJobRepository(session=db).bulk_save([make_job("a", title="Backend Engineer")])
+
+    index = create_synced_lexical_index(session_factory, ttl_seconds=0)
+
+    with session_factory() as db:
+        SQLAlchemyJobRepository(session=db).save(
+            make_job("a", title="Backend Engineer", required_skills=["kubernetes"])
+        )
+
+    assert _ids(index, "kubernetes") == {"a"}
+    assert len(index) == 1
+
+
+@pytest.mark.integration
+def test_failed_catch_up_keeps_serving_the_index(
+    session_factory, make_job: Callable[..., Job]
+) -> None:
+    index = create_synced_lexical_index(session_factory, ttl_seconds=0)
+    index.index_jobs([make_job("a", title="Go Engineer")])
+
+    @contextmanager
+    def broken_factory() -> Generator[Session, None, None]:
+        raise ConnectionError("database is down")
+        yield
+
+    index.session_factory = broken_factory
+
+    assert index.catch_up() == 0
+    assert _ids(index, "go") == {"a"}
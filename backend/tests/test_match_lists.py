@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.match_list_repository import SQLAlchemyMatchListRepository
+from app.adapters.repositories.resume_repository import SQLAlchemyResumeRepository
+from app.domain.model.job import Job, JobMatch
+from app.domain.model.resume import Resume
+from app.domain.services.job_service import JobService
+from app.domain.services.match_materializer import MatchMaterializer
+from app.infrastructure.database.models import ResumeModel
+
+
+def _resume(session: Session, user_id: str, resume_id: str, text: str) -> Resume:
+    session.add(
+        ResumeModel(
+            id=resume_id,
+            user_id=user_id,
+            file_path="s3://b/r.pdf",
+            extracted_text=text,
+            pinecone_id=f"resume-{user_id}",
+            uploaded_at=datetime.now(timezone.utc),
+        )
+    )
+    session.commit()
+    return Resume(id=resume_id, user_id=user_id, text=text, file_path="", pinecone_id="")
+
+
+@pytest.mark.integration
+def test_new_jobs_merge_into_top_n(
+    test_db_session: Session, default_user: str, make_job: Callable[..., Job]
+) -> None:
+    repository = SQLAlchemyMatchListRepository(session=test_db_session)
+    materializer = MatchMaterializer(repository=repository, top_n=2)
+
+    resume = _resume(test_db_session, default_user, "resume-1", "Python and SQL")
+    materializer.rebuild_for_resume(
+        resume,
+        [1.0, 0.0],
+        [
+            JobMatch(
+                job=make_job("old-a", required_skills=["python"]),
+                similarity_score=0.9,
+                skill_match_score=1.0,
+            ),
+            JobMatch(
+                job=make_job("old-b", required_skills=["java"]),
+                similarity_score=0.5,
+                skill_match_score=0.0,
+            ),
+        ],
+    )
+
+    merged = materializer.score_new_jobs(
+        [
+            make_job("new-good", required_skills=["python", "sql"]),
+            make_job("new-bad", required_skills=["java"]),
+        ],
+        [[1.0, 0.0], [0.0, 1.0]],
+    )
+
+    resume_id, matches = repository.find_matches_for_user(default_user, limit=10)
+    assert resume_id == "resume-1"
+    assert [match.job_id for match in matches] == ["new-good", "old-a"]
+    assert matches[0].score == pytest.approx(1.0)
+    assert merged == 1
+
+
+@pytest.mark.integration
+def test_new_resume_replaces_previous_list(
+    test_db_session: Session, default_user: str, make_job: Callable[..., Job]
+) -> None:
+    repository = SQLAlchemyMatchListRepository(session=test_db_session)
+    materializer = MatchMaterializer(repository=repository)
+    match = JobMatch(
+        job=make_job("job-1", required_skills=[]), similarity_score=0.8, skill_match_score=0.0
+    )
+
+    first = _resume(test_db_session, default_user, "resume-1", "Python")
+    materializer.rebuild_for_resume(first, [1.0, 0.0], [match])
+    second = _resume(test_db_session, default_user, "resume-2", "Go")
+    materializer.rebuild_for_resume(second, [0.0, 1.0], [])
+
+    assert repository.find_matches_for_user(default_user, limit=10) is None
+    assert [vector.resume_id for vector in repository.find_resume_vectors()] == ["resume-2"]
+
+
+@pytest.mark.integration
+def test_search_reads_materialized_list(
+    test_db_session: Session,
+    default_user: str,
+    make_job: Callable[..., Job],
+    make_job_service: Callable[..., JobService],
+) -> None:
+    repository = SQLAlchemyMatchListRepository(session=test_db_session)
+    materializer = MatchMaterializer(repository=repository)
+    jobs = {job_id: make_job(job_id, required_skills=["python"]) for job_id in ("a", "b")}
+
+    resume = _resume(test_db_session, default_user, "resume-1", "Python")
+    materializer.rebuild_for_resume(
+        resume,
+        [1.0],
+        [
+            JobMatch(job=jobs["b"], similarity_score=0.9, skill_match_score=1.0),
+            JobMatch(job=jobs["a"], similarity_score=0.4, skill_match_score=1.0),
+        ],
+    )
+
+    service = make_job_service(
+        match_list_repository=repository,
+        resume_repository=SQLAlchemyResumeRepository(session=test_db_session),
+    )
+    service.job_repository.find_summaries_by_ids.side_effect = lambda ids: [jobs[i] for i in ids]
+
+    page = service.search_jobs(default_user, top_k=10)
+
+    assert [match.job.id for match in page.matches] == ["b", "a"]
+    assert page.resume_id == "resume-1"
+    service.vector_db.search_similar.assert_not_called()
+
+
+@pytest.mark.integration
+def test_new_resume_skips_the_list_of_the_previous_one(
+    test_db_session: Session,
+    default_user: str,
+    make_job: Callable[..., Job],
+    make_job_service: Callable[..., JobService],
+) -> None:
+    repository = SQLAlchemyMatchListRepository(session=test_db_session)
+    materializer = MatchMaterializer(repository=repository)
+    first = _resume(test_db_session, default_user, "resume-1", "Python")
+    materializer.rebuild_for_resume(
+        first,
+        [1.0],
+        [JobMatch(job=make_job("stale"), similarity_score=0.9, skill_match_score=1.0)],
+    )
+
+    failing = MagicMock()
+    failing.top_n = 10
+    failing.rebuild_for_resume.side_effect = RuntimeError("vector store down")
+    service = make_job_service(
+        2,
+        match_list_repository=repository,
+        match_materializer=failing,
+        resume_repository=SQLAlchemyResumeRepository(session=test_db_session),
+    )
+
+    _resume(test_db_session, default_user, "resume-2", "Python")
+    service.materialize_matches(default_user)
+    page = service.search_jobs(default_user, top_k=10)
+
+    failing.rebuild_for_resume.assert_called_once()
+    assert page.resume_id == "resume-2"
+    assert [match.job.id for match in page.matches] == ["0", "1"]
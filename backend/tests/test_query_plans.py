@@ -0,0 +1,172 @@
+import json
+import os
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from alembic import command
+from app.adapters.repositories.gap_analysis_repository import SQLAlchemyGapAnalysisRepository
+from app.adapters.repositories.ingest_task_repository import SQLAlchemyIngestTaskRepository
+from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from app.adapters.repositories.match_list_repository import SQLAlchemyMatchListRepository
+from app.adapters.repositories.question_bank_repository import SQLAlchemyQuestionBankRepository
+from app.adapters.repositories.resume_repository import SQLAlchemyResumeRepository
+from app.domain.model.ingest import IngestStage
+
+# INFO: Plans need a real Postgres, point this at a throwaway database to run them
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set"),
+]
+
+_EXPLAINED = ("SELECT", "UPDATE", "DELETE")
+
+
+@pytest.fixture(scope="module")
+def postgres_engine() -> Generator[Engine, None, None]:
+    # INFO: With sequential scans disabled the planner picks any usable index,
+    # so a Seq Scan left in a plan means no index serves the query at all
+    engine = create_engine(
+        TEST_POSTGRES_URL,  # type: ignore[arg-type]
+        connect_args={"options": "-c enable_seqscan=off"},
+    )
+    config = Config(str(Path(__file__).parents[1] / "alembic.ini"))
+
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+    yield engine
+
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, "base")
+    engine.dispose()
+
+
+@pytest.fixture
+def postgres_session(postgres_engine: Engine) -> Generator[Session, None, None]:
+    session = sessionmaker(bind=postgres_engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@contextmanager
+def captured_statements(engine: Engine) -> Generator[list[tuple[str, Any]], None, None]:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not executemany and statement.lstrip().upper().startswith(_EXPLAINED):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def sequential_scans(engine: Engine, statement: str, parameters: Any) -> list[str]:
+    """Relations read by a Seq Scan anywhere in the statement's plan."""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = cursor.fetchone()[0]
+    finally:
+        connection.close()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scans = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            scans.append(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return scans
+
+
+def _question_bank(session: Session) -> SQLAlchemyQuestionBankRepository:
+    @contextmanager
+    def session_factory() -> Generator[Session, None, None]:
+        yield session
+
+    return SQLAlchemyQuestionBankRepository(session_factory=session_factory)
+
+
+ACCESS_PATHS: dict[str, Callable[[Session], Any]] = {
+    "resume_by_user": lambda s: SQLAlchemyResumeRepository(s).find_by_user_id("user-1"),
+    "resume_by_id": lambda s: SQLAlchemyResumeRepository(s).find_by_id("resume-1"),
+    "resume_summary_by_user": lambda s: SQLAlchemyResumeRepository(s).find_summary_by_user_id(
+        "user-1"
+    ),
+    "jobs_page": lambda s: SQLAlchemyJobRepository(s).find_all(limit=50, offset=100),
+    "jobs_by_ids": lambda s: SQLAlchemyJobRepository(s).find_by_ids(["job-1", "job-2"]),
+    "job_summaries_by_ids": lambda s: SQLAlchemyJobRepository(s).find_summaries_by_ids(
+        ["job-1", "job-2"]
+    ),
+    "jobs_updated_after": lambda s: SQLAlchemyJobRepository(s).find_updated_after(
+        datetime.now(timezone.utc)
+    ),
+    "job_by_dedup_hash": lambda s: SQLAlchemyJobRepository(s).exists_by_dedup_hash("hash"),
+    "existing_dedup_hashes": lambda s: SQLAlchemyJobRepository(s).find_existing_dedup_hashes(
+        ["a", "b"]
+    ),
+    "ingest_claim": lambda s: SQLAlchemyIngestTaskRepository(s).claim_batch(
+        IngestStage.EXTRACT, limit=10, lease_seconds=60, max_attempts=5
+    ),
+    "gap_analysis": lambda s: SQLAlchemyGapAnalysisRepository(s).find("resume-1", "job-1", "v1"),
+    "gap_analyses_by_user": lambda s: SQLAlchemyGapAnalysisRepository(s).delete_by_user_id(
+        "user-1"
+    ),
+    "question_bank_topic": lambda s: _question_bank(s).find_by_topic("python", "easy", 5),
+    "resume_vector_delta": lambda s: SQLAlchemyMatchListRepository(s).find_resume_vectors(
+        updated_after=datetime.now(timezone.utc)
+    ),
+    "match_list_for_user": lambda s: SQLAlchemyMatchListRepository(s).find_matches_for_user(
+        "user-1", limit=20
+    ),
+    "match_list_replace": lambda s: SQLAlchemyMatchListRepository(s).replace_matches(
+        "user-1", "resume-1", []
+    ),
+    "match_score_floors": lambda s: SQLAlchemyMatchListRepository(s).find_score_floors(
+        ["resume-1"], top_n=50
+    ),
+}
+
+
+@pytest.mark.parametrize("access_path", ACCESS_PATHS)
+def test_repository_queries_avoid_sequential_scans(
+    postgres_engine: Engine, postgres_session: Session, access_path: str
+) -> None:
+    with captured_statements(postgres_engine) as statements:
+        ACCESS_PATHS[access_path](postgres_session)
+
+    assert statements, f"{access_path} issued no queries"
+    for statement, parameters in statements:
+        scans = sequential_scans(postgres_engine, statement, parameters)
+        assert not scans, f"{access_path} scans {scans} sequentially:\n{statement}"
+
+
+def test_skill_containment_uses_gin_index(postgres_engine: Engine) -> None:
+    with postgres_engine.connect() as connection:
+        plan = connection.execute(
+            text("EXPLAIN SELECT id FROM jobs WHERE extracted_skills @> CAST(:skills AS jsonb)"),
+            {"skills": '{"required": ["python"]}'},
+        ).scalars()
+
+        assert any("ix_jobs_extracted_skills" in line for line in plan)
@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.adapters.repositories.question_bank_repository import SQLAlchemyQuestionBankRepository
+from app.domain.model.question_bank import BankedQuestion
+from app.domain.services.question_bank_service import QuestionBankService
+
+
+@pytest.fixture
+def repository(test_db_engine) -> SQLAlchemyQuestionBankRepository:
+    session_local = sessionmaker(bind=test_db_engine, expire_on_commit=False)
+
+    @contextmanager
+    def session_factory() -> Generator[Session, None, None]:
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return SQLAlchemyQuestionBankRepository(session_factory=session_factory)
+
+
+def _bank(repository: SQLAlchemyQuestionBankRepository) -> QuestionBankService:
+    embedding_service = MagicMock()
+    embedding_service.generate_embedding.side_effect = lambda title: (
+        [1.0, 0.0] if "engineer" in title else [0.0, 1.0]
+    )
+    return QuestionBankService(
+        repository=repository,
+        llm_service=MagicMock(),
+        embedding_service=embedding_service,
+        min_stock=0,
+    )
+
+
+@pytest.mark.integration
+def test_draw_serves_novel_question_for_matching_job_family(
+    repository: SQLAlchemyQuestionBankRepository,
+) -> None:
+    repository.add(
+        BankedQuestion(
+            id="q1",
+            topic="kubernetes",
+            difficulty="medium",
+            text="How does a Kubernetes Deployment roll out a new ReplicaSet?",
+            job_family_embedding=[1.0, 0.0],
+        )
+    )
+    repository.add(
+        BankedQuestion(
+            id="q2",
+            topic="kubernetes",
+            difficulty="medium",
+            text="Explain how readiness probes affect Service endpoints.",
+            job_family_embedding=[1.0, 0.0],
+        )
+    )
+    bank = _bank(repository)
+
+    question = bank.draw(
+        topic="  Kubernetes ",
+        difficulty="medium",
+        job_title="Platform Engineer",
+        job_description="",
+        previous_questions=["How does a Kubernetes Deployment roll out a new ReplicaSet?"],
+    )
+    miss = bank.draw(
+        topic="kubernetes",
+        difficulty="medium",
+        job_title="Data Analyst",
+        job_description="",
+        previous_questions=[],
+    )
+    bank.close()
+
+    assert question == "Explain how readiness probes affect Service endpoints."
+    assert miss is None
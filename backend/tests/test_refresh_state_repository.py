@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.refresh_state_repository import SQLAlchemyRefreshStateRepository
+from app.infrastructure.database.models import SourceWatermarkModel
+
+
+@pytest.mark.integration
+def test_watermark_updated_at_is_stamped_per_write(test_db_session: Session) -> None:
+    repository = SQLAlchemyRefreshStateRepository(session=test_db_session)
+    posted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    before = datetime.now(timezone.utc).replace(tzinfo=None)
+    repository.save_watermark("adzuna", "python", None, posted_at)
+    model = test_db_session.get(SourceWatermarkModel, ("adzuna", "python", ""))
+    assert model is not None
+    created_at = model.updated_at
+
+    repository.save_watermark("adzuna", "python", None, posted_at + timedelta(days=1))
+    test_db_session.refresh(model)
+
+    # INFO: A default evaluated at import would predate the test
+    assert created_at >= before
+    assert model.updated_at > created_at
+    assert repository.get_watermark("adzuna", "python", None) == posted_at + timedelta(days=1)
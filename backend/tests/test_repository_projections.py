@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Callable
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.adapters.repositories.job_repository import SQLAlchemyJobRepository
+from app.adapters.repositories.resume_repository import SQLAlchemyResumeRepository
+from app.domain.model.job import Job, JobSummary
+from app.infrastructure.database.models import ResumeModel
+
+
+def _selects(session: Session) -> list[str]:
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+@pytest.mark.integration
+def test_job_summaries_skip_descriptions(
+    test_db_session: Session, make_job: Callable[..., Job]
+) -> None:
+    repository = SQLAlchemyJobRepository(session=test_db_session)
+    description = "x" * 10_000
+    repository.bulk_save(
+        [
+            make_job(
+                "a", description=description, required_skills=["python"], location="Berlin, DE"
+            ),
+            make_job("b", description=description),
+        ]
+    )
+    test_db_session.expunge_all()
+
+    statements = _selects(test_db_session)
+    summaries = repository.find_summaries_by_ids(["b", "missing", "a"])
+
+    assert [summary.id for summary in summaries] == ["b", "a"]
+    assert all(type(summary) is JobSummary for summary in summaries)
+    assert summaries[0].location is None and summaries[0].salary is None
+    assert summaries[1].location == "Berlin, DE"
+    assert summaries[1].required_skills == ["python"]
+    assert not any("description" in statement for statement in statements)
+
+
+@pytest.mark.integration
+def test_resume_summary_reads_preview_only(test_db_session: Session, default_user: str) -> None:
+    uploaded_at = datetime(2026, 1, 2, 3, 4, 5)
+    test_db_session.add(
+        ResumeModel(
+            id="resume-1",
+            user_id=default_user,
+            file_path="s3://b/r.pdf",
+            extracted_text="Python " * 1000,
+            pinecone_id="resume-default-user",
+            uploaded_at=uploaded_at,
+        )
+    )
+    test_db_session.commit()
+    repository = SQLAlchemyResumeRepository(session=test_db_session)
+
+    summary = repository.find_summary_by_user_id(default_user, preview_length=20)
+
+    assert summary is not None
+    assert summary.id == "resume-1"
+    assert summary.text_preview == ("Python " * 3)[:20]
+    assert summary.uploaded_at.replace(tzinfo=None) == uploaded_at
+    assert repository.find_summary_by_user_id("nobody") is None
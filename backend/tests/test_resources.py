@@ -0,0 +1,114 @@
+import pytest
+
+from app.infrastructure.resources import ResourceRegistry
+
+
+class _Resource:
+    def __init__(self, name: str, closed: list[str]) -> None:
+        self.name = name
+        self.closed = closed
+
+    def close(self) -> None:
+        self.closed.append(self.name)
+
+
+@pytest.mark.unit
+def test_resources_are_created_lazily_once() -> None:
+    registry = ResourceRegistry()
+    created: list[object] = []
+
+    def factory() -> object:
+        created.append(object())
+        return created[-1]
+
+    registry.register("model", factory=factory)
+
+    assert created == []
+    assert not registry.is_initialized("model")
+
+    first = registry.get("model")
+
+    assert registry.get("model") is first
+    assert created == [first]
+    assert registry.is_initialized("model")
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+@pytest.mark.unit
+def test_startup_initializes_only_eager_resources() -> None:
+    registry = ResourceRegistry()
+    registry.register("model", factory=object, eager=True)
+    registry.register("cache", factory=object)
+
+    registry.startup()
+
+    assert registry.is_initialized("model")
+    assert not registry.is_initialized("cache")
+
+
+@pytest.mark.unit
+def test_health_reports_each_resource() -> None:
+    registry = ResourceRegistry()
+    registry.register("healthy", factory=object, health_check=lambda _: True)
+    registry.register("unhealthy", factory=object, health_check=lambda _: False)
+    registry.register("failing", factory=object, health_check=lambda _: 1 / 0)
+    registry.register("unchecked", factory=object)
+    registry.register("idle", factory=object)
+
+    for name in ("healthy", "unhealthy", "failing", "unchecked"):
+        registry.get(name)
+
+    assert registry.health() == {
+        "healthy": "ok",
+        "unhealthy": "unhealthy",
+        "failing": "unhealthy",
+        "unchecked": "ok",
+        "idle": "not_initialized",
+    }
+
+
+@pytest.mark.unit
+def test_close_runs_in_reverse_initialization_order() -> None:
+    registry = ResourceRegistry()
+    closed: list[str] = []
+
+    def fail(resource: _Resource) -> None:
+        raise RuntimeError("close failed")
+
+    registry.register("embedding", factory=lambda: _Resource("embedding", closed), on_close=_close)
+    registry.register("broken", factory=lambda: _Resource("broken", closed), on_close=fail)
+    registry.register("bank", factory=lambda: _Resource("bank", closed), on_close=_close)
+    registry.register("unused", factory=lambda: _Resource("unused", closed), on_close=_close)
+
+    registry.get("embedding")
+    registry.get("broken")
+    registry.get("bank")
+    registry.close()
+
+    # INFO: A failing on_close does not stop the remaining resources from closing
+    assert closed == ["bank", "embedding"]
+    assert not registry.is_initialized("embedding")
+
+
+@pytest.mark.unit
+def test_resources_are_recreated_after_close() -> None:
+    registry = ResourceRegistry()
+    closed: list[str] = []
+    registry.register("llm", factory=lambda: _Resource("llm", closed), on_close=_close)
+
+    first = registry.get("llm")
+    registry.close()
+    second = registry.get("llm")
+
+    assert second is not first
+    assert closed == ["llm"]
+
+    registry.close()
+
+    assert closed == ["llm", "llm"]
+
+
+def _close(resource: _Resource) -> None:
+    resource.close()
@@ -0,0 +1,105 @@
+import threading
+from contextlib import contextmanager
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.infrastructure.database import locks
+from app.infrastructure.database.locks import advisory_lock
+from app.infrastructure.scheduler import scheduler
+
+
+def _postgres_engine(acquired: bool) -> tuple[MagicMock, MagicMock]:
+    conn = MagicMock()
+    conn.dialect.name = "postgresql"
+    conn.execute.return_value.scalar.return_value = acquired
+
+    @contextmanager
+    def connection():
+        yield conn
+
+    engine = MagicMock()
+    engine.connect.return_value.execution_options.side_effect = lambda **_: connection()
+    return engine, conn
+
+
+def _statements(conn: MagicMock) -> list[str]:
+    return [str(call.args[0]) for call in conn.execute.call_args_list]
+
+
+@pytest.fixture
+def no_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The refresh task always gets the lock, whatever database DATABASE_URL points at."""
+
+    @contextmanager
+    def acquired(key: int) -> Generator[bool, None, None]:
+        yield True
+
+    monkeypatch.setattr(scheduler, "advisory_lock", acquired)
+
+
+@pytest.mark.unit
+def test_advisory_lock_always_acquired_without_postgres(monkeypatch: pytest.MonkeyPatch) -> None:
+    # INFO: SQLite has no cross-process lock
+    monkeypatch.setattr(locks, "engine", create_engine("sqlite://"))
+
+    with advisory_lock(1) as first, advisory_lock(1) as second:
+        assert first and second
+
+
+@pytest.mark.unit
+def test_advisory_lock_released_when_block_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine, conn = _postgres_engine(acquired=True)
+    monkeypatch.setattr(locks, "engine", engine)
+
+    with pytest.raises(RuntimeError), advisory_lock(42) as acquired:
+        assert acquired
+        raise RuntimeError("refresh failed")
+
+    assert _statements(conn) == [
+        "SELECT pg_try_advisory_lock(:key)",
+        "SELECT pg_advisory_unlock(:key)",
+    ]
+
+
+@pytest.mark.unit
+def test_advisory_lock_not_released_when_not_acquired(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine, conn = _postgres_engine(acquired=False)
+    monkeypatch.setattr(locks, "engine", engine)
+
+    with advisory_lock(42) as acquired:
+        assert not acquired
+
+    assert _statements(conn) == ["SELECT pg_try_advisory_lock(:key)"]
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("no_lock")
+def test_watchdog_stops_a_refresh_that_overruns(monkeypatch: pytest.MonkeyPatch) -> None:
+    stopped: list[bool] = []
+
+    def run_refresh(stop_event: threading.Event) -> None:
+        stopped.append(stop_event.wait(timeout=5))
+
+    monkeypatch.setattr(settings, "JOB_REFRESH_MAX_RUNTIME_SECONDS", 0.05)
+    monkeypatch.setattr(scheduler, "_run_refresh", run_refresh)
+
+    scheduler.refresh_jobs_task()
+
+    assert stopped == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("no_lock")
+def test_watchdog_cancelled_when_refresh_finishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[threading.Event] = []
+
+    monkeypatch.setattr(settings, "JOB_REFRESH_MAX_RUNTIME_SECONDS", 0.05)
+    monkeypatch.setattr(scheduler, "_run_refresh", events.append)
+
+    scheduler.refresh_jobs_task()
+
+    assert not events[0].wait(timeout=0.2)